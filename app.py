@@ -5,11 +5,29 @@ Inspired by modern event planning UX patterns
 """
 
 import streamlit as st
-import json
 import os
+import queue
 from datetime import datetime
 import hashlib
 
+from planner.cache import ItineraryCache
+from planner.cards import CardCache, match_tier
+from planner.community_store import CommunityStore
+from planner.demand import CONGESTION_THRESHOLD, DemandModel, venue_capacities, visitors_per_day
+from planner.exhibitors import ExhibitorCatalog, exhibitors_from_event
+from planner.incremental import IncrementalScorer
+from planner.itinerary import rebase_itinerary
+from planner.metrics import REGISTRY as METRICS, fragment, timed
+from planner.profiles import GOALS, INTERESTS, PROFICIENCIES, interest_keywords
+from planner.reload import EventReloader
+from planner.search import SessionSearch
+from planner.popularity import PopularityCounter
+from planner.share_queue import ShareQueue
+from planner.similar import SimilarityIndex, schedule_features
+from planner.snapshot import snapshot_path
+from planner.speakers import SpeakerDirectory
+from planner.travel import travel_times
+
 # Page config - White theme
 st.set_page_config(
     page_title="AI Summit Planner | India AI Impact Summit 2026",
@@ -17,497 +35,182 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="collapsed"
 )
+METRICS.start_rerun()
 
-# Custom CSS for white theme and modern styling
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@300;400;500;600;700;800&display=swap');
-    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500&display=swap');
-
-    /* Global Styles */
-    .stApp {
-        background-color: #FFFFFF;
-        font-family: 'Plus Jakarta Sans', sans-serif;
-    }
-
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-
-    /* Main container */
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        max-width: 1200px;
-    }
-
-    /* Hero Section */
-    .hero-title {
-        font-size: 3.5rem;
-        font-weight: 800;
-        color: #1a1a1a;
-        line-height: 1.1;
-        margin-bottom: 0.5rem;
-        letter-spacing: -0.02em;
-    }
-
-    .hero-subtitle {
-        font-size: 1.25rem;
-        color: #5C5C5A;
-        font-weight: 400;
-        margin-bottom: 2rem;
-    }
+# Custom CSS for white theme and modern styling, served from static/ so browsers fetch it
+# once and cache it; each rerun only sends this one-line import
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "summit.css")
 
-    .hero-stats {
-        font-family: 'JetBrains Mono', monospace;
-        font-size: 1.1rem;
-        color: #1a1a1a;
-        background: #f8f9fa;
-        padding: 1rem 1.5rem;
-        border-radius: 12px;
-        display: inline-block;
-        margin-bottom: 2rem;
-    }
-
-    /* Stats Cards */
-    .stat-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 16px;
-        padding: 1.5rem;
-        text-align: center;
-        color: white;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
 
-    .stat-number {
-        font-size: 2.5rem;
-        font-weight: 800;
-        margin-bottom: 0.25rem;
-    }
-
-    .stat-label {
-        font-size: 0.9rem;
-        opacity: 0.9;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-
-    /* Progress Steps */
-    .progress-container {
-        display: flex;
-        justify-content: center;
-        gap: 2rem;
-        margin: 2rem 0;
-        padding: 1.5rem;
-        background: #f8f9fa;
-        border-radius: 16px;
-    }
-
-    .step {
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        color: #9ca3af;
-    }
-
-    .step.active {
-        color: #1a1a1a;
-    }
-
-    .step.completed {
-        color: #10b981;
-    }
-
-    .step-number {
-        width: 32px;
-        height: 32px;
-        border-radius: 50%;
-        background: #e5e7eb;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: 600;
-        font-size: 0.875rem;
-    }
-
-    .step.active .step-number {
-        background: #1a1a1a;
-        color: white;
-    }
-
-    .step.completed .step-number {
-        background: #10b981;
-        color: white;
-    }
-
-    /* Question Cards */
-    .question-card {
-        background: #ffffff;
-        border: 2px solid #e5e7eb;
-        border-radius: 16px;
-        padding: 2rem;
-        margin: 1.5rem 0;
-        transition: all 0.2s ease;
-    }
-
-    .question-card:hover {
-        border-color: #667eea;
-        box-shadow: 0 4px 20px rgba(102, 126, 234, 0.1);
-    }
-
-    .question-title {
-        font-size: 1.25rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.5rem;
-    }
-
-    .question-subtitle {
-        font-size: 0.95rem;
-        color: #6b7280;
-        margin-bottom: 1.5rem;
-    }
-
-    /* Option Pills */
-    .option-pill {
-        display: inline-block;
-        padding: 0.75rem 1.25rem;
-        margin: 0.25rem;
-        border: 2px solid #e5e7eb;
-        border-radius: 100px;
-        cursor: pointer;
-        transition: all 0.2s ease;
-        font-weight: 500;
-        color: #374151;
-    }
-
-    .option-pill:hover {
-        border-color: #667eea;
-        background: #f5f3ff;
-    }
-
-    .option-pill.selected {
-        border-color: #667eea;
-        background: #667eea;
-        color: white;
-    }
-
-    /* Session Cards */
-    .session-card {
-        background: #ffffff;
-        border: 1px solid #e5e7eb;
-        border-radius: 16px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        transition: all 0.2s ease;
-    }
+@st.cache_data
+def stylesheet_version(mtime_ns):
+    """Short content hash that busts browser caches when the stylesheet changes"""
+    with open(STYLESHEET_PATH, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
 
-    .session-card:hover {
-        box-shadow: 0 8px 30px rgba(0, 0, 0, 0.08);
-        transform: translateY(-2px);
-    }
 
-    .session-card.vip {
-        border: 2px solid #f59e0b;
-        background: linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%);
-    }
+st.markdown(
+    f'<style>@import url("app/static/summit.css?v={stylesheet_version(os.stat(STYLESHEET_PATH).st_mtime_ns)}");</style>',
+    unsafe_allow_html=True,
+)
 
-    .session-title {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.5rem;
-    }
 
-    .session-meta {
-        font-size: 0.875rem;
-        color: #6b7280;
-        display: flex;
-        gap: 1rem;
-        margin-bottom: 0.75rem;
-    }
+# Load event data: a JSON file, or a directory of per-day shards (python -m planner.shards)
+DATA_PATH = os.environ.get("PLANNER_EVENT_DATA") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "event_data.json"
+)
 
-    .session-description {
-        font-size: 0.95rem;
-        color: #4b5563;
-        line-height: 1.6;
-    }
 
-    /* Match Score Badge */
-    .match-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        padding: 0.5rem 1rem;
-        border-radius: 100px;
-        font-size: 0.875rem;
-        font-weight: 600;
-    }
+RELOAD_CHECK_SECONDS = 5
+# Compiled sessions kept in memory before least recently used days are evicted (sharded data only)
+RESIDENT_SESSIONS = int(os.environ.get("PLANNER_RESIDENT_SESSIONS", "0")) or None
 
-    .match-high {
-        background: #d1fae5;
-        color: #065f46;
-    }
 
-    .match-medium {
-        background: #fef3c7;
-        color: #92400e;
-    }
+@st.cache_resource
+def get_event_reloader():
+    """Watch the event data and hold its current compiled snapshot, shared by all sessions"""
+    return EventReloader(
+        DATA_PATH, interests=interest_keywords(), check_interval=RELOAD_CHECK_SECONDS,
+        max_resident_sessions=RESIDENT_SESSIONS, snapshot_path=snapshot_path(DATA_PATH),
+    )
 
-    .match-low {
-        background: #f3f4f6;
-        color: #4b5563;
-    }
 
-    /* VIP Badge */
-    .vip-badge {
-        background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
-        color: white;
-        padding: 0.25rem 0.75rem;
-        border-radius: 100px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
+SNAPSHOT = get_event_reloader().current()
+DATA_VERSION = SNAPSHOT.version
+EVENT_DATA = SNAPSHOT.data
 
-    /* Speaker Tags */
-    .speaker-tag {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        padding: 0.5rem 1rem;
-        background: #f3f4f6;
-        border-radius: 8px;
-        font-size: 0.875rem;
-        margin: 0.25rem;
-    }
+# Community data storage
+COMMUNITY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "community_itineraries.json")
+COMMUNITY_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "community_itineraries.db")
 
-    /* Topic Tags */
-    .topic-tag {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        background: #ede9fe;
-        color: #5b21b6;
-        border-radius: 100px;
-        font-size: 0.75rem;
-        font-weight: 500;
-        margin: 0.125rem;
-    }
 
-    /* Day Navigation */
-    .day-nav {
-        display: flex;
-        gap: 0.5rem;
-        margin-bottom: 2rem;
-        flex-wrap: wrap;
-    }
+@st.cache_resource
+def get_community_store():
+    """Open the shared SQLite store, importing the legacy JSON file on first use"""
+    return CommunityStore(COMMUNITY_DB, legacy_json_path=COMMUNITY_FILE)
 
-    .day-pill {
-        padding: 0.75rem 1.5rem;
-        border: 2px solid #e5e7eb;
-        border-radius: 100px;
-        cursor: pointer;
-        transition: all 0.2s ease;
-        font-weight: 500;
-    }
 
-    .day-pill:hover {
-        border-color: #667eea;
-    }
+# Shares are committed by a background writer in batches of up to SHARE_BATCH_SIZE,
+# gathered for SHARE_FLUSH_SECONDS; past SHARE_QUEUE_SIZE waiting, submitters are held back
+SHARE_BATCH_SIZE = 100
+SHARE_FLUSH_SECONDS = 0.05
+SHARE_QUEUE_SIZE = 1000
+SHARE_SUBMIT_TIMEOUT = 2.0
 
-    .day-pill.active {
-        background: #1a1a1a;
-        color: white;
-        border-color: #1a1a1a;
-    }
 
-    /* CTA Buttons */
-    .cta-primary {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem 2rem;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 1rem;
-        border: none;
-        cursor: pointer;
-        transition: all 0.2s ease;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
+@st.cache_resource
+def get_share_queue():
+    """Background writer for community shares, shared by all sessions"""
+    return ShareQueue(
+        get_community_store(), max_batch=SHARE_BATCH_SIZE, flush_interval=SHARE_FLUSH_SECONDS,
+        max_pending=SHARE_QUEUE_SIZE,
+    )
 
-    .cta-primary:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }
 
-    .cta-secondary {
-        background: white;
-        color: #1a1a1a;
-        padding: 1rem 2rem;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 1rem;
-        border: 2px solid #e5e7eb;
-        cursor: pointer;
-        transition: all 0.2s ease;
-    }
+@timed("load_community_data")
+def load_community_data(limit=None, proficiency=None):
+    # Pending shares are read first: one committed in between then shows up twice, not zero times
+    pending = [
+        entry for entry in get_share_queue().pending()
+        if not proficiency or entry.get("proficiency", "").lower() == proficiency.lower()
+    ]
+    stored = get_community_store().load(limit=limit, proficiency=proficiency)
+    stored_ids = {entry["id"] for entry in stored}
+    itineraries = sorted(
+        stored + [entry for entry in pending if entry["id"] not in stored_ids],
+        key=lambda entry: entry.get("shared_at", ""),
+    )
+    return {
+        "itineraries": itineraries[-limit:] if limit is not None else itineraries,
+        "comments": [],
+    }
+
+@timed("save_community_data")
+def save_community_data(data):
+    """Queue shares for the background writer; raises queue.Full when it is too far behind"""
+    for entry in data.get("itineraries", []):
+        get_share_queue().submit(entry, timeout=SHARE_SUBMIT_TIMEOUT)
+        get_similarity_index().add(entry)
+        get_popularity().add(entry)
+        # This attendee's plan is already in the demand model
+        get_demand_model().ignore(entry["id"])
 
-    .cta-secondary:hover {
-        border-color: #1a1a1a;
-    }
 
-    /* Feature Badge */
-    .feature-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        padding: 0.5rem 1rem;
-        background: #f0fdf4;
-        color: #166534;
-        border-radius: 100px;
-        font-size: 0.875rem;
-        font-weight: 500;
-        margin-bottom: 1rem;
-    }
+@st.cache_resource
+def get_similarity_index():
+    """LSH index over community shares, shared by all sessions and caught up from the store on use"""
+    return SimilarityIndex()
 
-    /* Expo Card */
-    .expo-card {
-        background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%);
-        border: 1px solid #e2e8f0;
-        border-radius: 16px;
-        padding: 1.5rem;
-        text-align: center;
-        transition: all 0.2s ease;
-    }
 
-    .expo-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 12px 40px rgba(0, 0, 0, 0.08);
-    }
+@st.cache_resource
+def get_popularity():
+    """Per-session share counts, rebuilt from the community store once per process"""
+    return PopularityCounter.from_store(get_community_store())
 
-    .expo-icon {
-        font-size: 2.5rem;
-        margin-bottom: 1rem;
-    }
 
-    .expo-title {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 0.5rem;
-    }
+def current_popularity():
+    """The popularity counter, caught up with shares other server processes have written"""
+    catch_up_community()
+    return get_popularity()
 
-    .expo-tags {
-        font-size: 0.8rem;
-        color: #6b7280;
-    }
 
-    /* Footer */
-    .footer {
-        text-align: center;
-        padding: 3rem 0;
-        margin-top: 4rem;
-        border-top: 1px solid #e5e7eb;
-        color: #9ca3af;
-        font-size: 0.875rem;
-    }
+@st.cache_resource
+def get_demand_model():
+    """Predicted attendance per session from every attendee's plan and every share, shared by all sessions"""
+    return DemandModel()
 
-    /* Streamlit overrides */
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        padding: 0.75rem 2rem;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 1rem;
-        transition: all 0.2s ease;
-    }
 
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }
+@st.cache_resource(max_entries=2)
+def load_venue_capacities(venues_version, event_version, schedule_version, _event_data, _catalog):
+    """Seats per venue and expected visitors per day"""
+    # Days are counted on the catalog: sharded data keeps the schedule out of the document
+    return venue_capacities(_event_data), visitors_per_day(_event_data, len(_catalog.days))
 
-    .stSelectbox > div > div {
-        border-radius: 12px;
-        border: 2px solid #e5e7eb;
-    }
 
-    .stMultiSelect > div > div {
-        border-radius: 12px;
-        border: 2px solid #e5e7eb;
-    }
+def current_demand():
+    """The demand model, caught up with other processes' shares and using the current venue capacities"""
+    model = get_demand_model()
+    versions = [SNAPSHOT.sections.get(key) for key in ("venues", "event", "daily_schedule")]
+    model.configure(*load_venue_capacities(*versions, EVENT_DATA, SNAPSHOT.catalog))
+    catch_up_community()
+    return model
 
-    .stRadio > div {
-        gap: 0.5rem;
-    }
 
-    .stCheckbox > label {
-        font-weight: 500;
-    }
+def catch_up_community():
+    """Feed shares that other server processes have written into every in-memory community index"""
+    get_community_store().catch_up((get_similarity_index(), get_popularity(), get_demand_model()))
 
-    div[data-testid="stExpander"] {
-        border: 1px solid #e5e7eb;
-        border-radius: 16px;
-        overflow: hidden;
-    }
 
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 0.5rem;
-        background: #f8f9fa;
-        padding: 0.5rem;
-        border-radius: 12px;
-    }
+def shared_session_ids(itinerary):
+    """Ids of every session in an itinerary by day, for counting how many attendees plan each"""
+    return {day: [s.id for s in itinerary.sessions(day)] for day in (itinerary.days if itinerary else {})}
 
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 8px;
-        padding: 0.75rem 1.5rem;
-        font-weight: 500;
-    }
 
-    .stTabs [aria-selected="true"] {
-        background: white;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
+def shared_sessions(itinerary):
+    """The part of an itinerary a community share keeps: the first three sessions of each day"""
+    return {
+        day: [{"title": s.title, "time": s.time} for s in itinerary.sessions(day)[:3]]
+        for day in (itinerary.days if itinerary else {})
     }
 
-    /* Progress bar */
-    .stProgress > div > div {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 100px;
-    }
-</style>
-""", unsafe_allow_html=True)
 
-
-# Load event data
-@st.cache_data
-def load_event_data():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_path = os.path.join(script_dir, "event_data.json")
-    with open(data_path, "r") as f:
-        return json.load(f)
-
-EVENT_DATA = load_event_data()
-
-# Community data storage
-COMMUNITY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "community_itineraries.json")
-
-def load_community_data():
-    if os.path.exists(COMMUNITY_FILE):
-        with open(COMMUNITY_FILE, "r") as f:
-            return json.load(f)
-    return {"itineraries": [], "comments": []}
-
-def save_community_data(data):
-    with open(COMMUNITY_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+@timed("similar_schedules")
+def similar_schedules(itinerary, interests, exclude=()):
+    """(similarity, entry) for the shared schedules closest to an itinerary and interests"""
+    catch_up_community()
+    index = get_similarity_index()
+    features = schedule_features(shared_sessions(itinerary), interests)
+    return index.query(features, k=SIMILAR_RESULTS, exclude=exclude)
 
 
 # Constants
+ITINERARY_CACHE_SIZE = 2048
+SPEAKERS_PER_PAGE = 20
+EXHIBITORS_PER_PAGE = 24
+SEARCH_RESULTS = 20
+SIMILAR_RESULTS = 5
+TRENDING_RESULTS = 5
+
 DAYS = ["2026-02-16", "2026-02-17", "2026-02-18", "2026-02-19", "2026-02-20"]
 DAY_INFO = {
     "2026-02-16": {"short": "Feb 16", "name": "Monday", "theme": "Expo Launch & Inauguration"},
@@ -528,28 +231,6 @@ ROLES = [
     "Consultant / Advisor",
 ]
 
-INTERESTS = {
-    "Generative AI & LLMs": ["genai", "llm", "foundation-models", "chatgpt"],
-    "AI Safety & Ethics": ["ai-safety", "alignment", "responsible-ai", "ethics"],
-    "Healthcare AI": ["healthcare", "diagnostics", "drug-discovery", "health-equity"],
-    "Enterprise AI": ["enterprise", "automation", "productivity", "business"],
-    "Policy & Governance": ["policy", "governance", "regulation", "law"],
-    "Research & Science": ["research", "academic", "papers", "science"],
-    "Startups & Innovation": ["startups", "entrepreneurship", "demos", "funding"],
-    "Education & Skills": ["education", "skills", "learning", "career"],
-    "Climate & Sustainability": ["climate", "sustainability", "energy", "environment"],
-    "Hardware & Infrastructure": ["computing", "hardware", "gpu", "infrastructure"],
-}
-
-GOALS = [
-    ("networking", "Maximize Networking Opportunities", "Meet industry leaders and peers"),
-    ("learning", "Deep Learning & Skill Building", "Attend technical sessions and workshops"),
-    ("business", "Business & Investment Insights", "Explore partnerships and funding"),
-    ("policy", "Policy & Governance Updates", "Understand regulatory landscape"),
-    ("inspiration", "Get Inspired by Innovators", "Hear from visionary speakers"),
-    ("demos", "See Cutting-Edge Demos", "Experience latest AI applications"),
-]
-
 EXPO_ICONS = {
     "Healthcare AI": "🏥",
     "AgriTech": "🌾",
@@ -564,105 +245,99 @@ EXPO_ICONS = {
 }
 
 
-def calculate_session_score(session, profile):
-    """Calculate relevance score with networking ROI"""
-    score = 0.0
-    networking_score = 0.0
-    learning_score = 0.0
-
-    # Level match
-    session_level = session.get("level", "all")
-    proficiency = profile.get("proficiency", "intermediate")
-
-    if session_level == "all":
-        score += 3.0
-    elif session_level == proficiency:
-        score += 5.0
-    elif proficiency == "intermediate":
-        score += 2.0
-    elif proficiency == "advanced" and session_level == "intermediate":
-        score += 3.0
-
-    # Topic match
-    session_topics = session.get("topics", [])
-    user_interests = profile.get("interests", [])
-
-    for topic in session_topics:
-        if topic in user_interests:
-            score += 4.0
-            learning_score += 2.0
-        for interest in user_interests:
-            if interest in topic or topic in interest:
-                score += 1.5
-                learning_score += 1.0
-
-    # Goal matching
-    session_desc = (session.get("description", "") + " " + session.get("title", "")).lower()
-    user_goals = profile.get("goals", [])
-
-    if "networking" in user_goals:
-        networking_keywords = ["networking", "leaders", "ceo", "roundtable", "connect", "meet"]
-        for kw in networking_keywords:
-            if kw in session_desc:
-                networking_score += 3.0
-                score += 2.0
-
-    if "learning" in user_goals:
-        learning_keywords = ["workshop", "tutorial", "deep-dive", "technical", "hands-on"]
-        for kw in learning_keywords:
-            if kw in session_desc:
-                learning_score += 2.0
-                score += 2.0
-
-    # Speaker bonus (networking potential)
-    if session.get("speakers"):
-        score += 1.5
-        networking_score += 2.0
-        top_speakers = ["sundar", "sam altman", "jensen", "demis", "yann", "dario"]
-        for speaker in session.get("speakers", []):
-            if any(name in speaker.lower() for name in top_speakers):
-                score += 5.0
-                networking_score += 5.0
-
-    # VIP session bonus
-    if session.get("level") == "advanced" and session.get("speakers"):
-        session["is_vip"] = True
-        score += 3.0
-
-    session["networking_roi"] = networking_score
-    session["learning_value"] = learning_score
-
-    return score
-
-
-def generate_itinerary(profile):
-    """Generate personalized itinerary with ROI scoring"""
-    available_days = profile.get("days", DAYS)
-    all_sessions = []
-
-    for day in available_days:
-        day_data = EVENT_DATA["daily_schedule"].get(day, {})
-        sessions = day_data.get("sessions", [])
-        for session in sessions:
-            session_copy = session.copy()
-            session_copy["date"] = day
-            session_copy["day_name"] = day_data.get("day", "")
-            session_copy["theme"] = day_data.get("theme", "")
-            session_copy["score"] = calculate_session_score(session_copy, profile)
-            all_sessions.append(session_copy)
-
-    # Sort by score
-    all_sessions.sort(key=lambda x: x["score"], reverse=True)
-
-    # Group by day
-    itinerary = {}
-    for day in available_days:
-        day_sessions = [s for s in all_sessions if s["date"] == day]
-        itinerary[day] = day_sessions[:5]
+@st.cache_resource
+def get_card_cache():
+    """Card HTML shared by all sessions; cards of changed entities are rebuilt on their next render"""
+    return CardCache()
+
+
+# Indexes are keyed by the fingerprint of the data section they are built from, so a
+# reload only rebuilds the ones whose section changed
+@st.cache_resource(max_entries=2)
+def load_session_search(schedule_version, _snapshot):
+    """BM25 session index shared by all sessions, prebuilt if the data came from a binary snapshot"""
+    search = _snapshot.indexes.get("search")
+    return search if search is not None else SessionSearch(_snapshot.catalog)
+
+
+@st.cache_resource(max_entries=2)
+def load_speaker_directory(speakers_version, _speakers):
+    """Speaker search index shared by all sessions"""
+    return SpeakerDirectory(_speakers)
+
+
+@st.cache_resource(max_entries=2)
+def load_exhibitor_catalog(expo_version, _event_data):
+    """Exhibitor facet indexes shared by all sessions"""
+    return ExhibitorCatalog(exhibitors_from_event(_event_data))
+
+
+@st.cache_resource
+def get_itinerary_cache():
+    """Itineraries shared across all sessions, keyed by the scoring-relevant profile fields"""
+    return ItineraryCache(maxsize=ITINERARY_CACHE_SIZE)
+
+
+@st.cache_resource(max_entries=2)
+def load_travel_times(venues_version, links_version, _event_data):
+    """All-pairs travel minutes between venues, shared by all sessions"""
+    return travel_times(_event_data)
 
+
+def current_travel():
+    """Travel times over the current data's venue graph"""
+    return load_travel_times(SNAPSHOT.sections.get("venues"), SNAPSHOT.sections.get("venue_links"), EVENT_DATA)
+
+
+def get_incremental_scorer():
+    """This attendee's incremental scorer, moved onto the current catalog and venue graph after a reload"""
+    travel = current_travel()
+    scorer = st.session_state.get("scorer")
+    if scorer is None:
+        scorer = st.session_state.scorer = IncrementalScorer(SNAPSHOT.catalog, travel=travel)
+    else:
+        if scorer.catalog is not SNAPSHOT.catalog:
+            scorer.rebase(SNAPSHOT.catalog)
+        if scorer.travel is not travel:
+            scorer.reroute(travel)
+    return scorer
+
+
+@timed("generate_itinerary")
+def generate_itinerary(profile, demand=None):
+    """Generate personalized itinerary, re-scoring only what changed since this attendee's last one"""
+    return get_incremental_scorer().update(profile, demand)
+
+
+def current_itinerary(profile):
+    """The itinerary for profile against the current data, keeping cached ones whose days are unchanged"""
+    if profile.get("avoid_crowds"):
+        # Picks depend on everyone else's plans, so these are never cached
+        return generate_itinerary(profile, current_demand())
+    catalog, travel = SNAPSHOT.catalog, current_travel()
+    return get_itinerary_cache().get_or_compute(
+        profile, DATA_VERSION, generate_itinerary, rebase=lambda itinerary: rebase_itinerary(itinerary, catalog, travel)
+    )
+
+
+def plan_itinerary(profile):
+    """This attendee's itinerary, counted in the demand model in place of their previous one"""
+    demand = current_demand()
+    # Taken out first, so an attendee avoiding crowds is not steered away from their own picks
+    demand.record(st.session_state.pop("planned_sessions", None), -1)
+    itinerary = current_itinerary(profile)
+    st.session_state.planned_sessions = shared_session_ids(itinerary)
+    demand.record(st.session_state.planned_sessions)
     return itinerary
 
 
+def replan():
+    """Widget callback: regenerate the itinerary after a scheduling option changed"""
+    st.session_state.profile["avoid_crowds"] = st.session_state.avoid_crowds
+    st.session_state.itinerary = plan_itinerary(st.session_state.profile)
+
+
+@timed("render_hero")
 def render_hero():
     """Render hero section"""
     st.markdown("""
@@ -675,6 +350,7 @@ def render_hero():
     """, unsafe_allow_html=True)
 
 
+@timed("render_stats")
 def render_stats():
     """Render stats cards"""
     col1, col2, col3, col4 = st.columns(4)
@@ -696,6 +372,7 @@ def render_stats():
             """, unsafe_allow_html=True)
 
 
+@timed("render_progress")
 def render_progress(step):
     """Render progress steps"""
     steps = [
@@ -716,6 +393,7 @@ def render_progress(step):
     """, unsafe_allow_html=True)
 
 
+@timed("render_questionnaire")
 def render_questionnaire():
     """Render the 9-question wizard"""
     if "wizard_step" not in st.session_state:
@@ -816,17 +494,21 @@ def render_questionnaire():
                 st.session_state.profile["goals"] = selected_goals if selected_goals else ["learning"]
                 st.session_state.profile["days"] = selected_days if selected_days else DAYS
                 st.session_state.wizard_step = 4
-                st.session_state.itinerary = generate_itinerary(st.session_state.profile)
+                st.session_state.itinerary = plan_itinerary(st.session_state.profile)
                 st.rerun()
 
     elif step == 4:
         render_itinerary_view()
 
 
+@st.fragment
+@fragment("render_itinerary_view")
 def render_itinerary_view():
     """Render the generated itinerary"""
     profile = st.session_state.profile
-    itinerary = st.session_state.get("itinerary", {})
+    itinerary = st.session_state.get("itinerary")
+    if itinerary is not None and itinerary.catalog is not SNAPSHOT.catalog:
+        itinerary = st.session_state.itinerary = plan_itinerary(profile)
 
     # Header
     st.markdown(f"""
@@ -847,10 +529,14 @@ def render_itinerary_view():
     with col3:
         st.metric("Days Attending", len(profile.get("days", [])))
 
+    st.toggle("🚶 Avoid crowded sessions", value=profile.get("avoid_crowds", False), key="avoid_crowds", on_change=replan,
+              help="Prefer a close alternative when a session is predicted to fill its venue")
+
     st.markdown("---")
 
     # Day tabs
     if profile.get("days"):
+        cards = get_card_cache()
         tabs = st.tabs([f"{DAY_INFO[day]['name']} ({DAY_INFO[day]['short']})" for day in profile["days"]])
 
         for tab, day in zip(tabs, profile["days"]):
@@ -862,54 +548,29 @@ def render_itinerary_view():
                 </div>
                 """, unsafe_allow_html=True)
 
-                sessions = itinerary.get(day, [])
+                sessions = itinerary.sessions(day) if itinerary else []
                 if not sessions:
                     st.info("No highly matched sessions for this day. Try broadening your interests!")
                     continue
 
-                for session in sessions:
-                    score = session.get("score", 0)
-                    is_vip = session.get("is_vip", False)
-                    networking_roi = session.get("networking_roi", 0)
-
-                    # Determine match level
-                    if score > 12:
-                        match_class = "match-high"
-                        match_text = "High Match"
-                    elif score > 6:
-                        match_class = "match-medium"
-                        match_text = "Good Match"
-                    else:
-                        match_class = "match-low"
-                        match_text = "Relevant"
-
-                    # Session card
-                    vip_class = "vip" if is_vip else ""
-                    vip_badge = '<span class="vip-badge">VIP Session</span>' if is_vip else ''
-
-                    with st.expander(f"**{session['title']}** | {session.get('time', 'TBA')}"):
-                        col1, col2 = st.columns([2, 1])
+                popularity = None
+                for position, session in enumerate(sessions):
+                    # Detail bodies are only built for the sessions the attendee has opened
+                    details = st.expander(f"**{session.title}** | {session.time}", key=f"details_{session.index}", on_change="rerun")
+                    if not details.open:
+                        continue
 
-                        with col1:
-                            st.markdown(f"**Description:** {session.get('description', 'N/A')}")
+                    score = float(itinerary.scores[session.index])
+                    networking_roi = float(itinerary.networking_roi[session.index])
 
-                            if session.get("speakers"):
-                                st.markdown("**Speakers:**")
-                                for speaker in session["speakers"][:3]:
-                                    st.markdown(f'<span class="speaker-tag">👤 {speaker}</span>', unsafe_allow_html=True)
+                    with details:
+                        col1, col2 = st.columns([2, 1])
 
-                            st.markdown("**Topics:**")
-                            topics_html = " ".join([f'<span class="topic-tag">{t}</span>' for t in session.get("topics", [])[:5]])
-                            st.markdown(topics_html, unsafe_allow_html=True)
+                        with col1:
+                            st.markdown(cards.session_details(session), unsafe_allow_html=True)
 
                         with col2:
-                            st.markdown(f'<span class="{match_class} match-badge">✓ {match_text}</span>', unsafe_allow_html=True)
-                            if is_vip:
-                                st.markdown('<span class="vip-badge">⭐ VIP</span>', unsafe_allow_html=True)
-
-                            st.markdown(f"**Level:** {session.get('level', 'all').title()}")
-                            if session.get("venue"):
-                                st.markdown(f"**Venue:** {session['venue']}")
+                            st.markdown(cards.session_badges(session, match_tier(score)), unsafe_allow_html=True)
 
                             if networking_roi > 3:
                                 st.markdown("🤝 **High Networking ROI**")
@@ -917,6 +578,19 @@ def render_itinerary_view():
                             st.progress(min(score / 20, 1.0))
                             st.caption(f"Match Score: {score:.1f}/20")
 
+                            trip = current_travel().between(sessions[position - 1].venue, session.venue) if position else 0
+                            if 0 < trip < float("inf"):
+                                st.caption(f"🚕 About {trip:.0f} min from your previous session")
+
+                            if popularity is None:
+                                popularity, demand = current_popularity(), current_demand()
+                            planned = popularity.count(day, session.id)
+                            if planned:
+                                st.caption(f"👥 {planned} {'attendees plan' if planned != 1 else 'attendee plans'} to attend")
+                            occupancy = demand.occupancy(day, session)
+                            if occupancy is not None and occupancy > CONGESTION_THRESHOLD:
+                                st.caption(f"🚶 Predicted to fill {occupancy:.0%} of the venue's seats")
+
     # Actions
     st.markdown("---")
     col1, col2, col3 = st.columns(3)
@@ -925,7 +599,8 @@ def render_itinerary_view():
         if st.button("🔄 Start Over", use_container_width=True):
             st.session_state.wizard_step = 1
             st.session_state.profile = {}
-            st.session_state.itinerary = {}
+            st.session_state.itinerary = None
+            current_demand().record(st.session_state.pop("planned_sessions", None), -1)
             st.rerun()
 
     with col2:
@@ -937,13 +612,16 @@ def render_itinerary_view():
             st.info("PDF download coming soon!")
 
     # Share modal
+    shared_code = st.session_state.pop("shared_code", None)
+    if shared_code:
+        st.success(f"✅ Shared! Your code: **{shared_code}**")
+
     if st.session_state.get("show_share"):
         with st.expander("Share Your Schedule", expanded=True):
             share_name = st.text_input("Display Name", value=profile.get("name", ""))
             share_bio = st.text_area("Brief Bio", placeholder="AI researcher, startup founder, etc.")
 
             if st.button("Share to Community"):
-                community_data = load_community_data()
                 share_entry = {
                     "id": hashlib.md5(f"{share_name}{datetime.now().isoformat()}".encode()).hexdigest()[:8],
                     "name": share_name,
@@ -951,18 +629,71 @@ def render_itinerary_view():
                     "proficiency": profile.get("proficiency", ""),
                     "interests": list(set(profile.get("interests", [])))[:5],
                     "goals": profile.get("goals", [])[:3],
-                    "itinerary": {
-                        day: [{"title": s["title"], "time": s.get("time", "TBA")} for s in sessions[:3]]
-                        for day, sessions in itinerary.items()
-                    },
+                    "itinerary": shared_sessions(itinerary),
+                    "session_ids": shared_session_ids(itinerary),
                     "shared_at": datetime.now().isoformat(),
                 }
-                community_data["itineraries"].append(share_entry)
-                save_community_data(community_data)
-                st.success(f"✅ Shared! Your code: **{share_entry['id']}**")
+                try:
+                    save_community_data({"itineraries": [share_entry]})
+                except queue.Full:
+                    st.error("Sharing is busy right now, please try again in a moment.")
+                    return
+                st.session_state.shared_code = share_entry["id"]
+                st.session_state.setdefault("my_shares", []).append(share_entry["id"])
                 st.session_state.show_share = False
+                # Full rerun so the Community tab's fragment picks up the new share
+                st.rerun()
 
 
+@st.fragment
+@fragment("render_search")
+def render_search():
+    """Render free-text session search"""
+    st.markdown("""
+    <div style="text-align: center; padding: 2rem 0;">
+        <h2 style="font-size: 2rem; font-weight: 700; color: #1a1a1a;">🔍 Search Sessions</h2>
+        <p style="color: #6b7280;">Find sessions by topic, speaker, organization or venue</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    query = st.text_input("Search sessions", placeholder="e.g. judicial, World Bank, drug discovery", key="session_query")
+    col1, col2 = st.columns(2)
+    with col1:
+        days = st.multiselect("Days", DAYS, format_func=lambda day: f"{DAY_INFO[day]['name']} ({DAY_INFO[day]['short']})",
+                              key="search_days")
+    with col2:
+        levels = st.multiselect("Level", ["all"] + PROFICIENCIES, format_func=str.title, key="search_levels")
+
+    if not query.strip():
+        return
+
+    search = load_session_search(SNAPSHOT.sections.get("daily_schedule"), SNAPSHOT)
+    results = search.search(query, days, levels, limit=SEARCH_RESULTS)
+    if not results:
+        st.info("No sessions match your search.")
+        return
+
+    catalog = SNAPSHOT.catalog
+    cards = get_card_cache()
+    st.caption(f"Top {len(results)} matches")
+    for index, _ in results:
+        st.markdown(cards.search_result(catalog.sessions[index]), unsafe_allow_html=True)
+
+
+def reset_page(key):
+    st.session_state[key] = 1
+
+
+def current_page(key, count, per_page):
+    """The page stored under key, clamped to the pages `count` results fill; returns (page, pages)"""
+    pages = (count - 1) // per_page + 1
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    return st.session_state.get(key, 1), pages
+
+
+@st.fragment
+@fragment("render_expo_guide")
 def render_expo_guide():
     """Render expo pavilion guide"""
     st.markdown("""
@@ -972,24 +703,44 @@ def render_expo_guide():
     </div>
     """, unsafe_allow_html=True)
 
-    pavilions = EVENT_DATA.get("expo_pavilions", [])
+    expo_version = (SNAPSHOT.sections.get("exhibitors"), SNAPSHOT.sections.get("expo_pavilions"))
+    expo = load_exhibitor_catalog(expo_version, EVENT_DATA)
+    cards = get_card_cache()
+
+    # Pavilion and focus filters
+    col1, col2 = st.columns(2)
+    with col1:
+        pavilions = st.multiselect("Pavilions", expo.pavilions(), key="expo_pavilions",
+                                   format_func=lambda name: f"{EXPO_ICONS.get(name, '📍')} {name}",
+                                   on_change=reset_page, args=("expo_page",))
+    with col2:
+        focus = st.multiselect("Focus", expo.focus_tags(), key="expo_focus", on_change=reset_page, args=("expo_page",))
+
+    interests = st.session_state.get("profile", {}).get("interests", [])
+    ids = expo.ranked(expo.filter(pavilions, focus), interests)
+    if not ids:
+        st.info("No exhibitors match these filters.")
+        return
+
+    # Best matches for the attendee's interests first, one page at a time
+    page, pages = current_page("expo_page", len(ids), EXHIBITORS_PER_PAGE)
+    first = (page - 1) * EXHIBITORS_PER_PAGE + 1
+    st.caption(f"Showing {first}–{min(first + EXHIBITORS_PER_PAGE - 1, len(ids))} of {len(ids):,}, "
+               f"best matches for your interests first")
 
     cols = st.columns(3)
-    for i, pavilion in enumerate(pavilions):
+    for i, exhibitor in enumerate(expo.page(ids, page, EXHIBITORS_PER_PAGE)):
         with cols[i % 3]:
-            icon = EXPO_ICONS.get(pavilion["name"], "📍")
-            focus_tags = ", ".join(pavilion.get("focus", [])[:3])
-
-            st.markdown(f"""
-            <div class="expo-card">
-                <div class="expo-icon">{icon}</div>
-                <div class="expo-title">{pavilion['name']}</div>
-                <div class="expo-tags">{focus_tags}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            icon = EXPO_ICONS.get(exhibitor.get("pavilion"), "📍")
+            st.markdown(cards.exhibitor_card(exhibitor, icon), unsafe_allow_html=True)
             st.markdown("")
 
+    if pages > 1:
+        st.number_input("Page", min_value=1, max_value=pages, key="expo_page")
 
+
+@st.fragment
+@fragment("render_speakers")
 def render_speakers():
     """Render speakers section"""
     st.markdown("""
@@ -999,22 +750,39 @@ def render_speakers():
     </div>
     """, unsafe_allow_html=True)
 
-    speakers = EVENT_DATA.get("speakers", [])
+    directory = load_speaker_directory(SNAPSHOT.sections.get("speakers"), EVENT_DATA.get("speakers", []))
+    cards = get_card_cache()
+
+    # Search and topic filter
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        query = st.text_input("Search speakers", placeholder="Name or organization", key="speaker_query",
+                              on_change=reset_page, args=("speaker_page",))
+    with col2:
+        topics = st.multiselect("Topics", directory.topics(), key="speaker_topics",
+                                on_change=reset_page, args=("speaker_page",))
+
+    ids = directory.search(query, topics)
+    if not ids:
+        st.info("No speakers match your search.")
+        return
+
+    # Only the visible page of cards is built
+    page, pages = current_page("speaker_page", len(ids), SPEAKERS_PER_PAGE)
+    first = (page - 1) * SPEAKERS_PER_PAGE + 1
+    st.caption(f"Showing {first}–{min(first + SPEAKERS_PER_PAGE - 1, len(ids))} of {len(ids):,} speakers")
 
     cols = st.columns(2)
-    for i, speaker in enumerate(speakers):
+    for i, speaker in enumerate(directory.page(ids, page, SPEAKERS_PER_PAGE)):
         with cols[i % 2]:
-            topics_html = " ".join([f'<span class="topic-tag">{t}</span>' for t in speaker.get("topics", [])])
+            st.markdown(cards.speaker_card(speaker), unsafe_allow_html=True)
 
-            st.markdown(f"""
-            <div class="session-card">
-                <div class="session-title">{speaker['name']}</div>
-                <div class="session-meta">{speaker['title']}, {speaker['company']}</div>
-                <div>{topics_html}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    if pages > 1:
+        st.number_input("Page", min_value=1, max_value=pages, key="speaker_page")
 
 
+@st.fragment
+@fragment("render_community")
 def render_community():
     """Render community section"""
     st.markdown("""
@@ -1024,35 +792,106 @@ def render_community():
     </div>
     """, unsafe_allow_html=True)
 
-    community_data = load_community_data()
-    itineraries = community_data.get("itineraries", [])
-
-    if not itineraries:
+    if not get_community_store().exists() and not get_share_queue().pending():
         st.info("No shared schedules yet. Be the first to share yours!")
         return
 
     # Filter
     filter_prof = st.selectbox("Filter by proficiency", ["All", "Beginner", "Intermediate", "Advanced"])
 
-    for entry in itineraries[-10:][::-1]:
-        if filter_prof != "All" and entry.get("proficiency", "").lower() != filter_prof.lower():
-            continue
-
-        with st.expander(f"**{entry['name']}** | {entry.get('proficiency', '').title()} | Shared {entry.get('shared_at', '')[:10]}"):
-            st.markdown(f"*{entry.get('bio', 'No bio')}*")
+    community_data = load_community_data(limit=10, proficiency=None if filter_prof == "All" else filter_prof)
+    itineraries = community_data.get("itineraries", [])
 
-            interests_html = " ".join([f'<span class="topic-tag">{i}</span>' for i in entry.get("interests", [])[:5]])
-            st.markdown(f"**Interests:** {interests_html}", unsafe_allow_html=True)
+    # Trending: sessions appearing in the most recent shares
+    trending = current_popularity().trending(TRENDING_RESULTS)
+    if trending:
+        st.markdown("### 🔥 Trending Sessions")
+        for date, session_id, shares in trending:
+            day = SNAPSHOT.catalog.days.get(date)
+            session = next((s for s in day.sessions if s.id == session_id), None) if day else None
+            if session is not None:
+                st.markdown(f"• **{session.title}** · {DAY_INFO.get(date, {}).get('name', date)} {session.time} "
+                            f"· in {shares} share{'s' if shares != 1 else ''} over the last day")
+
+    # Attendees like you: closest shared schedules to this attendee's own plan
+    itinerary = st.session_state.get("itinerary")
+    similar = []
+    if itinerary:
+        interests = st.session_state.get("profile", {}).get("interests", [])
+        similar = similar_schedules(itinerary, interests, exclude=st.session_state.get("my_shares", ()))
+        if similar:
+            st.markdown("### 🧭 Attendees Like You")
+            for score, entry in similar:
+                render_community_entry(entry, f"{score:.0%} similar")
+
+    if trending or similar:
+        st.markdown("### 🕒 Recently Shared")
+
+    for entry in itineraries[::-1]:
+        render_community_entry(entry, f"Shared {entry.get('shared_at', '')[:10]}")
+
+
+def render_community_entry(entry, note):
+    """Render one shared schedule as an expander"""
+    with st.expander(f"**{entry['name']}** | {entry.get('proficiency', '').title()} | {note}"):
+        st.markdown(f"*{entry.get('bio', 'No bio')}*")
+
+        interests_html = " ".join([f'<span class="topic-tag">{i}</span>' for i in entry.get("interests", [])[:5]])
+        st.markdown(f"**Interests:** {interests_html}", unsafe_allow_html=True)
+
+        st.markdown("**Their Schedule:**")
+        for day, sessions in entry.get("itinerary", {}).items():
+            st.markdown(f"📅 **{DAY_INFO.get(day, {}).get('name', day)}:**")
+            for s in sessions:
+                st.markdown(f"  • {s['title']} ({s['time']})")
+
+
+def render_metrics_panel():
+    """Render per-stage timings in the sidebar when metrics are on and ?debug=1 is set"""
+    if not METRICS.enabled or st.query_params.get("debug") != "1":
+        return
 
-            st.markdown("**Their Schedule:**")
-            for day, sessions in entry.get("itinerary", {}).items():
-                st.markdown(f"📅 **{DAY_INFO.get(day, {}).get('name', day)}:**")
-                for s in sessions:
-                    st.markdown(f"  • {s['title']} ({s['time']})")
+    rerun = METRICS.current_rerun()
+    stats = METRICS.snapshot()
+    rows = []
+    for stage in sorted(set(stats) | set(rerun)):
+        total = stats.get(stage, {"count": 0, "total": 0.0, "max": 0.0})
+        calls, seconds = rerun.get(stage, (0, 0.0))
+        rows.append({
+            "stage": stage,
+            "this rerun (ms)": round(seconds * 1000, 2),
+            "calls": calls,
+            "all-time count": total["count"],
+            "mean (ms)": round(total["total"] / total["count"] * 1000, 2) if total["count"] else 0.0,
+            "max (ms)": round(total["max"] * 1000, 2),
+        })
+
+    with st.sidebar:
+        st.markdown("### ⏱️ Stage Timings")
+        st.table(rows)
+        cache = get_itinerary_cache().stats()
+        st.caption(f"Itinerary cache: {cache['hits']} hits · {cache['misses']} misses · {cache['size']}/{cache['maxsize']} entries")
+        shares = get_share_queue()
+        st.caption(f"Share queue: {shares.depth()} waiting · {shares.batches} commits · {shares.errors} retried")
+
+
+@st.fragment(run_every=RELOAD_CHECK_SECONDS)
+@fragment("watch_event_data")
+def watch_event_data():
+    """Rerun the page once the event data has changed, so open sessions see updates within seconds"""
+    if get_event_reloader().current().version != DATA_VERSION:
+        st.rerun()
 
 
 def main():
     """Main app"""
+    # Let returning attendees know the schedule changed since their last rerun
+    if st.session_state.get("data_version") not in (None, DATA_VERSION):
+        days = [DAY_INFO.get(date, {}).get("name", date) for date in (SNAPSHOT.changes or {}).get("days", [])]
+        st.toast("📅 The schedule was just updated" + (f": {', '.join(days)}" if days else ""))
+    st.session_state.data_version = DATA_VERSION
+    watch_event_data()
+
     # Check if we're in wizard mode or showing results
     if st.session_state.get("wizard_step", 1) < 4:
         # Show hero and wizard
@@ -1062,8 +901,9 @@ def main():
         render_questionnaire()
     else:
         # Show tabs with results
-        tab1, tab2, tab3, tab4 = st.tabs([
+        tab1, tab2, tab3, tab4, tab5 = st.tabs([
             "📋 My Schedule",
+            "🔍 Search",
             "🏛️ Expo Guide",
             "🎤 Speakers",
             "👥 Community"
@@ -1073,12 +913,15 @@ def main():
             render_itinerary_view()
 
         with tab2:
-            render_expo_guide()
+            render_search()
 
         with tab3:
-            render_speakers()
+            render_expo_guide()
 
         with tab4:
+            render_speakers()
+
+        with tab5:
             render_community()
 
     # Footer
@@ -1089,6 +932,12 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+    render_metrics_panel()
+
 
 if __name__ == "__main__":
-    main()
+    # Closed even when st.rerun() or st.stop() cuts the run short, so fragment reruns start their own
+    try:
+        main()
+    finally:
+        METRICS.finish_rerun()
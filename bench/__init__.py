@@ -0,0 +1,4 @@
+"""
+Headless benchmarks for the AI Summit Navigator
+Run with `python -m bench`; results are written as JSON for comparison against a baseline
+"""
@@ -0,0 +1,135 @@
+"""
+Interaction benchmark
+Server time per click with fragment-isolated tabs, against re-running the whole script
+
+    python -m bench.interactions --runs 30
+"""
+
+import argparse
+import os
+
+import numpy as np
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.testing.v1 import AppTest
+
+from planner.metrics import REGISTRY
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# Interaction: the fragment a widget in it re-executes
+INTERACTIONS = {
+    "open session details": "render_itinerary_view",
+    "share schedule form": "render_itinerary_view",
+    "search sessions": "render_search",
+    "filter community": "render_community",
+}
+
+
+def _stage_seconds(before, after):
+    return {
+        stage: stats["total"] - before.get(stage, {"total": 0.0})["total"]
+        for stage, stats in after.items()
+    }
+
+
+def _timed_run(at):
+    before = REGISTRY.snapshot()
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return _stage_seconds(before, REGISTRY.snapshot())
+
+
+def rerun_payload(at):
+    """Serialized bytes of the delta messages one full rerun sends to the browser"""
+    sizes = []
+    enqueue = ForwardMsgQueue.enqueue
+
+    def counting_enqueue(queue, msg):
+        if msg.HasField("delta"):
+            sizes.append(msg.ByteSize())
+        return enqueue(queue, msg)
+
+    ForwardMsgQueue.enqueue = counting_enqueue
+    try:
+        at.run()
+    finally:
+        ForwardMsgQueue.enqueue = enqueue
+    return sum(sizes), len(sizes)
+
+
+def start_app(interests=("AI Safety & Ethics", "Policy & Governance"), goals=("networking",)):
+    """AppTest driven through the wizard up to the generated itinerary"""
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    at.button(key="next1").click().run()
+    for checkbox in at.checkbox:
+        if checkbox.key in {f"int_{i}" for i in interests}:
+            checkbox.check()
+    at.button(key="next2").click().run()
+    for checkbox in at.checkbox:
+        if checkbox.key in {f"goal_{g}" for g in goals}:
+            checkbox.check()
+    at.button(key="next3").click().run()
+    return at
+
+
+def measure_interactions(runs=20):
+    """Per-interaction ms for a full script rerun vs re-executing only the owning fragment"""
+    REGISTRY.enabled = True
+    at = start_app()
+
+    reruns, stages = [], {}
+    for _ in range(runs):
+        seconds = _timed_run(at)
+        reruns.append(seconds["rerun"])
+        for stage, value in seconds.items():
+            stages.setdefault(stage, []).append(value)
+
+    full_ms = float(np.median(reruns)) * 1000
+    results = []
+    for name, fragment in INTERACTIONS.items():
+        fragment_ms = float(np.median(stages.get(fragment, [0.0]))) * 1000
+        results.append({
+            "interaction": name,
+            "fragment": fragment,
+            "full_rerun_ms": full_ms,
+            "fragment_ms": fragment_ms,
+            "saved_ms": full_ms - fragment_ms,
+        })
+
+    # Cost of the itinerary fragment with every session's details open, as it was before they were lazy
+    detail_keys = [expander.key for expander in at.expander if (expander.key or "").startswith("details_")]
+    for key in detail_keys:
+        at.session_state[key] = True
+    expanded = [_timed_run(at)["render_itinerary_view"] for _ in range(runs)]
+    collapsed_ms = float(np.median(stages["render_itinerary_view"])) * 1000
+    expanded_ms = float(np.median(expanded)) * 1000
+    results.append({
+        "interaction": f"itinerary with all {len(detail_keys)} details built",
+        "fragment": "render_itinerary_view",
+        "full_rerun_ms": expanded_ms,
+        "fragment_ms": collapsed_ms,
+        "saved_ms": expanded_ms - collapsed_ms,
+    })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure server time saved per interaction by fragments")
+    parser.add_argument("--runs", type=int, default=20, help="reruns to take the median over")
+    args = parser.parse_args(argv)
+
+    print(f"{'interaction':<36} {'before ms':>10} {'after ms':>10} {'saved ms':>10}")
+    for result in measure_interactions(args.runs):
+        print(
+            f"{result['interaction']:<36} {result['full_rerun_ms']:>10.2f} "
+            f"{result['fragment_ms']:>10.2f} {result['saved_ms']:>10.2f}"
+        )
+
+    payload, messages = rerun_payload(start_app())
+    print(f"\nfull rerun payload: {payload:,} bytes in {messages} delta messages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Benchmark runner
+Times scoring, itinerary generation and incremental edits, session search, sharded loading, the community store, session popularity and similar-schedule lookup without Streamlit
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from bench.synth import edit_profile, generate_event_data, generate_profiles, generate_share, topic_vocabulary
+from planner.community_store import CommunityStore
+from planner.demand import DemandModel, venue_capacities, visitors_per_day
+from planner.incremental import IncrementalScorer
+from planner.popularity import PopularityCounter
+from planner.itinerary import generate_itinerary
+from planner.model import compile_event
+from planner.scoring import calculate_session_score
+from planner.search import SessionSearch
+from planner.shards import ShardedCatalog, split_event
+from planner.similar import SimilarityIndex, entry_features, jaccard
+from planner.travel import travel_times
+
+DEFAULT_SIZES = [700, 5000, 50000]
+DEFAULT_COMMUNITY_SIZES = [100, 1000, 10000, 50000]
+
+
+def measure(name, fn, inputs, params=None):
+    """Run fn over inputs and summarize latency, throughput and peak traced memory"""
+    latencies = []
+    started = time.perf_counter()
+    for item in inputs:
+        t0 = time.perf_counter_ns()
+        fn(item)
+        latencies.append(time.perf_counter_ns() - t0)
+    elapsed = time.perf_counter() - started
+
+    # Peak memory is taken on a separate short pass since tracing slows everything down
+    tracemalloc.start()
+    for item in inputs[:10]:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies_ms = np.array(latencies) / 1e6
+    return {
+        "name": name,
+        "params": params or {},
+        "runs": len(inputs),
+        "mean_ms": float(latencies_ms.mean()),
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p90_ms": float(np.percentile(latencies_ms, 90)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "max_ms": float(latencies_ms.max()),
+        "throughput_per_s": len(inputs) / elapsed if elapsed else 0.0,
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+def bench_catalog(size, profile_count, seed):
+    """Scoring and itinerary benchmarks for one synthetic catalog size"""
+    data = generate_event_data(sessions=size, seed=seed)
+    profiles = generate_profiles(profile_count, topics=topic_vocabulary(), seed=seed)
+
+    started = time.perf_counter()
+    catalog = compile_event(data)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    raw_sessions = [s for day in data["daily_schedule"].values() for s in day["sessions"]]
+    results = [{"name": "compile", "params": {"sessions": size}, "runs": 1, "mean_ms": compile_ms}]
+
+    def score_engine(profile):
+        for day in catalog.days.values():
+            day.engine.score(profile)
+
+    results.append(measure("score/engine", score_engine, profiles, {"sessions": size}))
+
+    # The per-session reference scorer is only timed where it finishes in reasonable time
+    if size <= 5000:
+        def score_reference(profile):
+            for session in raw_sessions:
+                calculate_session_score(dict(session), profile)
+
+        reference_profiles = profiles[:max(10, profile_count // 10)]
+        results.append(measure("score/reference", score_reference, reference_profiles, {"sessions": size}))
+
+    results.append(measure(
+        "itinerary",
+        lambda profile: generate_itinerary(catalog, profile, max_per_day=5),
+        profiles,
+        {"sessions": size},
+    ))
+
+    started = time.perf_counter()
+    travel = travel_times(data)
+    travel_ms = (time.perf_counter() - started) * 1000
+    results.append({"name": "travel/matrix", "params": {"venues": len(travel)}, "runs": 1, "mean_ms": travel_ms})
+    results.append(measure(
+        "itinerary/routed",
+        lambda profile: generate_itinerary(catalog, profile, max_per_day=5, travel=travel),
+        profiles,
+        {"sessions": size},
+    ))
+
+    # One wizard edit to an attendee whose itinerary is already up to date, next to regenerating it
+    rng = random.Random(seed)
+    edited = [edit_profile(profile, rng, topic_vocabulary()) for profile in profiles]
+    for name, route in (("plain", None), ("routed", travel)):
+        scorers = []
+        for profile in profiles:
+            scorer = IncrementalScorer(catalog, max_per_day=5, min_break=0, travel=route)
+            scorer.update(profile)
+            scorers.append(scorer)
+        params = {"sessions": size, "travel": name}
+        # The edit is timed first: measure's second, memory-only pass finds the scorers already updated
+        results.append(measure(
+            "itinerary/edit", lambda pair: pair[0].update(pair[1]), list(zip(scorers, edited)), params,
+        ))
+        results.append(measure(
+            "itinerary/regenerate",
+            lambda profile: generate_itinerary(catalog, profile, max_per_day=5, min_break=0, travel=route),
+            edited,
+            params,
+        ))
+
+    # Avoiding crowds, with every earlier profile's itinerary counted as demand
+    demand = DemandModel(venue_capacities(data), visitors_per_day(data, len(catalog.days)))
+
+    def itinerary_avoiding_crowds(profile):
+        itinerary = generate_itinerary(catalog, profile, max_per_day=5, demand=demand)
+        demand.record({date: [catalog.sessions[i].id for i in ids] for date, ids in itinerary.days.items()})
+
+    results.append(measure("itinerary/avoid_crowds", itinerary_avoiding_crowds, profiles, {"sessions": size}))
+
+    started = time.perf_counter()
+    search = SessionSearch(catalog)
+    index_ms = (time.perf_counter() - started) * 1000
+    results.append({"name": "search/index", "params": {"sessions": size}, "runs": 1, "mean_ms": index_ms})
+
+    # Queries are a few of each profile's interests, filtered to its days half the time
+    queries = [
+        (" ".join(p["interests"][:3]).replace("-", " "), p["days"] if i % 2 else ())
+        for i, p in enumerate(profiles)
+    ]
+    results.append(measure("search/query", lambda q: search.search(*q), queries, {"sessions": size}))
+    results.extend(bench_startup(data, profiles[:5], size))
+    return results
+
+
+def bench_startup(data, profiles, size):
+    """Cold start to a first one-day itinerary, from the whole document versus from shards"""
+    one_day = [dict(p, days=p["days"][:1] or list(data["daily_schedule"])[:1]) for p in profiles]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "event_data.json")
+        with open(path, "w") as f:
+            json.dump(data, f)
+        split_event(data, os.path.join(tmp, "shards"))
+
+        def from_document(profile):
+            with open(path, "r") as f:
+                generate_itinerary(compile_event(json.load(f)), profile, max_per_day=5)
+
+        def from_shards(profile):
+            generate_itinerary(ShardedCatalog(os.path.join(tmp, "shards")), profile, max_per_day=5)
+
+        params = {"sessions": size}
+        return [
+            measure("startup/document", from_document, one_day, params),
+            measure("startup/shards", from_shards, one_day, params),
+        ]
+
+
+def bench_community(entries, seed, writes=200, reads=50):
+    """Append and read latency for a community store already holding `entries` shares"""
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CommunityStore(os.path.join(tmp, "community.db"))
+        batch = 1000
+        for start in range(0, entries, batch):
+            store.add([generate_share(rng, i) for i in range(start, min(entries, start + batch))])
+
+        shares = [generate_share(rng, entries + i) for i in range(writes)]
+        params = {"entries": entries}
+        results = [
+            measure("community/save", lambda entry: store.add([entry]), shares, params),
+            measure("community/load_recent", lambda _: store.load(limit=10), list(range(reads)), params),
+            measure("community/load_all", lambda _: store.load(), list(range(min(reads, 10))), params),
+        ]
+
+        # Trending is read as of the last synthetic share, so the window is not empty
+        clock = lambda: datetime(2026, 2, 21).timestamp()
+        rebuilds = list(range(3))
+        results.append(measure("popularity/rebuild", lambda _: PopularityCounter.from_store(store, clock=clock),
+                               rebuilds, params))
+        counter = PopularityCounter.from_store(store, clock=clock)
+        probes = [(date, session_id) for entry in shares for date, ids in entry["session_ids"].items() for session_id in ids]
+        unseen = [generate_share(rng, entries + writes + i) for i in range(writes)]
+        results += [
+            measure("popularity/count", lambda key: counter.count(*key), probes[:reads * 10], params),
+            measure("popularity/trending", lambda _: counter.trending(), list(range(reads)), params),
+            measure("popularity/add", counter.add, unseen, params),
+        ]
+        return results
+
+
+def bench_similar(entries, seed, queries=100):
+    """Indexing and lookup latency for "attendees like you" over `entries` shares, against a full scan"""
+    rng = random.Random(seed)
+    catalog = compile_event(generate_event_data(sessions=700, seed=seed))
+    shares = [generate_share(rng, i, catalog.sessions) for i in range(entries + queries)]
+    index = SimilarityIndex()
+    for entry in shares[:entries]:
+        index.add(entry)
+    probes = [entry_features(entry) for entry in shares[entries:]]
+
+    def exact(features):
+        return sorted((jaccard(features, other) for other in index.features), reverse=True)[:5]
+
+    def recall(features):
+        """Fraction of the exact top 5 similarities that the index returns too"""
+        best = exact(features)
+        found = [score for score, _ in index.query(features)]
+        return min(sum(1 for score in found if score >= best[-1]), len(best)) / len(best)
+
+    params = {"entries": entries}
+    query = measure("similar/query", lambda features: index.query(features), probes, params)
+    query["recall_at_5"] = float(np.mean([recall(features) for features in probes[:50]]))
+    return [
+        query,
+        measure("similar/exact", exact, probes[:20], params),
+        # Last, so the probes were not indexed while being looked up
+        measure("similar/add", index.add, shares[entries:], params),
+    ]
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """Print mean latency deltas against a baseline run"""
+    previous = {(r["name"], json.dumps(r["params"], sort_keys=True)): r for r in baseline["results"]}
+    print(f"\n{'benchmark':<40} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for result in results:
+        key = (result["name"], json.dumps(result["params"], sort_keys=True))
+        old = previous.get(key)
+        label = f"{result['name']} {result['params']}"
+        if old is None or not old.get("mean_ms"):
+            print(f"{label:<40} {'-':>12} {result['mean_ms']:>12.3f} {'new':>8}")
+            continue
+        change = (result["mean_ms"] - old["mean_ms"]) / old["mean_ms"] * 100
+        print(f"{label:<40} {old['mean_ms']:>12.3f} {result['mean_ms']:>12.3f} {change:>+7.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run planner benchmarks without Streamlit")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="catalog sizes in sessions")
+    parser.add_argument("--community-sizes", type=int, nargs="+", default=DEFAULT_COMMUNITY_SIZES,
+                        help="community store sizes in shares")
+    parser.add_argument("--profiles", type=int, default=200, help="profiles per catalog benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json", help="where to write the JSON results")
+    parser.add_argument("--baseline", help="earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        print(f"catalog: {size} sessions", file=sys.stderr)
+        results.extend(bench_catalog(size, args.profiles, args.seed))
+    for entries in args.community_sizes:
+        print(f"community: {entries} shares", file=sys.stderr)
+        results.extend(bench_community(entries, args.seed))
+        results.extend(bench_similar(entries, args.seed))
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for result in results:
+        line = f"{result['name']:<24} {json.dumps(result['params']):<22} mean {result['mean_ms']:9.3f} ms"
+        if "p99_ms" in result:
+            line += f"  p99 {result['p99_ms']:9.3f} ms  {result['throughput_per_s']:10.1f}/s"
+        if "recall_at_5" in result:
+            line += f"  recall@5 {result['recall_at_5']:.2f}"
+        print(line)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Startup benchmark
+Cold-start time of a fresh process, loading event_data.json versus its binary snapshot
+
+    python -m bench.startup --sizes 0 50000 --runs 3
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from bench.synth import generate_event_data
+from planner.snapshot import snapshot_path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+EVENT_DATA_PATH = os.path.join(ROOT, "event_data.json")
+
+# Loads the data the way the app does and prints the seconds spent in that stage alone
+LOAD_SCRIPT = """
+import sys, time
+from planner.profiles import interest_keywords
+from planner.reload import EventReloader
+started = time.perf_counter()
+EventReloader(sys.argv[1], interests=interest_keywords(), snapshot_path=sys.argv[2] or None)
+print(time.perf_counter() - started)
+"""
+
+# Renders the app's first page once, as a new replica answering its first request
+RENDER_SCRIPT = """
+import sys
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=600)
+at.run()
+if at.exception:
+    sys.exit(at.exception[0].message)
+"""
+
+
+def _child(script, args, data_path):
+    env = dict(os.environ, PLANNER_EVENT_DATA=data_path, PYTHONPATH=ROOT)
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", script, *args], env=env, capture_output=True, text=True, check=True,
+    )
+    return time.perf_counter() - started, result.stdout
+
+
+def measure_startup(data_path, runs=3):
+    """Median seconds to load and to first render, from JSON and from a fresh snapshot"""
+    snapshot = snapshot_path(data_path)
+    timings = {}
+    for source in ("json", "snapshot"):
+        if source == "snapshot":
+            subprocess.run([sys.executable, "-m", "planner.snapshot", data_path], cwd=ROOT, check=True,
+                           capture_output=True)
+        loads, renders = [], []
+        for _ in range(runs):
+            loads.append(float(_child(LOAD_SCRIPT, [data_path, snapshot if source == "snapshot" else ""], data_path)[1]))
+            renders.append(_child(RENDER_SCRIPT, [APP_PATH], data_path)[0])
+            # A render from JSON starts writing a snapshot in the background; keep every JSON run cold
+            if source == "json" and os.path.exists(snapshot):
+                os.remove(snapshot)
+        timings[source] = (float(np.median(loads)), float(np.median(renders)))
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare cold start from event_data.json and from its snapshot")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 50000],
+                        help="synthetic catalog sizes in sessions; 0 is the real event_data.json")
+    parser.add_argument("--runs", type=int, default=3, help="fresh processes to take the median over")
+    args = parser.parse_args(argv)
+
+    print(f"{'catalog':<16} {'source':<10} {'load ms':>10} {'first render ms':>16}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_path = os.path.join(tmp, "event_data.json")
+            if size:
+                with open(data_path, "w") as f:
+                    json.dump(generate_event_data(sessions=size, seed=0), f)
+            else:
+                shutil.copy(EVENT_DATA_PATH, data_path)
+
+            label = f"{size} sessions" if size else "event_data.json"
+            for source, (load, render) in measure_startup(data_path, args.runs).items():
+                print(f"{label:<16} {source:<10} {load * 1000:>10.1f} {render * 1000:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
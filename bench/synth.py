@@ -0,0 +1,193 @@
+"""
+Synthetic summit generator
+Seeded catalogs shaped like event_data.json and matching attendee profiles
+"""
+
+import json
+import os
+import random
+
+from planner.profiles import GOALS
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "event_data.json")
+
+DAYS = [
+    ("2026-02-16", "Monday"),
+    ("2026-02-17", "Tuesday"),
+    ("2026-02-18", "Wednesday"),
+    ("2026-02-19", "Thursday"),
+    ("2026-02-20", "Friday"),
+]
+
+BASE_TOPICS = [
+    "genai", "llm", "foundation-models", "ai-safety", "alignment", "responsible-ai", "ethics",
+    "healthcare", "diagnostics", "drug-discovery", "health-equity", "enterprise", "automation",
+    "productivity", "business", "policy", "governance", "regulation", "law", "research",
+    "academic", "papers", "science", "startups", "entrepreneurship", "demos", "funding",
+    "education", "skills", "learning", "career", "climate", "sustainability", "energy",
+    "environment", "computing", "hardware", "gpu", "infrastructure", "agriculture", "rural",
+    "smart-cities", "transportation", "fintech", "open-source", "data-governance", "global-south",
+]
+TOPIC_PREFIXES = ["applied", "edge", "public", "indic", "federated", "trusted", "frugal", "agentic"]
+
+TRACKS = ["human_capital", "inclusion", "safe_ai", "science", "resilience", "democratizing", "economic_dev"]
+LEVELS = ["all", "beginner", "intermediate", "advanced"]
+VENUES = [
+    "Bharat Mandapam", "Hall No 16", "Main Plenary Hall", "West Wing Room 4A",
+    "Sushma Swaraj Bhawan", "Ambedkar Bhawan", "Gulmohar Hall, India Habitat Centre",
+]
+
+TITLE_HEADS = ["AI for", "Building", "Scaling", "Governing", "Rethinking", "Open", "Frontiers of", "Responsible"]
+TITLE_TAILS = [
+    "Public Health", "Smart Agriculture", "Financial Inclusion", "Indian Languages", "Climate Action",
+    "Digital Public Infrastructure", "Education Systems", "Judicial Ecosystems", "Startups", "Compute",
+]
+DESCRIPTION_PHRASES = [
+    "Leaders and CEOs discuss", "A hands-on workshop on", "Roundtable on", "Technical deep-dive into",
+    "Practitioners meet to connect on", "Tutorial covering", "Panel exploring", "Policy dialogue on",
+]
+
+FIRST_NAMES = ["Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Meera", "Arjun", "Kavya", "Sam", "Dario",
+               "Yann", "Demis", "Jensen", "Sundar", "Lena", "Tomas", "Aiko", "Chen", "Fatima", "Omar"]
+LAST_NAMES = ["Sharma", "Iyer", "Gupta", "Nair", "Reddy", "Menon", "Khan", "Singh", "Okafor", "Muller",
+              "Tanaka", "Li", "Silva", "Haddad", "Novak", "Altman", "Amodei", "LeCun", "Hassabis", "Huang"]
+COMPANIES = ["World Bank", "NITI Aayog", "IIT Delhi", "Niramai", "Apollo Hospitals", "ADB", "Infosys",
+             "Google", "Microsoft", "OpenAI", "Anthropic", "NVIDIA", "Meta", "Fujitsu", "Qualcomm"]
+
+
+def topic_vocabulary(size=240):
+    """Real topic names padded with prefixed variants up to `size` entries"""
+    topics = list(BASE_TOPICS)
+    for prefix in TOPIC_PREFIXES:
+        for topic in BASE_TOPICS:
+            if len(topics) >= size:
+                return topics
+            topics.append(f"{prefix}-{topic}")
+    return topics[:size]
+
+
+def _person(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _session(rng, day_index, i, topics, speaker_names):
+    start = rng.randrange(8 * 60, 18 * 60, 15)
+    end = start + rng.choice([30, 45, 60, 60, 90, 120, 180])
+    session = {
+        "id": f"d{day_index + 1}s{i + 1}",
+        "title": f"{rng.choice(TITLE_HEADS)} {rng.choice(TITLE_TAILS)}",
+        "time": f"{start // 60:02d}:{start % 60:02d} - {end // 60:02d}:{end % 60:02d}",
+        "track": rng.choice(TRACKS),
+        "level": rng.choice(LEVELS),
+        "topics": rng.sample(topics, rng.randint(2, 5)),
+        "description": f"{rng.choice(DESCRIPTION_PHRASES)} {rng.choice(TITLE_TAILS).lower()} "
+                       f"and {rng.choice(topics).replace('-', ' ')}",
+    }
+    if rng.random() < 0.7:
+        session["venue"] = rng.choice(VENUES)
+    if rng.random() < 0.4:
+        session["speakers"] = rng.sample(speaker_names, rng.randint(1, 4))
+    return session
+
+
+def generate_event_data(sessions=700, speakers=3250, exhibitors=300, seed=0, topics=240):
+    """Build an event_data.json-shaped dict with the given catalog sizes"""
+    rng = random.Random(seed)
+    with open(TEMPLATE_PATH, "r") as f:
+        data = json.load(f)
+
+    vocabulary = topic_vocabulary(topics)
+
+    data["speakers"] = [
+        {
+            "name": f"{_person(rng)} {i}",
+            "title": rng.choice(["CEO", "Minister", "Professor", "Chief Scientist", "Director"]),
+            "company": rng.choice(COMPANIES),
+            "topics": rng.sample(vocabulary, 3),
+        }
+        for i in range(speakers)
+    ]
+    speaker_names = [f"{s['name']} ({s['company']})" for s in data["speakers"]]
+
+    schedule = {}
+    for day_index, (date, day_name) in enumerate(DAYS):
+        count = sessions // len(DAYS) + (1 if day_index < sessions % len(DAYS) else 0)
+        schedule[date] = {
+            "day": day_name,
+            "theme": data["daily_schedule"].get(date, {}).get("theme", ""),
+            "highlights": [],
+            "sessions": [_session(rng, day_index, i, vocabulary, speaker_names) for i in range(count)],
+        }
+    data["daily_schedule"] = schedule
+
+    pavilions = data.get("expo_pavilions", [])
+    data["exhibitors"] = []
+    for i in range(exhibitors):
+        pavilion = pavilions[i % len(pavilions)] if pavilions else {"name": "Expo", "focus": []}
+        focus = list(pavilion.get("focus", []))
+        data["exhibitors"].append({
+            "id": f"ex{i + 1}",
+            "name": f"{rng.choice(COMPANIES)} Labs {i + 1}",
+            "pavilion": pavilion["name"],
+            "focus": rng.sample(focus + rng.sample(vocabulary, 2), min(3, len(focus) + 2)),
+            "booth": f"H{rng.randint(1, 14)}-{rng.choice('ABCDEF')}{rng.randint(1, 40)}",
+        })
+    return data
+
+
+def generate_profiles(count, topics=None, seed=0):
+    """Wizard-shaped profiles drawing interests from the given topic vocabulary"""
+    rng = random.Random(seed)
+    vocabulary = topics or topic_vocabulary()
+    goals = [goal_id for goal_id, _, _ in GOALS]
+    return [
+        {
+            "name": f"Attendee {i}",
+            "role": "Professional",
+            "proficiency": rng.choice(["beginner", "intermediate", "advanced"]),
+            "interests": rng.sample(vocabulary, rng.randint(1, 3) * 4),
+            "goals": rng.sample(goals, rng.randint(1, 3)),
+            "days": sorted(rng.sample([date for date, _ in DAYS], rng.randint(1, len(DAYS)))),
+        }
+        for i in range(count)
+    ]
+
+
+def edit_profile(profile, rng, topics=None):
+    """Copy of a profile with one wizard edit: a toggled goal, an added or dropped interest, or a new proficiency"""
+    vocabulary = topics or topic_vocabulary()
+    edited = dict(profile, interests=list(profile.get("interests", [])), goals=list(profile.get("goals", [])))
+    change = rng.choice(["goal", "interest", "interest", "proficiency"])
+    if change == "goal":
+        goal = rng.choice([goal_id for goal_id, _, _ in GOALS])
+        if goal in edited["goals"]:
+            edited["goals"].remove(goal)
+        else:
+            edited["goals"].append(goal)
+    elif change == "interest" and edited["interests"] and rng.random() < 0.5:
+        edited["interests"].remove(rng.choice(edited["interests"]))
+    elif change == "interest":
+        edited["interests"].append(rng.choice(vocabulary))
+    else:
+        levels = ["beginner", "intermediate", "advanced"]
+        edited["proficiency"] = rng.choice([level for level in levels if level != profile.get("proficiency")])
+    return edited
+
+
+def generate_share(rng, i, catalog_sessions=()):
+    """One community share entry in the shape the app stores"""
+    titles = [s.title for s in catalog_sessions[:50]] or ["Session"]
+    return {
+        "id": f"bench{i:08d}",
+        "name": _person(rng),
+        "bio": "Benchmark attendee",
+        "proficiency": rng.choice(["beginner", "intermediate", "advanced"]),
+        "interests": rng.sample(BASE_TOPICS, 5),
+        "goals": ["networking"],
+        "itinerary": {
+            date: [{"title": rng.choice(titles), "time": "10:00 - 11:00"} for _ in range(3)]
+            for date, _ in DAYS[:2]
+        },
+        "session_ids": {date: [f"{date}-{rng.randrange(200)}" for _ in range(8)] for date, _ in DAYS[:2]},
+        "shared_at": f"2026-02-{16 + i % 5}T{i % 24:02d}:00:00.{i:06d}",
+    }
@@ -0,0 +1,4 @@
+"""
+Core planning logic for the AI Summit Navigator
+Kept free of Streamlit imports so it can be reused by scripts and benchmarks
+"""
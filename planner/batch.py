@@ -0,0 +1,176 @@
+"""
+Batch itinerary generation
+Pre-generates schedules for registered delegates from CSV or JSONL, without Streamlit
+
+    python -m planner.batch delegates.csv -o schedules.jsonl
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from planner.cache import ItineraryCache, profile_key
+from planner.itinerary import MAX_SESSIONS_PER_DAY, MIN_BREAK_MINUTES, generate_itinerary
+from planner.profiles import interest_keywords, normalize_profile
+from planner.shards import MANIFEST_NAME, ShardedCatalog
+from planner.snapshot import load_or_build, snapshot_path
+from planner.travel import travel_times
+
+DEFAULT_DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "event_data.json")
+
+# Per-worker state, set up once by _init_worker
+_catalog = None
+_travel = None
+_cache = None
+_data_version = None
+_options = None
+
+
+def read_profiles(path):
+    """Yield delegate records from a .csv or .jsonl file"""
+    with open(path, "r", newline="") as f:
+        if path.endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def chunked(records, size):
+    chunk = []
+    for row, record in enumerate(records):
+        chunk.append((row, record))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _init_worker(data_path, options):
+    global _catalog, _travel, _cache, _data_version, _options
+    if os.path.isdir(data_path):
+        # Shard directory: workers compile only the days their delegates ask for
+        with open(os.path.join(data_path, MANIFEST_NAME), "rb") as f:
+            raw = f.read()
+        manifest = json.loads(raw)
+        _catalog = ShardedCatalog(data_path, interest_keywords(), manifest=manifest)
+        _travel = travel_times(manifest)
+        _data_version = hashlib.sha256(raw).hexdigest()
+    else:
+        # Workers map the binary snapshot's arrays, so they share them through the page cache
+        with open(data_path, "rb") as f:
+            raw = f.read()
+        _data_version = hashlib.sha256(raw).hexdigest()
+        payload = load_or_build(raw, _data_version, interest_keywords(), snapshot_path(data_path))
+        _catalog = payload["catalog"]
+        _travel = travel_times(payload["data"])
+    _cache = ItineraryCache(maxsize=options["cache_size"])
+    _options = options
+
+
+def itinerary_record(row, profile, itinerary):
+    """JSON-ready output record for one delegate"""
+    return {
+        "row": row,
+        "profile": profile,
+        "profile_key": profile_key(profile),
+        "itinerary": {
+            day: [
+                {
+                    "id": session.id,
+                    "title": session.title,
+                    "time": session.time,
+                    "venue": session.venue,
+                    "score": round(float(itinerary.scores[session.index]), 2),
+                    "is_vip": session.is_vip,
+                }
+                for session in itinerary.sessions(day)
+            ]
+            for day in itinerary.days
+        },
+    }
+
+
+def _process_chunk(chunk):
+    lines = []
+    for row, record in chunk:
+        profile = normalize_profile(record, list(_catalog.days))
+        itinerary = _cache.get_or_compute(
+            profile,
+            _data_version,
+            lambda p: generate_itinerary(_catalog, p, _options["max_per_day"], _options["min_break"], travel=_travel),
+        )
+        lines.append(json.dumps(itinerary_record(row, profile, itinerary)))
+    return lines
+
+
+def run(input_path, output_path, data_path=DEFAULT_DATA_PATH, workers=None, chunk_size=500,
+        max_per_day=MAX_SESSIONS_PER_DAY, min_break=MIN_BREAK_MINUTES, cache_size=4096, progress=sys.stderr):
+    """Generate itineraries for every delegate, streaming JSONL as chunks finish; returns the count"""
+    workers = workers or os.cpu_count() or 1
+    options = {"max_per_day": max_per_day, "min_break": min_break, "cache_size": cache_size}
+    chunks = chunked(read_profiles(input_path), chunk_size)
+
+    done = 0
+    started = time.perf_counter()
+    with open(output_path, "w") as out, ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(data_path, options),
+    ) as pool:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            # Keep a bounded number of chunks in flight so huge inputs stream through memory
+            while not exhausted and len(pending) < workers * 2:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    pending.add(pool.submit(_process_chunk, chunk))
+            if not pending:
+                break
+
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                lines = future.result()
+                out.write("\n".join(lines) + "\n")
+                done += len(lines)
+
+            if progress:
+                elapsed = time.perf_counter() - started
+                rate = done / elapsed if elapsed else 0.0
+                print(f"\r{done} itineraries · {rate:,.0f}/s · {elapsed:.1f}s", end="", file=progress, flush=True)
+
+    if progress:
+        print(file=progress)
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate itineraries for registered delegates")
+    parser.add_argument("input", help="delegate profiles as .csv or .jsonl")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to write itineraries to")
+    parser.add_argument("--data", default=DEFAULT_DATA_PATH, help="event_data.json or shard directory to schedule from")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="profiles per task sent to a worker")
+    parser.add_argument("--max-per-day", type=int, default=MAX_SESSIONS_PER_DAY)
+    parser.add_argument("--min-break", type=int, default=MIN_BREAK_MINUTES, help="minutes between sessions")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    count = run(
+        args.input, args.output, data_path=args.data, workers=args.workers, chunk_size=args.chunk_size,
+        max_per_day=args.max_per_day, min_break=args.min_break,
+    )
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {count} itineraries to {args.output} in {elapsed:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
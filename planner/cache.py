@@ -0,0 +1,86 @@
+"""
+Itinerary cache
+Memoizes generated itineraries by the profile fields that affect scoring
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+def profile_key(profile):
+    """Canonical hash of the scoring-relevant parts of a profile (not name or role)"""
+    days = profile.get("days")
+    canonical = {
+        "proficiency": profile.get("proficiency", "intermediate"),
+        # Interests keep their multiplicity: each occurrence adds to the topic score
+        "interests": sorted(profile.get("interests", [])),
+        "goals": sorted(set(profile.get("goals", []))),
+        "days": sorted(set(days)) if days is not None else None,
+    }
+    encoded = json.dumps(canonical, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ItineraryCache:
+    """
+    Thread-safe LRU cache of itineraries for one event data version
+
+    When the version changes the cache is cleared, or, given a rebase function, each
+    entry is replaced by rebase(itinerary) and dropped where that returns None.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.data_version = None
+        self.retained = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, profile, data_version, compute, rebase=None):
+        """Return the cached itinerary for this profile, calling compute(profile) on a miss"""
+        key = profile_key(profile)
+        with self._lock:
+            if data_version != self.data_version:
+                self._switch_version(data_version, rebase)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        itinerary = compute(profile)
+
+        with self._lock:
+            if data_version == self.data_version:
+                self._entries[key] = itinerary
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return itinerary
+
+    def _switch_version(self, data_version, rebase):
+        entries = OrderedDict()
+        if rebase is not None:
+            for key, itinerary in self._entries.items():
+                itinerary = rebase(itinerary)
+                if itinerary is not None:
+                    entries[key] = itinerary
+        self.retained = len(entries)
+        self._entries = entries
+        self.data_version = data_version
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "data_version": self.data_version,
+                "retained": self.retained,
+            }
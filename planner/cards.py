@@ -0,0 +1,114 @@
+"""
+HTML cards
+Escaped card markup for sessions, speakers and expo exhibitors, built once per entity and shared by every attendee
+"""
+
+from html import escape
+
+# (score above which the tier applies, css class, label), best tier first
+MATCH_TIERS = (
+    (12, "match-high", "High Match"),
+    (6, "match-medium", "Good Match"),
+    (float("-inf"), "match-low", "Relevant"),
+)
+MATCH_BADGES = tuple(f'<span class="{css} match-badge">✓ {label}</span>' for _, css, label in MATCH_TIERS)
+VIP_BADGE = '<span class="vip-badge">⭐ VIP</span>'
+
+
+def match_tier(score):
+    """Index into MATCH_TIERS for a session score"""
+    for tier, (threshold, _, _) in enumerate(MATCH_TIERS):
+        if score > threshold:
+            return tier
+    return len(MATCH_TIERS) - 1
+
+
+def _topic_tags(topics):
+    return " ".join(f'<span class="topic-tag">{escape(topic)}</span>' for topic in topics)
+
+
+class CardCache:
+    """
+    Card HTML keyed by entity
+
+    Entity text is escaped once when a card is first built; later renders are a dict
+    lookup. Each card remembers the record it was built from and is rebuilt when asked
+    for with a different one, so after a data reload only changed entities are redone.
+    Concurrent attendees may race to build the same card, which is harmless since both
+    build identical markup.
+    """
+
+    def __init__(self):
+        self._cards = {}
+
+    def __len__(self):
+        return len(self._cards)
+
+    def _get(self, key, source, build):
+        entry = self._cards.get(key)
+        if entry is None or entry[0] is not source:
+            entry = self._cards[key] = (source, build())
+        return entry[1]
+
+    def session_details(self, session):
+        """Description, speakers and topics for a session's detail column"""
+        def build():
+            parts = [f"<p><strong>Description:</strong> {escape(session.description or 'N/A')}</p>"]
+            if session.speakers:
+                parts.append("<p><strong>Speakers:</strong></p>")
+                parts.extend(f'<div><span class="speaker-tag">👤 {escape(s)}</span></div>' for s in session.speakers[:3])
+            parts.append("<p><strong>Topics:</strong></p>")
+            parts.append(f"<div>{_topic_tags(session.topic_list[:5])}</div>")
+            return "\n".join(parts)
+        return self._get(("session", session.index), session, build)
+
+    def session_badges(self, session, tier):
+        """Match badge for the given tier, VIP badge, level and venue"""
+        def build():
+            parts = [f"<div>{MATCH_BADGES[tier]}</div>"]
+            if session.is_vip:
+                parts.append(f"<div>{VIP_BADGE}</div>")
+            parts.append(f"<p><strong>Level:</strong> {escape(session.level.title())}</p>")
+            if session.venue:
+                parts.append(f"<p><strong>Venue:</strong> {escape(session.venue)}</p>")
+            return "\n".join(parts)
+        return self._get(("badges", session.index, tier), session, build)
+
+    def search_result(self, session):
+        """Compact session card for search results"""
+        def build():
+            meta = [session.day_name, session.time, session.level.title()]
+            if session.venue:
+                meta.append(session.venue)
+            return f"""
+            <div class="session-card">
+                <div class="session-title">{escape(session.title)}</div>
+                <div class="session-meta">{escape(" · ".join(meta))}</div>
+                <div>{_topic_tags(session.topic_list[:5])}</div>
+            </div>
+            """
+        return self._get(("result", session.index), session, build)
+
+    def speaker_card(self, speaker):
+        def build():
+            return f"""
+            <div class="session-card">
+                <div class="session-title">{escape(speaker['name'])}</div>
+                <div class="session-meta">{escape(speaker['title'])}, {escape(speaker['company'])}</div>
+                <div>{_topic_tags(speaker.get('topics', []))}</div>
+            </div>
+            """
+        return self._get(("speaker", speaker["name"]), speaker, build)
+
+    def exhibitor_card(self, exhibitor, icon):
+        def build():
+            booth = f'<div class="expo-tags">Booth {escape(exhibitor["booth"])}</div>' if exhibitor.get("booth") else ""
+            return f"""
+            <div class="expo-card">
+                <div class="expo-icon">{icon}</div>
+                <div class="expo-title">{escape(exhibitor['name'])}</div>
+                <div class="expo-tags">{escape(", ".join(exhibitor.get("focus", [])[:3]))}</div>
+                {booth}
+            </div>
+            """
+        return self._get(("exhibitor", exhibitor["id"]), exhibitor, build)
@@ -0,0 +1,154 @@
+"""
+Community itinerary store
+Append-only SQLite storage for shared schedules, safe for concurrent writers
+"""
+
+import json
+import os
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS itineraries (
+    id TEXT PRIMARY KEY,
+    proficiency TEXT NOT NULL DEFAULT '',
+    shared_at TEXT NOT NULL DEFAULT '',
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_itineraries_shared_at ON itineraries (shared_at);
+CREATE INDEX IF NOT EXISTS idx_itineraries_proficiency ON itineraries (proficiency, shared_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class CommunityReader:
+    """
+    Base of the in-memory indexes fed from the store
+
+    A subclass defines add(entry), returning whether the share was new. update() feeds it
+    rows from load_after and remembers the highest rowid, so catch_up can later read only
+    the shares other server processes have written since.
+    """
+
+    last_rowid = 0
+
+    def update(self, rows):
+        """Add (rowid, entry) pairs read from the store, remembering the highest rowid"""
+        for rowid, entry in rows:
+            self.add(entry)
+            self.last_rowid = max(self.last_rowid, rowid)
+
+
+class CommunityStore:
+    """SQLite-backed store for community itineraries, running in WAL mode"""
+
+    def __init__(self, path, legacy_json_path=None):
+        self.path = path
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+        if legacy_json_path:
+            self._import_legacy_json(legacy_json_path)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _import_legacy_json(self, json_path):
+        """Copy entries from the old community_itineraries.json exactly once"""
+        if not os.path.exists(json_path):
+            return
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            done = conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone()
+            if not done:
+                with open(json_path, "r") as f:
+                    entries = json.load(f).get("itineraries", [])
+                conn.executemany(
+                    "INSERT OR IGNORE INTO itineraries (id, proficiency, shared_at, payload) VALUES (?, ?, ?, ?)",
+                    [_row(entry) for entry in entries],
+                )
+                conn.execute("INSERT INTO meta (key, value) VALUES ('json_imported', ?)", (json_path,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def add(self, entries):
+        """Append shared itineraries; entries whose id is already stored are left untouched"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO itineraries (id, proficiency, shared_at, payload) VALUES (?, ?, ?, ?)",
+                    [_row(entry) for entry in entries],
+                )
+        finally:
+            conn.close()
+
+    def load(self, limit=None, proficiency=None):
+        """Return shared itineraries oldest first, optionally only the newest `limit` ones"""
+        query = "SELECT payload FROM itineraries"
+        params = []
+        if proficiency:
+            query += " WHERE proficiency = ?"
+            params.append(proficiency.lower())
+        query += " ORDER BY shared_at DESC, rowid DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(payload) for (payload,) in reversed(rows)]
+
+    def load_after(self, rowid=0):
+        """(rowid, entry) pairs stored after rowid, in insertion order, for incremental readers"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT rowid, payload FROM itineraries WHERE rowid > ? ORDER BY rowid", (rowid,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [(row_id, json.loads(payload)) for row_id, payload in rows]
+
+    def catch_up(self, readers):
+        """Feed every reader the rows stored after its last_rowid, with one query for all of them"""
+        rows = self.load_after(min(reader.last_rowid for reader in readers))
+        for reader in readers:
+            reader.update([row for row in rows if row[0] > reader.last_rowid])
+
+    def count(self):
+        """Number of stored itineraries"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM itineraries").fetchone()[0]
+        finally:
+            conn.close()
+
+    def exists(self):
+        """Whether any itinerary is stored, without counting them all"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT 1 FROM itineraries LIMIT 1").fetchone() is not None
+        finally:
+            conn.close()
+
+
+def _row(entry):
+    return (
+        entry["id"],
+        entry.get("proficiency", "").lower(),
+        entry.get("shared_at", ""),
+        json.dumps(entry),
+    )
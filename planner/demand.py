@@ -0,0 +1,113 @@
+"""
+Session demand
+Predicted attendance per session from attendees' itineraries, and the congestion penalty it implies
+"""
+
+import threading
+
+import numpy as np
+
+from planner.community_store import CommunityReader
+
+# Until a day has this many itineraries, shares of it are taken over this many, so the
+# first few attendees do not make every session they picked look full
+MIN_ITINERARIES = 500
+
+# Penalty points per unit of predicted occupancy above CONGESTION_THRESHOLD of capacity;
+# a session at 130% of its seats loses 5 points of a 20-point score
+CONGESTION_THRESHOLD = 0.8
+CONGESTION_WEIGHT = 10.0
+# A penalized session keeps at least this fraction of its score, so a crowded day still gets a plan
+CONGESTION_FLOOR = 0.1
+
+
+def venue_capacities(event_data):
+    """Seats per venue name from the event's venues section"""
+    return {
+        name: venue["capacity"]
+        for name, venue in event_data.get("venues", {}).items()
+        if venue.get("capacity")
+    }
+
+
+def visitors_per_day(event_data, days):
+    """Expected visitors spread evenly over `days` scheduled days, e.g. len(catalog.days)"""
+    visitors = event_data.get("event", {}).get("stats", {}).get("expected_visitors", 0)
+    return visitors / days if days else 0.0
+
+
+class DemandModel(CommunityReader):
+    """
+    How many attendees each session can expect
+
+    Every itinerary counted adds one to each of its sessions and to the total for each
+    of its days, so recording or removing one costs only the sessions it holds. A
+    session's predicted attendance is its share of the day's itineraries times the
+    expected visitors per day. Shares read from the community store are counted once by
+    id; ignore() marks one whose attendee was already counted from their own plan.
+    """
+
+    def __init__(self, capacities=None, visitors_per_day=0.0, min_itineraries=MIN_ITINERARIES):
+        self.capacities = capacities or {}
+        self.visitors_per_day = visitors_per_day
+        self.min_itineraries = min_itineraries
+        self.planned = {}
+        self.totals = {}
+        self._counted = set()
+        self._lock = threading.Lock()
+
+    def configure(self, capacities, visitors_per_day):
+        """Switch to new venue capacities and visitor numbers, keeping the counts"""
+        self.capacities = capacities
+        self.visitors_per_day = visitors_per_day
+
+    def record(self, days, sign=1):
+        """Count ({date: [session ids]}) as one more itinerary, or one fewer with sign=-1"""
+        with self._lock:
+            for date, ids in (days or {}).items():
+                self.totals[date] = self.totals.get(date, 0) + sign
+                planned = self.planned.setdefault(date, {})
+                for session_id in ids:
+                    planned[session_id] = planned.get(session_id, 0) + sign
+
+    def ignore(self, share_id):
+        """Never count this share, e.g. because its attendee's own plan is already counted"""
+        with self._lock:
+            self._counted.add(share_id)
+
+    def add(self, entry):
+        """Count a community share once; returns False if it was counted, ignored or lists no session ids"""
+        with self._lock:
+            if entry["id"] in self._counted or not entry.get("session_ids"):
+                return False
+            self._counted.add(entry["id"])
+        self.record(entry["session_ids"])
+        return True
+
+    def predicted(self, date, session_id):
+        """Attendees expected at a session"""
+        planned = self.planned.get(date, {}).get(session_id, 0)
+        if not planned:
+            return 0.0
+        return planned / max(self.totals.get(date, 0), self.min_itineraries) * self.visitors_per_day
+
+    def occupancy(self, date, session):
+        """Predicted attendance over the session venue's seats, or None if its capacity is unknown"""
+        capacity = self.capacities.get(session.venue)
+        if not capacity:
+            return None
+        return self.predicted(date, session.id) / capacity
+
+    def penalties(self, day, ids):
+        """Congestion penalty for each of the given day-local session ids"""
+        penalties = np.zeros(len(ids))
+        for k, i in enumerate(ids):
+            occupancy = self.occupancy(day.date, day.sessions[i])
+            if occupancy is not None and occupancy > CONGESTION_THRESHOLD:
+                penalties[k] = CONGESTION_WEIGHT * (occupancy - CONGESTION_THRESHOLD)
+        return penalties
+
+    def adjust(self, day, ids, scores):
+        """Scores lowered by each session's congestion penalty, each keeping CONGESTION_FLOOR of itself"""
+        scores = np.asarray(scores, dtype=float)
+        return np.where(scores > 0, np.maximum(scores - self.penalties(day, ids), scores * CONGESTION_FLOOR), scores)
@@ -0,0 +1,83 @@
+"""
+Expo exhibitors
+Exhibitor records with pavilion and focus-tag indexes for faceted filtering and interest ranking
+"""
+
+from collections import Counter
+
+
+def exhibitors_from_event(event_data):
+    """Exhibitor records from the event data, one per pavilion when it lists no exhibitors"""
+    exhibitors = event_data.get("exhibitors")
+    if exhibitors:
+        return exhibitors
+    return [
+        {
+            "id": f"pavilion-{i + 1}",
+            "name": pavilion["name"],
+            "pavilion": pavilion["name"],
+            "focus": list(pavilion.get("focus", [])),
+            "booth": "",
+        }
+        for i, pavilion in enumerate(event_data.get("expo_pavilions", []))
+    ]
+
+
+class ExhibitorCatalog:
+    """
+    Exhibitors indexed by pavilion and by focus tag
+
+    A filter is answered from the precomputed id sets: values within a facet are
+    unioned, facets are intersected starting from the smallest set, so no filter
+    change scans the exhibitor list.
+    """
+
+    def __init__(self, exhibitors):
+        self.exhibitors = list(exhibitors)
+
+        by_pavilion, by_focus = {}, {}
+        for i, exhibitor in enumerate(self.exhibitors):
+            by_pavilion.setdefault(exhibitor.get("pavilion", ""), []).append(i)
+            for tag in set(exhibitor.get("focus", [])):
+                by_focus.setdefault(tag, []).append(i)
+        self.by_pavilion = {name: frozenset(ids) for name, ids in by_pavilion.items()}
+        self.by_focus = {tag: frozenset(ids) for tag, ids in by_focus.items()}
+        self._all = frozenset(range(len(self.exhibitors)))
+
+    def __len__(self):
+        return len(self.exhibitors)
+
+    def pavilions(self):
+        """Pavilion names in first-listed order"""
+        return list(self.by_pavilion)
+
+    def focus_tags(self):
+        """Focus tags, most exhibitors first"""
+        return sorted(self.by_focus, key=lambda tag: (-len(self.by_focus[tag]), tag))
+
+    def filter(self, pavilions=(), focus=()):
+        """Ids of exhibitors in any of the pavilions and with any of the focus tags"""
+        facets = []
+        for index, values in ((self.by_pavilion, pavilions), (self.by_focus, focus)):
+            if values:
+                facets.append(frozenset().union(*(index.get(value, ()) for value in values)))
+        if not facets:
+            return self._all
+
+        facets.sort(key=len)
+        ids = facets[0]
+        for other in facets[1:]:
+            ids = ids & other
+        return ids
+
+    def ranked(self, ids, interests=()):
+        """ids ordered by how many of the interests match their focus tags, then catalog order"""
+        overlap = Counter()
+        for interest in set(interests):
+            overlap.update(self.by_focus.get(interest, ()))
+        return sorted(ids, key=lambda i: (-overlap[i], i))
+
+    def page(self, ids, number, size):
+        """Exhibitor records on 1-based page `number` of ids"""
+        start = (number - 1) * size
+        return [self.exhibitors[i] for i in ids[start:start + size]]
@@ -0,0 +1,264 @@
+"""
+Incremental re-scoring
+Keeps per-session score totals for one attendee and updates only what a profile edit touches
+"""
+
+from collections import Counter
+
+import numpy as np
+
+from planner.itinerary import (
+    MAX_SESSIONS_PER_DAY, MIN_BREAK_MINUTES, RETRIEVAL_MIN_SESSIONS, RETRIEVAL_POOL, TRAVEL_PENALTY, Itinerary,
+)
+from planner.metrics import timed
+from planner.scheduler import select_sessions
+from planner.scoring import level_score
+
+GOAL_WEIGHTS = {
+    # family: (score, networking, learning) points per keyword hit
+    "networking": (2.0, 3.0, 0.0),
+    "learning": (2.0, 0.0, 2.0),
+}
+
+
+class _DayState:
+    """
+    Score totals for one day's sessions plus the day's current pick
+
+    basis holds the scores the pick was last made or confirmed against, and changed the
+    local ids of sessions whose score has moved since then.
+    """
+
+    __slots__ = ("scores", "networking", "learning", "basis", "changed", "pool", "chosen", "picked", "dirty")
+
+    def __init__(self, scores, networking, learning):
+        self.scores = scores
+        self.networking = networking
+        self.learning = learning
+        self.basis = None
+        self.changed = []
+        # Local ids picked from, None for the whole day, and a mask of the picked ones
+        self.pool = None
+        self.chosen = None
+        self.picked = ()
+        self.dirty = True
+
+    def add(self, ids, score, networking=None, learning=None):
+        """Shift the totals of the given local ids"""
+        self.scores[ids] += score
+        if networking is not None:
+            self.networking[ids] += networking
+        if learning is not None:
+            self.learning[ids] += learning
+        self.changed.append(ids)
+
+
+def _top_ids(scores, k):
+    """Local ids of the k best scores, best first and ties by id, as ScoringEngine.top_k orders them"""
+    if len(scores) <= k:
+        return np.lexsort((np.arange(len(scores)), -scores))
+    head = np.argpartition(-scores, k - 1)[:k]
+    ids = np.flatnonzero(scores >= scores[head].min())
+    return ids[np.lexsort((ids, -scores[ids]))][:k]
+
+
+class IncrementalScorer:
+    """
+    Scores one attendee's profile and re-scores it edit by edit
+
+    The score is a sum of independent parts (level, topics, goal keywords, speakers), so a
+    changed proficiency only shifts sessions at the affected levels, a changed interest
+    only touches the postings of its related topics, a toggled goal only the sessions with
+    that goal's keywords. Removed days are dropped and only added days are scored from
+    scratch.
+
+    Large days are picked from their RETRIEVAL_POOL best sessions, as generate_itinerary
+    does. A day is picked again only when an edit could change its pick: the pool itself
+    changed, a picked session lost points, or another session gained them. Otherwise the
+    previous pick is still optimal and is kept.
+    """
+
+    def __init__(self, catalog, max_per_day=MAX_SESSIONS_PER_DAY, min_break=MIN_BREAK_MINUTES, travel=None):
+        self.catalog = catalog
+        self.max_per_day = max_per_day
+        self.min_break = min_break
+        self.travel = travel
+        self.proficiency = None
+        self.interests = Counter()
+        self.goals = frozenset()
+        self._days = {}
+
+    def rebase(self, catalog):
+        """Move to a recompiled catalog, keeping the totals of every day whose contents it reuses"""
+        for date, state in list(self._days.items()):
+            old, new = self.catalog.day_token(date), catalog.day_token(date)
+            if new is None or new[1] != old[1]:
+                del self._days[date]
+            elif new[0] != old[0]:
+                state.dirty = True
+        self.catalog = catalog
+
+    def reroute(self, travel):
+        """Switch to new venue travel times; every day is picked again on the next update"""
+        for state in self._days.values():
+            state.dirty = True
+        self.travel = travel
+
+    @timed("incremental_update")
+    def update(self, profile, demand=None):
+        """
+        Bring the stored totals in line with profile and return its Itinerary
+
+        With a DemandModel every day is re-picked against congestion-adjusted scores,
+        since demand moves with other attendees' plans rather than with this profile.
+        """
+        proficiency = profile.get("proficiency", "intermediate")
+        interests = Counter(profile.get("interests", []))
+        goals = frozenset(profile.get("goals", []))
+        days = profile.get("days", list(self.catalog.days))
+
+        for date in [d for d in self._days if d not in days]:
+            del self._days[date]
+
+        for date, state in self._days.items():
+            engine = self.catalog.days[date].engine
+            if proficiency != self.proficiency:
+                self._update_level(engine, state, proficiency)
+            if interests != self.interests:
+                self._update_topics(engine, state, interests)
+            if goals != self.goals:
+                self._update_goals(engine, state, goals)
+
+        for date in days:
+            day = self.catalog.days.get(date)
+            if date not in self._days and day is not None:
+                self._days[date] = _DayState(*day.engine.score(profile))
+
+        self.proficiency = proficiency
+        self.interests = interests
+        self.goals = goals
+        return self._itinerary(days, demand)
+
+    def _update_level(self, engine, state, proficiency):
+        for level, members in zip(engine.levels, engine.level_members):
+            delta = level_score(level, proficiency) - level_score(level, self.proficiency)
+            if delta:
+                state.add(members, delta)
+
+    def _update_topics(self, engine, state, interests):
+        for interest in set(interests) | set(self.interests):
+            change = interests[interest] - self.interests[interest]
+            if not change:
+                continue
+
+            # Every occurrence of an interest adds 1.5 per related topic tag
+            for topic in engine.affinity.topics_for(interest):
+                column = engine.topic_pos.get(topic)
+                if column is None:
+                    continue
+                ids = engine.index.postings[topic]
+                counts = engine.topic_matrix[ids, column]
+                state.add(ids, 1.5 * change * counts, learning=change * counts)
+
+            # An exact topic match adds 4 once, however often the interest repeats
+            was_present, is_present = self.interests[interest] > 0, interests[interest] > 0
+            column = engine.topic_pos.get(interest)
+            if was_present != is_present and column is not None:
+                sign = 1.0 if is_present else -1.0
+                ids = engine.index.postings[interest]
+                counts = engine.topic_matrix[ids, column]
+                state.add(ids, 4.0 * sign * counts, learning=2.0 * sign * counts)
+
+    def _update_goals(self, engine, state, goals):
+        for family, (score, networking, learning) in GOAL_WEIGHTS.items():
+            if (family in goals) == (family in self.goals):
+                continue
+            sign = 1.0 if family in goals else -1.0
+            hits = engine.goal_hits[family]
+            ids = np.flatnonzero(hits)
+            state.add(
+                ids, sign * score * hits[ids],
+                sign * networking * hits[ids] if networking else None,
+                sign * learning * hits[ids] if learning else None,
+            )
+
+    def _itinerary(self, days, demand=None):
+        size = len(self.catalog)
+        scores = np.zeros(size)
+        networking_roi = np.zeros(size)
+        learning_value = np.zeros(size)
+
+        picked_days = {}
+        for date in days:
+            state = self._days.get(date)
+            if state is None:
+                picked_days[date] = ()
+                continue
+
+            day = self.catalog.days[date]
+            span = slice(day.offset, day.offset + len(day.sessions))
+            scores[span], networking_roi[span], learning_value[span] = state.scores, state.networking, state.learning
+
+            if demand is not None:
+                ids = self._pool(day, state.scores)
+                local = range(len(day.sessions)) if ids is None else ids
+                ranking = demand.adjust(day, local, state.scores if ids is None else state.scores[ids])
+                picked_days[date] = self._pick(day, ids, ranking)
+                # The stored pick is the unadjusted one
+                continue
+
+            if self._stale(day, state):
+                state.pool = self._pool(day, state.scores)
+                ranking = state.scores if state.pool is None else state.scores[state.pool]
+                state.picked = self._pick(day, state.pool, ranking)
+                state.chosen = np.zeros(len(day.sessions), dtype=bool)
+                state.chosen[np.array(state.picked, dtype=np.int64) - day.offset] = True
+                state.basis = state.scores.copy()
+                state.changed = []
+                state.dirty = False
+            picked_days[date] = state.picked
+
+        return Itinerary(self.catalog, picked_days, scores, networking_roi, learning_value, self.travel)
+
+    def _stale(self, day, state):
+        """Whether the edits since the last pick could change it"""
+        if state.dirty:
+            return True
+        if not state.changed:
+            return False
+        rows = np.concatenate(state.changed)
+        if state.pool is not None:
+            pool = self._pool(day, state.scores)
+            if not np.array_equal(np.sort(pool), np.sort(state.pool)):
+                return True
+            rows = rows[np.isin(rows, pool)]
+
+        # Raising a picked session or lowering any other only widens the pick's lead
+        before, after = state.basis[rows], state.scores[rows]
+        picked = state.chosen[rows]
+        if np.any(picked & (after < before)) or np.any(~picked & (after > before) & (after > 0)):
+            return True
+        state.basis[rows] = after
+        state.changed = []
+        return False
+
+    def _pool(self, day, scores):
+        """Local ids a large day is picked from, its RETRIEVAL_POOL best; None to pick from the whole day"""
+        if len(day.sessions) >= RETRIEVAL_MIN_SESSIONS:
+            return _top_ids(scores, RETRIEVAL_POOL)
+        return None
+
+    def _pick(self, day, ids, scores):
+        """Global ids picked from the local ids (None for all) given their scores"""
+        intervals = day.intervals if ids is None else [day.intervals[i] for i in ids]
+        if self.travel is None:
+            picked = select_sessions(intervals, scores, self.max_per_day, self.min_break)
+        else:
+            nodes = self.travel.day_nodes(day)
+            picked = select_sessions(
+                intervals, scores, self.max_per_day, self.min_break,
+                nodes if ids is None else nodes[ids], self.travel.minutes, TRAVEL_PENALTY,
+            )
+        if ids is not None:
+            picked = [int(ids[p]) for p in picked]
+        return tuple(day.offset + p for p in picked)
@@ -0,0 +1,97 @@
+"""
+Itinerary generation
+Scores a compiled catalog for one profile and picks a conflict-free schedule per day
+"""
+
+import numpy as np
+
+from planner.scheduler import select_sessions
+
+MAX_SESSIONS_PER_DAY = 5
+MIN_BREAK_MINUTES = 0
+
+# Days larger than this are scored through top-k retrieval instead of exhaustively
+RETRIEVAL_MIN_SESSIONS = 2000
+# Candidates kept per day for the interval scheduler when retrieval is used
+RETRIEVAL_POOL = 100
+# Score points a pick gives up per minute of travel from the previous session's venue
+TRAVEL_PENALTY = 0.05
+
+
+class Itinerary:
+    """
+    Picked session indices per day
+
+    Scores live in arrays parallel to catalog.sessions instead of on copied session
+    dicts; entries for sessions that were never scored stay at zero.
+    """
+
+    __slots__ = ("catalog", "days", "scores", "networking_roi", "learning_value", "travel")
+
+    def __init__(self, catalog, days, scores, networking_roi, learning_value, travel=None):
+        self.catalog = catalog
+        self.days = days
+        self.scores = scores
+        self.networking_roi = networking_roi
+        self.learning_value = learning_value
+        # The TravelTimes the picks were routed with
+        self.travel = travel
+
+    def sessions(self, day):
+        """Session records picked for a day, in chronological order"""
+        return [self.catalog.sessions[i] for i in self.days.get(day, ())]
+
+
+def rebase_itinerary(itinerary, catalog, travel=None):
+    """itinerary bound to a recompiled catalog if that reuses all of its days and routing, otherwise None"""
+    if itinerary.travel is not travel:
+        return None
+    for date in itinerary.days:
+        if catalog.day_token(date) != itinerary.catalog.day_token(date):
+            return None
+    return Itinerary(
+        catalog, itinerary.days, itinerary.scores, itinerary.networking_roi, itinerary.learning_value, travel,
+    )
+
+
+def generate_itinerary(catalog, profile, max_per_day=None, min_break=0, demand=None, travel=None):
+    """
+    Generate personalized itinerary with ROI scoring and no overlapping sessions
+
+    Given a DemandModel, sessions predicted to fill their venue are picked as if they
+    scored lower; the itinerary still reports their unpenalized scores. Given
+    TravelTimes, back-to-back picks must leave time to reach the next venue, and each
+    minute of travel costs TRAVEL_PENALTY.
+    """
+    available_days = profile.get("days", list(catalog.days))
+
+    scores = np.zeros(len(catalog))
+    networking_roi = np.zeros(len(catalog))
+    learning_value = np.zeros(len(catalog))
+
+    picked_days = {}
+    for date in available_days:
+        day = catalog.days.get(date)
+        if day is None or not day.sessions:
+            picked_days[date] = ()
+            continue
+
+        if len(day.sessions) >= RETRIEVAL_MIN_SESSIONS:
+            ids, day_scores, day_networking, day_learning = day.engine.top_k(profile, RETRIEVAL_POOL)
+        else:
+            ids = range(len(day.sessions))
+            day_scores, day_networking, day_learning = day.engine.score(profile)
+
+        rows = day.offset + np.asarray(ids, dtype=np.int64)
+        scores[rows], networking_roi[rows], learning_value[rows] = day_scores, day_networking, day_learning
+
+        intervals = [day.intervals[i] for i in ids]
+        ranking = demand.adjust(day, ids, day_scores) if demand is not None else day_scores
+        if travel is not None:
+            nodes = travel.day_nodes(day)[np.asarray(ids, dtype=np.int64)]
+            picked = select_sessions(intervals, ranking, max_per_day, min_break, nodes, travel.minutes, TRAVEL_PENALTY)
+        else:
+            picked = select_sessions(intervals, ranking, max_per_day, min_break)
+        picked_days[date] = tuple(day.offset + int(ids[p]) for p in picked)
+
+    return Itinerary(catalog, picked_days, scores, networking_roi, learning_value, travel)
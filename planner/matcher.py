@@ -0,0 +1,63 @@
+"""
+Multi-keyword matching
+An Aho-Corasick automaton that finds every keyword of every family in one pass over the text
+"""
+
+from collections import deque
+
+
+class KeywordMatcher:
+    """
+    Matches many keyword families at once with the same semantics as `keyword in text`
+
+    Families map a name to a list of keywords; adding families grows the automaton but
+    never adds another scan of the text.
+    """
+
+    def __init__(self, families):
+        self.families = {name: list(keywords) for name, keywords in families.items()}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [set()]
+
+        for family, keywords in self.families.items():
+            for keyword in keywords:
+                node = 0
+                for ch in keyword:
+                    child = self._goto[node].get(ch)
+                    if child is None:
+                        child = len(self._goto)
+                        self._goto[node][ch] = child
+                        self._goto.append({})
+                        self._fail.append(0)
+                        self._out.append(set())
+                    node = child
+                self._out[node].add((family, keyword))
+
+        # Breadth-first pass to link each state to its longest proper suffix state
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child] |= self._out[self._fail[child]]
+
+        self._out = [frozenset(out) for out in self._out]
+
+    def find(self, text):
+        """Return the set of (family, keyword) pairs occurring anywhere in text"""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = set(out[0])
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                hits |= out[node]
+        return frozenset(hits)
+
@@ -0,0 +1,190 @@
+"""
+Stage timing instrumentation
+Counts and latency histograms per stage and per rerun, plus gauges, exportable as Prometheus text
+"""
+
+import functools
+import os
+import threading
+import time
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class StageStats:
+    """Cumulative histogram for one stage"""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+
+class MetricsRegistry:
+    """
+    Process-wide stage timings
+
+    When disabled, timed wrappers reduce to a single attribute check before calling
+    through, so instrumentation can stay in place in production.
+    """
+
+    def __init__(self, enabled=False, export_path=None, export_interval=10.0):
+        self.enabled = enabled
+        self.export_path = export_path
+        self.export_interval = export_interval
+        self._stages = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._last_export = 0.0
+
+    def observe(self, stage, seconds):
+        """Record one timing for a stage, and into the current rerun if one is open"""
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = StageStats()
+            stats.observe(seconds)
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is not None:
+            count, total = rerun.get(stage, (0, 0.0))
+            rerun[stage] = (count + 1, total + seconds)
+
+    def set_gauge(self, name, value):
+        """Record the current value of a level such as a queue depth"""
+        if self.enabled:
+            with self._lock:
+                self._gauges[name] = value
+
+    def gauges(self):
+        """Copy of the current gauge values"""
+        with self._lock:
+            return dict(self._gauges)
+
+    def timed(self, stage):
+        """Decorator that records the wrapped function's latency under `stage`"""
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.observe(stage, time.perf_counter() - started)
+            return wrapper
+        return decorator
+
+    def fragment(self, stage):
+        """
+        Decorator for a Streamlit fragment: times it under `stage` like timed
+
+        Inside a full script run the fragment is one more stage of that rerun. When it
+        reruns on its own (an interaction inside it, or run_every) no rerun is open, so
+        it opens one and closes it when the fragment returns or raises. That run's total
+        goes to fragment_rerun/<stage> rather than rerun, so frequent polls such as a
+        run_every watcher do not dilute the full-rerun timings.
+        """
+        def decorator(fn):
+            stage_fn = self.timed(stage)(fn)
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or getattr(self._local, "rerun", None) is not None:
+                    return stage_fn(*args, **kwargs)
+                self.start_rerun()
+                try:
+                    return stage_fn(*args, **kwargs)
+                finally:
+                    self.finish_rerun(f"fragment_rerun/{stage}")
+            return wrapper
+        return decorator
+
+    def start_rerun(self):
+        """Begin collecting per-stage totals for the script run on this thread"""
+        if self.enabled:
+            self._local.rerun = {}
+            self._local.rerun_started = time.perf_counter()
+
+    def finish_rerun(self, stage="rerun"):
+        """Close the current rerun, record its total under `stage` and return its per-stage (count, seconds)"""
+        rerun = getattr(self._local, "rerun", None)
+        if not self.enabled or rerun is None:
+            return {}
+        self._local.rerun = None
+        self.observe(stage, time.perf_counter() - self._local.rerun_started)
+        self.maybe_export()
+        return rerun
+
+    def current_rerun(self):
+        """Per-stage (count, seconds) recorded so far in this thread's rerun"""
+        return dict(getattr(self._local, "rerun", None) or {})
+
+    def snapshot(self):
+        """Copy of the cumulative stats as plain dicts"""
+        with self._lock:
+            return {
+                stage: {
+                    "count": stats.count,
+                    "total": stats.total,
+                    "max": stats.max,
+                    "buckets": list(stats.buckets),
+                }
+                for stage, stats in self._stages.items()
+            }
+
+    def prometheus_text(self):
+        """Render all stage histograms and gauges in the Prometheus text exposition format"""
+        lines = [
+            "# HELP planner_stage_seconds Time spent in each app stage",
+            "# TYPE planner_stage_seconds histogram",
+        ]
+        for stage, stats in sorted(self.snapshot().items()):
+            cumulative = 0
+            for bound, count in zip(BUCKETS, stats["buckets"]):
+                cumulative += count
+                lines.append(f'planner_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'planner_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {stats["count"]}')
+            lines.append(f'planner_stage_seconds_sum{{stage="{stage}"}} {stats["total"]:.9f}')
+            lines.append(f'planner_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+        lines.append("# HELP planner_gauge Current value of an app level, e.g. a queue depth")
+        lines.append("# TYPE planner_gauge gauge")
+        for name, value in sorted(self.gauges().items()):
+            lines.append(f'planner_gauge{{name="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def maybe_export(self, force=False):
+        """Write the Prometheus file at most once per export_interval seconds"""
+        if not self.export_path:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_export < self.export_interval:
+            return
+        self._last_export = now
+        tmp_path = f"{self.export_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, self.export_path)
+
+
+REGISTRY = MetricsRegistry(
+    enabled=os.environ.get("PLANNER_METRICS", "") == "1",
+    export_path=os.environ.get("PLANNER_METRICS_FILE"),
+)
+timed = REGISTRY.timed
+fragment = REGISTRY.fragment
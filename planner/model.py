@@ -0,0 +1,196 @@
+"""
+Compiled event model
+Turns the raw event_data.json document into immutable records built once at load
+"""
+
+from planner.scheduler import parse_time_range
+from planner.scoring import ScoringEngine, count_vip_speakers, keyword_hits
+from planner.topic_index import InterestAffinity
+
+
+class Session:
+    """Immutable, pre-parsed session record"""
+
+    __slots__ = (
+        "index", "id", "date", "day_name", "theme",
+        "title", "time", "start", "end", "venue", "track", "level",
+        "topics", "topic_list", "speakers", "description", "search_text",
+        "keyword_hits", "vip_speakers", "is_vip",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return _rebuild, (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        return f"Session({self.id!r}, {self.title!r})"
+
+
+def _rebuild(cls, values):
+    # Positional and without keyword unpacking: snapshots restore tens of thousands of these
+    record = object.__new__(cls)
+    for name, value in zip(cls.__slots__, values):
+        object.__setattr__(record, name, value)
+    return record
+
+
+def _reindexed(session, index):
+    fields = {name: getattr(session, name) for name in Session.__slots__}
+    fields["index"] = index
+    return Session(**fields)
+
+
+class DaySchedule:
+    """One day of the schedule: its sessions, their intervals and a scoring engine"""
+
+    __slots__ = (
+        "date", "day_name", "theme", "highlights", "offset", "sessions", "intervals", "engine", "source", "__weakref__",
+    )
+
+    def __init__(self, date, day_name, theme, highlights, offset, sessions, affinity=None, engine=None, source=None):
+        self.date = date
+        self.day_name = day_name
+        self.theme = theme
+        self.highlights = highlights
+        self.offset = offset
+        self.sessions = sessions
+        self.intervals = [
+            (s.start, s.end) if s.start is not None else None for s in sessions
+        ]
+        # The engine only sees day-local ids, so a moved but unchanged day can keep it
+        self.engine = engine if engine is not None else ScoringEngine(sessions, affinity)
+        # The raw daily_schedule entry this day was compiled from
+        self.source = source
+
+    @property
+    def indices(self):
+        """Global session indices covered by this day"""
+        return range(self.offset, self.offset + len(self.sessions))
+
+
+class Catalog:
+    """All compiled sessions, numbered globally and partitioned into contiguous days"""
+
+    __slots__ = ("sessions", "days", "affinity")
+
+    def __init__(self, sessions, days, affinity):
+        self.sessions = sessions
+        self.days = days
+        self.affinity = affinity
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def day_token(self, date):
+        """(offset, scoring engine) of a day, or None; equal tokens mean identical compiled days"""
+        day = self.days.get(date)
+        if day is None:
+            return None
+        return (day.offset, day.engine)
+
+
+def compile_session(raw, index, date, day_data):
+    """Build a Session record from one raw session dict"""
+    interval = parse_time_range(raw.get("time", ""))
+    title = raw.get("title", "")
+    description = raw.get("description", "")
+    topic_list = tuple(raw.get("topics", []))
+    speakers = tuple(raw.get("speakers", []))
+    level = raw.get("level", "all")
+    search_text = (description + " " + title).lower()
+    return Session(
+        index=index,
+        id=raw.get("id", f"{date}-{index}"),
+        date=date,
+        day_name=day_data.get("day", ""),
+        theme=day_data.get("theme", ""),
+        title=title,
+        time=raw.get("time", "TBA"),
+        start=interval[0] if interval else None,
+        end=interval[1] if interval else None,
+        venue=raw.get("venue"),
+        track=raw.get("track", ""),
+        level=level,
+        topics=frozenset(topic_list),
+        topic_list=topic_list,
+        speakers=speakers,
+        description=description,
+        search_text=search_text,
+        keyword_hits=keyword_hits(search_text),
+        vip_speakers=count_vip_speakers(speakers),
+        is_vip=level == "advanced" and bool(speakers),
+    )
+
+
+def compile_event(event_data, interests=(), previous=None):
+    """
+    Compile event_data.json's daily schedule into a Catalog
+
+    interests pre-resolves extra interest terms (e.g. the wizard's options) in the
+    shared interest -> topic affinity table. With a previous Catalog, days whose raw
+    entry is the very same object as before are reused: as-is when their offset is
+    unchanged, otherwise renumbered around the same scoring engine.
+    """
+    schedule = event_data.get("daily_schedule", {})
+    reusable = {}
+    if previous is not None:
+        reusable = {
+            date: day for date, day in previous.days.items()
+            if day.source is not None and schedule.get(date) is day.source
+        }
+        if len(reusable) == len(previous.days) and list(previous.days) == list(schedule):
+            return previous
+
+    compiled = {}
+    offsets = {}
+    sessions = []
+    for date, day_data in schedule.items():
+        offset = offsets[date] = len(sessions)
+        old = reusable.get(date)
+        if old is not None and old.offset == offset:
+            compiled[date] = old.sessions
+        elif old is not None:
+            compiled[date] = tuple(_reindexed(s, offset + i) for i, s in enumerate(old.sessions))
+        else:
+            compiled[date] = tuple(
+                compile_session(raw, offset + i, date, day_data)
+                for i, raw in enumerate(day_data.get("sessions", []))
+            )
+        sessions.extend(compiled[date])
+
+    category_keywords = [
+        kw for category in event_data.get("interest_categories", {}).values()
+        for kw in category.get("keywords", [])
+    ]
+    affinity = InterestAffinity(
+        [t for s in sessions for t in s.topics],
+        list(interests) + category_keywords,
+    )
+
+    days = {}
+    for date, day_data in schedule.items():
+        old = reusable.get(date)
+        if old is not None and old.offset == offsets[date]:
+            days[date] = old
+            continue
+        days[date] = DaySchedule(
+            date,
+            day_data.get("day", ""),
+            day_data.get("theme", ""),
+            tuple(day_data.get("highlights", [])),
+            offsets[date],
+            compiled[date],
+            affinity,
+            engine=old.engine if old is not None else None,
+            source=day_data,
+        )
+    return Catalog(tuple(sessions), days, affinity)
@@ -0,0 +1,103 @@
+"""
+Session popularity
+Per-day attendee counts for each session, kept current as schedules are shared, plus a trending window
+"""
+
+import heapq
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from planner.community_store import CommunityReader
+
+# Trending looks back this far, in buckets of BUCKET_SECONDS that expire whole
+TRENDING_WINDOW = 24 * 3600
+BUCKET_SECONDS = 3600
+
+
+def shared_at_seconds(entry):
+    """Epoch seconds of a share's shared_at, or None if it has none or it does not parse"""
+    try:
+        return datetime.fromisoformat(entry["shared_at"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class PopularityCounter(CommunityReader):
+    """
+    How many shared schedules include each session
+
+    Counts are keyed by day and session id and bumped once per share, at the cost of the
+    sessions in that share, so reading one is a dict lookup. Shares already counted are
+    skipped by id, which lets the app record its own shares as they are submitted and
+    still catch up from the store afterwards. The trending window keeps one counter per
+    hour of shared_at and drops whole hours as they fall out of the window.
+    """
+
+    def __init__(self, window=TRENDING_WINDOW, bucket_seconds=BUCKET_SECONDS, clock=time.time):
+        self.window = window
+        self.bucket_seconds = bucket_seconds
+        self.clock = clock
+        self.counts = {}
+        self._counted = set()
+        self._buckets = {}
+        self._trending = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_store(cls, store, **kwargs):
+        """Counter rebuilt from every share in a community store"""
+        counter = cls(**kwargs)
+        counter.update(store.load_after(0))
+        return counter
+
+    def __len__(self):
+        return len(self._counted)
+
+    def count(self, date, session_id):
+        """Shares that include a session"""
+        return self.counts.get(date, {}).get(session_id, 0)
+
+    def _first_bucket(self, now):
+        return int(now // self.bucket_seconds) - self.window // self.bucket_seconds + 1
+
+    def _expire(self, now):
+        first = self._first_bucket(now)
+        for bucket in [b for b in self._buckets if b < first]:
+            for key, shares in self._buckets.pop(bucket).items():
+                left = self._trending[key] - shares
+                if left:
+                    self._trending[key] = left
+                else:
+                    del self._trending[key]
+
+    def add(self, entry):
+        """Count one share; returns False if its id was already counted or it lists no session ids"""
+        sessions = entry.get("session_ids") or {}
+        with self._lock:
+            if entry["id"] in self._counted or not sessions:
+                return False
+            self._counted.add(entry["id"])
+            keys = []
+            for date, ids in sessions.items():
+                day = self.counts.setdefault(date, {})
+                for session_id in ids:
+                    day[session_id] = day.get(session_id, 0) + 1
+                    keys.append((date, session_id))
+
+            shared_at = shared_at_seconds(entry)
+            now = self.clock()
+            self._expire(now)
+            if shared_at is not None and int(shared_at // self.bucket_seconds) >= self._first_bucket(now):
+                bucket = self._buckets.setdefault(int(shared_at // self.bucket_seconds), Counter())
+                bucket.update(keys)
+                self._trending.update(keys)
+        return True
+
+    def trending(self, k=5):
+        """Up to k (date, session id, shares) most often included in shares within the window, most first"""
+        with self._lock:
+            self._expire(self.clock())
+            top = heapq.nlargest(k, self._trending.items(), key=lambda item: (item[1], item[0]))
+        return [(date, session_id, shares) for (date, session_id), shares in top]
@@ -0,0 +1,69 @@
+"""
+Attendee profiles
+The wizard's interest and goal options, and the defaults it applies to a finished profile
+"""
+
+INTERESTS = {
+    "Generative AI & LLMs": ["genai", "llm", "foundation-models", "chatgpt"],
+    "AI Safety & Ethics": ["ai-safety", "alignment", "responsible-ai", "ethics"],
+    "Healthcare AI": ["healthcare", "diagnostics", "drug-discovery", "health-equity"],
+    "Enterprise AI": ["enterprise", "automation", "productivity", "business"],
+    "Policy & Governance": ["policy", "governance", "regulation", "law"],
+    "Research & Science": ["research", "academic", "papers", "science"],
+    "Startups & Innovation": ["startups", "entrepreneurship", "demos", "funding"],
+    "Education & Skills": ["education", "skills", "learning", "career"],
+    "Climate & Sustainability": ["climate", "sustainability", "energy", "environment"],
+    "Hardware & Infrastructure": ["computing", "hardware", "gpu", "infrastructure"],
+}
+
+GOALS = [
+    ("networking", "Maximize Networking Opportunities", "Meet industry leaders and peers"),
+    ("learning", "Deep Learning & Skill Building", "Attend technical sessions and workshops"),
+    ("business", "Business & Investment Insights", "Explore partnerships and funding"),
+    ("policy", "Policy & Governance Updates", "Understand regulatory landscape"),
+    ("inspiration", "Get Inspired by Innovators", "Hear from visionary speakers"),
+    ("demos", "See Cutting-Edge Demos", "Experience latest AI applications"),
+]
+
+PROFICIENCIES = ["beginner", "intermediate", "advanced"]
+
+
+def interest_keywords():
+    """Every keyword the wizard can put into a profile's interests"""
+    return [kw for keywords in INTERESTS.values() for kw in keywords]
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        separator = ";" if ";" in value else "|" if "|" in value else ","
+        return [part.strip() for part in value.split(separator) if part.strip()]
+    return list(value)
+
+
+def normalize_profile(record, all_days):
+    """
+    Turn a delegate record into a profile the way the wizard would
+
+    Interests may be wizard category names (expanded to their keywords) or raw
+    keywords; list fields may be lists or ';'-, '|'- or ','-separated strings.
+    Columns the wizard doesn't know about are kept as-is.
+    """
+    profile = dict(record)
+
+    interests = []
+    for interest in _as_list(record.get("interests")):
+        interests.extend(INTERESTS.get(interest, [interest]))
+
+    proficiency = (record.get("proficiency") or "intermediate").strip().lower()
+    if proficiency not in PROFICIENCIES:
+        proficiency = "intermediate"
+
+    profile["name"] = record.get("name") or "Attendee"
+    profile["role"] = record.get("role") or "Professional"
+    profile["proficiency"] = proficiency
+    profile["interests"] = interests or ["general"]
+    profile["goals"] = _as_list(record.get("goals")) or ["learning"]
+    profile["days"] = [day for day in _as_list(record.get("days")) if day in all_days] or list(all_days)
+    return profile
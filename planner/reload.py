@@ -0,0 +1,184 @@
+"""
+Event data hot reload
+Watches event_data.json (or a shard manifest), diffs each change and recompiles only the days it touched
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from planner.metrics import timed
+from planner.model import compile_event
+from planner.shards import MANIFEST_NAME, ShardedCatalog
+from planner.snapshot import build_payload, fingerprint, read_snapshot, save_snapshot, snapshot_key
+
+
+def share_unchanged(old, new):
+    """
+    Replace every top-level section and schedule day of new that equals old's with old's object
+
+    Consumers can then tell what changed by identity: a section or day that is the same
+    object as before is untouched, and anything built from it can be kept.
+    """
+    for key, value in new.items():
+        if key != "daily_schedule" and key in old and old[key] == value:
+            new[key] = old[key]
+
+    old_schedule = old.get("daily_schedule", {})
+    schedule = new.get("daily_schedule", {})
+    for date, day in schedule.items():
+        if old_schedule.get(date) == day:
+            schedule[date] = old_schedule[date]
+    if "daily_schedule" in old and schedule == old_schedule:
+        new["daily_schedule"] = old_schedule
+    return new
+
+
+def changed_days(old, new):
+    """Dates whose schedule entry differs between two documents, once share_unchanged has run on new"""
+    old_schedule, schedule = old.get("daily_schedule", {}), new.get("daily_schedule", {})
+    return sorted(d for d in set(old_schedule) | set(schedule) if old_schedule.get(d) is not schedule.get(d))
+
+
+class EventSnapshot:
+    """One loaded version of the event data and the catalog compiled from it"""
+
+    __slots__ = ("version", "data", "catalog", "sections", "changes", "indexes")
+
+    def __init__(self, version, data, catalog, sections, changes=None, indexes=None):
+        self.version = version
+        self.data = data
+        self.catalog = catalog
+        # Content fingerprint per top-level section, for caches that depend on one section only
+        self.sections = sections
+        # {"days": dates changed since the previous snapshot}, None for the first load
+        self.changes = changes
+        # Indexes that came prebuilt with the data, by name (e.g. "search" from a binary snapshot)
+        self.indexes = indexes or {}
+
+
+class EventReloader:
+    """
+    The current EventSnapshot of an event data file
+
+    current() stats the file at most once per check_interval; a changed mtime or size
+    leads to a content hash, and only a changed hash to a reload. The new snapshot is
+    built completely and then replaces the old one in a single assignment, so readers
+    see the old data or the new, never a mix. A file caught mid-write keeps the old
+    snapshot until the next check.
+
+    With a snapshot_path, the first load reads the binary snapshot (see planner.snapshot)
+    there instead of parsing and compiling, as long as it was built from the same file
+    contents; otherwise it compiles as usual and rewrites the snapshot for the next start.
+
+    path may also be a shard directory (see planner.shards); its manifest is watched
+    and days are compiled on first use, max_resident_sessions bounding how many stay.
+    """
+
+    def __init__(self, path, interests=(), check_interval=2.0, max_resident_sessions=None, snapshot_path=None):
+        self.path = path
+        self.sharded = os.path.isdir(path)
+        self.watched = os.path.join(path, MANIFEST_NAME) if self.sharded else path
+        self.interests = tuple(interests)
+        self.check_interval = check_interval
+        self.max_resident_sessions = max_resident_sessions
+        self.snapshot_path = None if self.sharded else snapshot_path
+        self.snapshot = None
+        self.reloads = 0
+        self._stat = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self.current()
+
+    def current(self):
+        """Latest snapshot, reloading first if the file has changed"""
+        if self.snapshot is not None and time.monotonic() - self._checked < self.check_interval:
+            return self.snapshot
+        with self._lock:
+            if self.snapshot is None or time.monotonic() - self._checked >= self.check_interval:
+                self._refresh()
+                self._checked = time.monotonic()
+        return self.snapshot
+
+    def _refresh(self):
+        stat = os.stat(self.watched)
+        if (stat.st_mtime_ns, stat.st_size) == self._stat:
+            return
+        with open(self.watched, "rb") as f:
+            raw = f.read()
+        version = hashlib.sha256(raw).hexdigest()
+        if self.snapshot is None or version != self.snapshot.version:
+            try:
+                snapshot = self._load(raw, version)
+            except ValueError:
+                if self.snapshot is None:
+                    raise
+                return
+            self.snapshot = snapshot
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+
+    @timed("load_event_data")
+    def _load(self, raw, version):
+        previous = self.snapshot
+        key = None
+        if previous is None and self.snapshot_path is not None:
+            key = snapshot_key(version, self.interests)
+            payload = read_snapshot(self.snapshot_path, key)
+            if payload is not None:
+                return EventSnapshot(
+                    version, payload["data"], payload["catalog"], payload["sections"],
+                    indexes={"search": payload["search"]},
+                )
+
+        data = json.loads(raw)
+        if self.sharded:
+            return self._load_shards(data, version, previous)
+        if previous is None:
+            catalog = compile_event(data, interests=self.interests)
+            sections = {name: fingerprint(value) for name, value in data.items()}
+            snapshot = EventSnapshot(version, data, catalog, sections)
+            if key is not None:
+                # A stale snapshot is rebuilt off the loading path, so this start is no slower than plain JSON
+                threading.Thread(target=self._save_snapshot, args=(key, snapshot), daemon=True).start()
+            return snapshot
+
+        data = share_unchanged(previous.data, data)
+        sections = {
+            key: previous.sections[key] if previous.data.get(key) is value else fingerprint(value)
+            for key, value in data.items()
+        }
+        catalog = compile_event(data, interests=self.interests, previous=previous.catalog)
+        self.reloads += 1
+        return EventSnapshot(version, data, catalog, sections, {"days": changed_days(previous.data, data)})
+
+    def _save_snapshot(self, key, snapshot):
+        payload = build_payload(snapshot.data, catalog=snapshot.catalog, sections=snapshot.sections)
+        snapshot.indexes["search"] = payload["search"]
+        save_snapshot(self.snapshot_path, key, payload)
+
+    def _load_shards(self, manifest, version, previous):
+        catalog = ShardedCatalog(
+            self.path, self.interests, self.max_resident_sessions, manifest=manifest,
+            previous=previous.catalog if previous is not None else None,
+        )
+        data = catalog.data
+        # The schedule is fingerprinted by its day hashes rather than by content nobody has loaded
+        day_hashes = [(date, catalog.entries[date]["sha256"]) for date in catalog.dates]
+        if previous is None:
+            sections = {key: fingerprint(value) for key, value in data.items()}
+            sections["daily_schedule"] = fingerprint(day_hashes)
+            return EventSnapshot(version, data, catalog, sections)
+
+        data = share_unchanged(previous.data, data)
+        sections = {
+            key: previous.sections[key] if previous.data.get(key) is value else fingerprint(value)
+            for key, value in data.items()
+        }
+        sections["daily_schedule"] = fingerprint(day_hashes)
+        old_entries = previous.catalog.entries
+        dates = set(old_entries) | set(catalog.entries)
+        changes = {"days": sorted(d for d in dates if old_entries.get(d) != catalog.entries.get(d))}
+        self.reloads += 1
+        return EventSnapshot(version, data, catalog, sections, changes)
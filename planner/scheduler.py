@@ -0,0 +1,183 @@
+"""
+Conflict-aware session selection
+Picks the highest-scoring set of sessions per day that an attendee can actually attend
+"""
+
+from itertools import chain
+
+import numpy as np
+
+
+def parse_time_range(text):
+    """Parse '10:00 - 11:30' into minutes since midnight, or None if it can't be read"""
+    try:
+        start_text, end_text = text.split("-")
+        start_hour, start_minute = start_text.strip().split(":")
+        end_hour, end_minute = end_text.strip().split(":")
+        start = int(start_hour) * 60 + int(start_minute)
+        end = int(end_hour) * 60 + int(end_minute)
+    except (AttributeError, ValueError):
+        return None
+    if end <= start:
+        return None
+    return start, end
+
+
+def select_sessions(intervals, scores, max_sessions=None, min_break=0, nodes=None, travel=None, travel_penalty=0.0):
+    """
+    Weighted interval scheduling over one day
+
+    Returns the indices of the non-overlapping sessions with the highest total score,
+    in chronological order. Consecutive picks are at least min_break minutes apart and
+    at most max_sessions are returned. Sessions without a known time or with a
+    non-positive score are never picked.
+
+    Given each session's venue node and a matrix of travel minutes between nodes,
+    consecutive picks must also leave time to get from one venue to the next, and each
+    such trip costs travel_penalty points per minute.
+    """
+    scores = np.asarray(scores, dtype=float)
+    # Unknown times become empty intervals, which are never candidates
+    bounds = np.fromiter(
+        chain.from_iterable(interval or (0, 0) for interval in intervals), dtype=float, count=2 * len(intervals),
+    ).reshape(-1, 2)
+    candidates = np.flatnonzero((bounds[:, 1] > bounds[:, 0]) & (scores > 0))
+    candidates = candidates[np.argsort(bounds[candidates, 1], kind="stable")]
+    if not len(candidates) or max_sessions == 0:
+        return []
+
+    if travel is not None:
+        picked = _best_routed(
+            candidates.tolist(), intervals, scores, nodes, travel, min_break,
+            max_sessions or len(candidates), travel_penalty,
+        )
+        picked.sort(key=lambda i: intervals[i][0])
+        return picked
+
+    ends = bounds[candidates, 1]
+    weights = scores[candidates]
+    # previous[j]: how many candidates finish early enough to precede candidate j
+    previous = np.searchsorted(ends, bounds[candidates, 0] - min_break, side="right")
+
+    if max_sessions is None or max_sessions >= len(candidates):
+        picked = _best_unbounded(candidates.tolist(), weights.tolist(), previous.tolist())
+    else:
+        picked = _best_bounded(candidates, weights, previous, max_sessions)
+
+    picked.sort(key=lambda i: intervals[i][0])
+    return picked
+
+
+def _best_unbounded(candidates, weights, previous):
+    """Classic O(n) DP once candidates are sorted by end time"""
+    n = len(candidates)
+    best = [0.0] * (n + 1)
+    for j in range(1, n + 1):
+        take = weights[j - 1] + best[previous[j - 1]]
+        best[j] = take if take > best[j - 1] else best[j - 1]
+
+    picked = []
+    j = n
+    while j > 0:
+        if best[j] == best[j - 1]:
+            j -= 1
+        else:
+            picked.append(candidates[j - 1])
+            j = previous[j - 1]
+    return picked
+
+
+def _best_bounded(candidates, weights, previous, max_sessions):
+    """
+    O(n * max_sessions) DP where best[c][j] uses at most c of the first j candidates
+
+    best[c][j] is the larger of best[c][j - 1] and candidate j's weight plus
+    best[c - 1][previous[j]], so each row is one cumulative max over the row before.
+    """
+    best = [np.zeros(len(candidates) + 1)]
+    for _ in range(max_sessions):
+        best.append(np.maximum.accumulate(np.concatenate(([0.0], weights + best[-1][previous]))))
+
+    picked = []
+    c, j = max_sessions, len(candidates)
+    while c > 0 and j > 0:
+        # Back to where row c last rose to its current value: the candidate taken there
+        j = int(np.searchsorted(best[c][:j + 1], best[c][j]))
+        if j == 0:
+            break
+        picked.append(int(candidates[j - 1]))
+        j = int(previous[j - 1])
+        c -= 1
+    return picked
+
+
+def _best_routed(candidates, intervals, scores, nodes, travel, min_break, max_sessions, travel_penalty):
+    """
+    Chains of at most max_sessions candidates, built one session longer per round
+
+    Compatibility now depends on both venues, so it is no longer a prefix of the
+    candidates ordered by end time. It still is within each venue: a session at venue v
+    can follow any earlier one at venue u that ends travel[u, v] minutes before it
+    starts. Those prefixes are found once; each round then keeps a running best per
+    venue and takes every candidate's best predecessor over all venues at once.
+    """
+    n = len(candidates)
+    starts = np.array([intervals[i][0] for i in candidates], dtype=float)
+    ends = np.array([intervals[i][1] for i in candidates], dtype=float)
+    weights = np.array([float(scores[i]) for i in candidates])
+    venue = np.array([nodes[i] for i in candidates], dtype=np.int64)
+
+    # Candidates grouped by venue, each group in end order; for every venue u and candidate j,
+    # the position in that order of the last u candidate that can precede j, or a sentinel
+    venues = np.unique(venue)
+    groups = [np.flatnonzero(venue == v) for v in venues]
+    sizes = [len(members) for members in groups]
+    order = np.concatenate(groups)
+    group_of = np.repeat(np.arange(len(groups)), sizes)
+    first = np.cumsum([0] + sizes[:-1])
+    trips = travel[np.ix_(venues, venue)]
+    reachable = np.array([
+        np.searchsorted(ends[members], starts - min_break - trip, side="right")
+        for members, trip in zip(groups, trips)
+    ])
+    lookup = np.where(reachable > 0, first[:, None] + reachable - 1, n)
+    costs = travel_penalty * trips if travel_penalty else 0.0
+    positions = np.arange(n)
+    columns = np.arange(n)
+
+    # best[j]: value of the best chain ending with candidate j using at most the rounds so far;
+    # rounds[r][j]: the candidate before j in that chain after round r, or -1 if j starts it
+    best = weights.copy()
+    rounds = []
+    for _ in range(1, max_sessions):
+        # Running best within each venue group: lifting every group above the ones before it
+        # lets a single cumulative max restart at each group boundary. holder is the candidate
+        # each running best belongs to; both end with the sentinel for "no predecessor"
+        values = best[order]
+        lift = group_of * (values.max() + 1.0)
+        lifted = np.maximum.accumulate(values + lift)
+        running = np.append(lifted - lift, -np.inf)
+        holder = np.append(order[np.maximum.accumulate(np.where(values + lift >= lifted, positions, 0))], -1)
+
+        # value[u, j]: best chain at venue u that j can follow, less the trip from u to j's venue
+        value = running[lookup] - costs
+        choice = np.argmax(value, axis=0)
+        gain = value[choice, columns]
+        previous = np.where(gain > 0, holder[lookup[choice, columns]], -1)
+        extended = weights + np.maximum(gain, 0)
+        if np.array_equal(extended, best):
+            break
+        best = extended
+        rounds.append(previous)
+
+    # Walk back from the best chain's last session through each round's predecessors
+    picked = []
+    j = int(np.argmax(best))
+    for previous in reversed(rounds):
+        picked.append(candidates[j])
+        j = int(previous[j])
+        if j < 0:
+            break
+    else:
+        picked.append(candidates[j])
+    return picked
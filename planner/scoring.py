@@ -0,0 +1,291 @@
+"""
+Session scoring
+The per-session reference scorer and a vectorized engine that scores a whole day at once
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from planner.matcher import KeywordMatcher
+from planner.metrics import timed
+from planner.topic_index import InterestAffinity, TopicIndex
+
+NETWORKING_KEYWORDS = ["networking", "leaders", "ceo", "roundtable", "connect", "meet"]
+LEARNING_KEYWORDS = ["workshop", "tutorial", "deep-dive", "technical", "hands-on"]
+TOP_SPEAKERS = ["sundar", "sam altman", "jensen", "demis", "yann", "dario"]
+
+# Goal keyword columns in the order the engine lays them out
+GOAL_KEYWORDS = [("networking", kw) for kw in NETWORKING_KEYWORDS] + [("learning", kw) for kw in LEARNING_KEYWORDS]
+
+KEYWORD_MATCHER = KeywordMatcher({
+    "networking": NETWORKING_KEYWORDS,
+    "learning": LEARNING_KEYWORDS,
+    "vip": TOP_SPEAKERS,
+})
+
+
+@lru_cache(maxsize=8192)
+def keyword_hits(text):
+    """All (family, keyword) hits in a lowercased text, found in a single pass"""
+    return KEYWORD_MATCHER.find(text)
+
+
+def count_vip_speakers(speakers):
+    """Number of speakers whose name contains one of TOP_SPEAKERS"""
+    return sum(
+        1 for speaker in speakers
+        if any(family == "vip" for family, _ in keyword_hits(speaker.lower()))
+    )
+
+
+@timed("calculate_session_score")
+def calculate_session_score(session, profile):
+    """Calculate relevance score with networking ROI"""
+    score = 0.0
+    networking_score = 0.0
+    learning_score = 0.0
+
+    # Level match
+    session_level = session.get("level", "all")
+    proficiency = profile.get("proficiency", "intermediate")
+    score += level_score(session_level, proficiency)
+
+    # Topic match
+    session_topics = session.get("topics", [])
+    user_interests = profile.get("interests", [])
+
+    for topic in session_topics:
+        if topic in user_interests:
+            score += 4.0
+            learning_score += 2.0
+        for interest in user_interests:
+            if interest in topic or topic in interest:
+                score += 1.5
+                learning_score += 1.0
+
+    # Goal matching
+    session_desc = (session.get("description", "") + " " + session.get("title", "")).lower()
+    hits = keyword_hits(session_desc)
+    user_goals = profile.get("goals", [])
+
+    if "networking" in user_goals:
+        for kw in NETWORKING_KEYWORDS:
+            if ("networking", kw) in hits:
+                networking_score += 3.0
+                score += 2.0
+
+    if "learning" in user_goals:
+        for kw in LEARNING_KEYWORDS:
+            if ("learning", kw) in hits:
+                learning_score += 2.0
+                score += 2.0
+
+    # Speaker bonus (networking potential)
+    if session.get("speakers"):
+        vip_speakers = count_vip_speakers(session["speakers"])
+        score += 1.5 + 5.0 * vip_speakers
+        networking_score += 2.0 + 5.0 * vip_speakers
+
+    # VIP session bonus
+    if session.get("level") == "advanced" and session.get("speakers"):
+        session["is_vip"] = True
+        score += 3.0
+
+    session["networking_roi"] = networking_score
+    session["learning_value"] = learning_score
+
+    return score
+
+
+def level_score(session_level, proficiency):
+    """Points for how well a session level suits the attendee's proficiency"""
+    if session_level == "all":
+        return 3.0
+    if session_level == proficiency:
+        return 5.0
+    if proficiency == "intermediate":
+        return 2.0
+    if proficiency == "advanced" and session_level == "intermediate":
+        return 3.0
+    return 0.0
+
+
+class ScoringEngine:
+    """
+    Vectorized scorer for a fixed list of compiled sessions
+
+    The session x level, session x topic and session x keyword matrices are built once;
+    scoring a profile is then a handful of matrix-vector products over every session and
+    matches calculate_session_score exactly.
+    """
+
+    def __init__(self, sessions, affinity=None):
+        self.size = len(sessions)
+
+        self.levels = sorted({s.level for s in sessions})
+        level_pos = {level: j for j, level in enumerate(self.levels)}
+        self.level_matrix = np.zeros((self.size, len(self.levels)))
+
+        self.topics = sorted({t for s in sessions for t in s.topic_list})
+        self.topic_pos = {topic: j for j, topic in enumerate(self.topics)}
+        self.topic_matrix = np.zeros((self.size, len(self.topics)))
+        self.affinity = affinity if affinity is not None else InterestAffinity(self.topics)
+        self.index = TopicIndex(sessions)
+
+        # One column per goal keyword list entry, networking keywords first
+        self.keyword_matrix = np.zeros((self.size, len(GOAL_KEYWORDS)))
+
+        self.base_score = np.zeros(self.size)
+        self.base_networking = np.zeros(self.size)
+
+        for i, session in enumerate(sessions):
+            self.level_matrix[i, level_pos[session.level]] = 1.0
+            for topic in session.topic_list:
+                self.topic_matrix[i, self.topic_pos[topic]] += 1.0
+
+            for j, hit in enumerate(GOAL_KEYWORDS):
+                if hit in session.keyword_hits:
+                    self.keyword_matrix[i, j] = 1.0
+
+            if session.speakers:
+                self.base_score[i] += 1.5 + 5.0 * session.vip_speakers
+                self.base_networking[i] += 2.0 + 5.0 * session.vip_speakers
+            if session.is_vip:
+                self.base_score[i] += 3.0
+
+        self._networking_columns = slice(0, len(NETWORKING_KEYWORDS))
+        self._learning_columns = slice(len(NETWORKING_KEYWORDS), len(GOAL_KEYWORDS))
+
+        # Session ids per level, and goal keyword hit counts per goal family
+        self.level_members = [np.flatnonzero(self.level_matrix[:, j]) for j in range(len(self.levels))]
+        self.goal_hits = {
+            "networking": self.keyword_matrix[:, self._networking_columns].sum(axis=1),
+            "learning": self.keyword_matrix[:, self._learning_columns].sum(axis=1),
+        }
+
+        # For sessions matching none of a profile's topics the score is exactly
+        # base + goal keywords + level, so per goal combination and level we keep the
+        # sessions sorted by that bound and only ever read the head of each list
+        self._bound_orders = {}
+        for networking in (False, True):
+            for learning in (False, True):
+                bound = self.base_score.copy()
+                if networking:
+                    bound += 2.0 * self.goal_hits["networking"]
+                if learning:
+                    bound += 2.0 * self.goal_hits["learning"]
+                self._bound_orders[networking, learning] = [
+                    ids[np.argsort(-bound[ids], kind="stable")] for ids in self.level_members
+                ]
+
+    def _weights(self, profile):
+        """Per-column weight vectors for one profile"""
+        proficiency = profile.get("proficiency", "intermediate")
+        interests = profile.get("interests", [])
+        goals = profile.get("goals", [])
+
+        level_weights = np.array([level_score(level, proficiency) for level in self.levels])
+
+        exact = np.zeros(len(self.topics))
+        for interest in set(interests):
+            j = self.topic_pos.get(interest)
+            if j is not None:
+                exact[j] = 1.0
+
+        partial = np.zeros(len(self.topics))
+        related = set()
+        for interest in interests:
+            topics = self.affinity.topics_for(interest)
+            related.update(topics)
+            for topic in topics:
+                j = self.topic_pos.get(topic)
+                if j is not None:
+                    partial[j] += 1.0
+
+        keyword_score = np.zeros(len(GOAL_KEYWORDS))
+        keyword_networking = np.zeros_like(keyword_score)
+        keyword_learning = np.zeros_like(keyword_score)
+        if "networking" in goals:
+            keyword_score[self._networking_columns] = 2.0
+            keyword_networking[self._networking_columns] = 3.0
+        if "learning" in goals:
+            keyword_score[self._learning_columns] = 2.0
+            keyword_learning[self._learning_columns] = 2.0
+
+        return ProfileWeights(
+            level_weights,
+            4.0 * exact + 1.5 * partial,
+            2.0 * exact + partial,
+            keyword_score,
+            keyword_networking,
+            keyword_learning,
+            related,
+        )
+
+    def _score_rows(self, rows, weights):
+        scores = (
+            self.base_score[rows]
+            + self.level_matrix[rows] @ weights.level
+            + self.topic_matrix[rows] @ weights.topic_score
+            + self.keyword_matrix[rows] @ weights.keyword_score
+        )
+        networking = self.base_networking[rows] + self.keyword_matrix[rows] @ weights.keyword_networking
+        learning = (
+            self.topic_matrix[rows] @ weights.topic_learning
+            + self.keyword_matrix[rows] @ weights.keyword_learning
+        )
+        return scores, networking, learning
+
+    @timed("score_sessions")
+    def score(self, profile):
+        """Return (scores, networking_roi, learning_value) arrays for every session"""
+        return self._score_rows(slice(None), self._weights(profile))
+
+    @timed("score_sessions")
+    def top_k(self, profile, k):
+        """
+        Return (ids, scores, networking_roi, learning_value) for the k best sessions
+
+        Sessions in the inverted-index postings of the profile's related topics are always
+        scored. Every other session's score equals its precomputed bound, so from each
+        level's bound-sorted list only the first k non-matching sessions can make the cut
+        and the rest of the catalog is never touched.
+        """
+        weights = self._weights(profile)
+        goals = profile.get("goals", [])
+        matched = self.index.matching(weights.related)
+
+        candidates = [matched]
+        for order in self._bound_orders["networking" in goals, "learning" in goals]:
+            head = order[:k + len(matched)]
+            candidates.append(head[~np.isin(head, matched)][:k])
+        ids = np.concatenate(candidates)
+
+        if 4 * len(ids) >= self.size:
+            # Broad profiles match most of the day; one dense pass beats gathering rows
+            scores, networking, learning = (part[ids] for part in self._score_rows(slice(None), weights))
+        else:
+            scores, networking, learning = self._score_rows(ids, weights)
+        best = np.lexsort((ids, -scores))[:k]
+        return ids[best], scores[best], networking[best], learning[best]
+
+
+class ProfileWeights:
+    """Weight vectors derived from one profile"""
+
+    __slots__ = (
+        "level", "topic_score", "topic_learning",
+        "keyword_score", "keyword_networking", "keyword_learning", "related",
+    )
+
+    def __init__(self, level, topic_score, topic_learning, keyword_score, keyword_networking,
+                 keyword_learning, related):
+        self.level = level
+        self.topic_score = topic_score
+        self.topic_learning = topic_learning
+        self.keyword_score = keyword_score
+        self.keyword_networking = keyword_networking
+        self.keyword_learning = keyword_learning
+        self.related = related
+
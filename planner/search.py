@@ -0,0 +1,105 @@
+"""
+Session search
+A tokenized inverted index over compiled sessions with BM25 ranking and day/level filters
+"""
+
+import math
+import re
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# BM25 term-frequency saturation and document-length normalization
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text):
+    """Lowercase word tokens of text"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def session_tokens(session):
+    """Searchable tokens of a session: title, description, topics, speakers and venue"""
+    fields = [session.title, session.description, " ".join(session.topic_list), " ".join(session.speakers),
+              session.venue or ""]
+    return tokenize(" ".join(fields))
+
+
+class SessionSearch:
+    """
+    BM25 index over a catalog's sessions, by global session index
+
+    Each posting stores its precomputed BM25 term weight (everything but the idf), so a
+    query is one scatter-add per query term over that term's postings, then a mask for
+    the filters and a partial sort for the top results.
+    """
+
+    def __init__(self, catalog):
+        self.size = len(catalog)
+        postings = {}
+        lengths = np.zeros(self.size)
+        for session in catalog.sessions:
+            tokens = session_tokens(session)
+            lengths[session.index] = len(tokens)
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, tf in counts.items():
+                postings.setdefault(token, ([], []))
+                postings[token][0].append(session.index)
+                postings[token][1].append(tf)
+
+        average = lengths.mean() if self.size else 0.0
+        norms = K1 * (1 - B + B * lengths / average) if average else np.full(self.size, K1)
+        self.postings = {}
+        self.idf = {}
+        for token, (ids, tfs) in postings.items():
+            ids = np.array(ids, dtype=np.int64)
+            tfs = np.array(tfs, dtype=np.float64)
+            self.postings[token] = (ids, tfs * (K1 + 1) / (tfs + norms[ids]))
+            self.idf[token] = math.log(1 + (self.size - len(ids) + 0.5) / (len(ids) + 0.5))
+
+        self.day_slices = {date: slice(day.offset, day.offset + len(day.sessions)) for date, day in catalog.days.items()}
+        levels = np.array([s.level for s in catalog.sessions], dtype=object)
+        self.level_masks = {level: levels == level for level in set(levels)}
+
+    def _mask(self, days, levels):
+        mask = np.ones(self.size, dtype=bool)
+        if days:
+            mask[:] = False
+            for date in days:
+                span = self.day_slices.get(date)
+                if span is not None:
+                    mask[span] = True
+        if levels:
+            level_mask = np.zeros(self.size, dtype=bool)
+            for level in levels:
+                if level in self.level_masks:
+                    level_mask |= self.level_masks[level]
+            mask &= level_mask
+        return mask
+
+    def search(self, query, days=(), levels=(), limit=20):
+        """Top (global session index, score) pairs for query, best first"""
+        terms = [t for t in set(tokenize(query)) if t in self.postings]
+        if not terms:
+            return []
+
+        scores = np.zeros(self.size)
+        for term in terms:
+            ids, weights = self.postings[term]
+            scores[ids] += self.idf[term] * weights
+        if days or levels:
+            scores[~self._mask(days, levels)] = 0.0
+
+        matched = np.flatnonzero(scores)
+        if len(matched) > limit:
+            # Ties at the cut-off go to the earliest sessions so results are stable
+            cutoff = -np.partition(-scores[matched], limit - 1)[limit - 1]
+            above = matched[scores[matched] > cutoff]
+            tied = matched[scores[matched] == cutoff][:limit - len(above)]
+            matched = np.concatenate([above, tied])
+        order = matched[np.lexsort((matched, -scores[matched]))]
+        return [(int(i), float(scores[i])) for i in order]
@@ -0,0 +1,255 @@
+"""
+Sharded event data
+A small manifest plus one file per day, compiled lazily into a Catalog-compatible object
+
+    python -m planner.shards event_data.json event_shards/
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+
+from planner.model import DaySchedule, compile_session
+from planner.topic_index import InterestAffinity
+
+MANIFEST_NAME = "manifest.json"
+SHARD_DIR = "days"
+
+
+def _write_atomic(path, payload):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def split_event(event_data, directory):
+    """
+    Write event_data as per-day shards plus a manifest under directory; returns the manifest
+
+    Shard file names carry their content hash, so a manifest always points at the exact
+    day contents it was written with. The manifest is replaced last. Shards the previous
+    manifest referenced are kept until the next split, because catalogs loaded from it
+    may still compile them before their reloader notices the change; older ones are removed.
+    """
+    os.makedirs(os.path.join(directory, SHARD_DIR), exist_ok=True)
+    try:
+        superseded = read_manifest(directory).get("days", [])
+    except (OSError, ValueError):
+        superseded = []
+    manifest = {key: value for key, value in event_data.items() if key != "daily_schedule"}
+
+    entries = []
+    topics = set()
+    for date, day_data in event_data.get("daily_schedule", {}).items():
+        payload = json.dumps(day_data, sort_keys=True).encode()
+        digest = hashlib.sha256(payload).hexdigest()
+        name = f"{SHARD_DIR}/{date}-{digest[:16]}.json"
+        if not os.path.exists(os.path.join(directory, name)):
+            _write_atomic(os.path.join(directory, name), payload)
+        entries.append({
+            "date": date,
+            "day": day_data.get("day", ""),
+            "theme": day_data.get("theme", ""),
+            "sessions": len(day_data.get("sessions", [])),
+            "sha256": digest,
+            "file": name,
+        })
+        topics.update(t for s in day_data.get("sessions", []) for t in s.get("topics", []))
+
+    manifest["days"] = entries
+    manifest["topics"] = sorted(topics)
+    _write_atomic(os.path.join(directory, MANIFEST_NAME), json.dumps(manifest, indent=2).encode())
+
+    referenced = {os.path.basename(entry["file"]) for entry in entries + superseded}
+    for name in os.listdir(os.path.join(directory, SHARD_DIR)):
+        if name.endswith(".json") and name not in referenced:
+            os.remove(os.path.join(directory, SHARD_DIR, name))
+    return manifest
+
+
+def read_manifest(directory):
+    with open(os.path.join(directory, MANIFEST_NAME), "r") as f:
+        return json.load(f)
+
+
+class _ShardStore:
+    """Compiled days of one manifest, loaded on demand and evicted least recently used first"""
+
+    def __init__(self, directory, entries, offsets, affinity, max_resident_sessions):
+        self.directory = directory
+        self.entries = entries
+        self.offsets = offsets
+        self.affinity = affinity
+        self.max_resident_sessions = max_resident_sessions
+        self.loads = 0
+        self.resident = OrderedDict()
+        self.lock = threading.Lock()
+
+    def day(self, date):
+        with self.lock:
+            day = self.resident.get(date)
+            if day is not None:
+                self.resident.move_to_end(date)
+                return day
+
+        entry = self.entries[date]
+        with open(os.path.join(self.directory, entry["file"]), "r") as f:
+            day_data = json.load(f)
+        offset = self.offsets[date]
+        sessions = tuple(
+            compile_session(raw, offset + i, date, day_data)
+            for i, raw in enumerate(day_data.get("sessions", []))
+        )
+        day = DaySchedule(
+            date,
+            day_data.get("day", ""),
+            day_data.get("theme", ""),
+            tuple(day_data.get("highlights", [])),
+            offset,
+            sessions,
+            self.affinity,
+        )
+
+        with self.lock:
+            # Another thread may have compiled the same day meanwhile; keep the first
+            day = self.resident.setdefault(date, day)
+            self.resident.move_to_end(date)
+            self.loads += 1
+            self._evict()
+        return day
+
+    def _evict(self):
+        if self.max_resident_sessions is None:
+            return
+        resident = sum(len(day.sessions) for day in self.resident.values())
+        while resident > self.max_resident_sessions and len(self.resident) > 1:
+            _, day = self.resident.popitem(last=False)
+            resident -= len(day.sessions)
+
+
+class _ShardDays(Mapping):
+    """date -> DaySchedule, loading the day's shard on access"""
+
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, date):
+        return self._store.day(date)
+
+    def __contains__(self, date):
+        return date in self._store.entries
+
+    def __iter__(self):
+        return iter(self._store.entries)
+
+    def __len__(self):
+        return len(self._store.entries)
+
+
+class _ShardSessions(Sequence):
+    """Global session index -> Session, loading the owning day's shard on access"""
+
+    def __init__(self, store, size):
+        self._store = store
+        self._dates = list(store.entries)
+        self._starts = [store.offsets[date] for date in self._dates]
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        date = self._dates[bisect_right(self._starts, index) - 1]
+        return self._store.day(date).sessions[index - self._store.offsets[date]]
+
+
+class ShardedCatalog:
+    """
+    Catalog over a shard directory, compiling each day only when it is first used
+
+    Session numbering and the interest -> topic affinity come from the manifest, so they
+    match compile_event on the unsharded document and nothing has to be loaded up front.
+    Compiled days are kept in LRU order and the least recently used are evicted once
+    more than max_resident_sessions sessions are resident (the day in use always stays).
+    """
+
+    def __init__(self, directory, interests=(), max_resident_sessions=None, manifest=None, previous=None):
+        self.directory = directory
+        self.manifest = manifest if manifest is not None else read_manifest(directory)
+        self.data = {key: value for key, value in self.manifest.items() if key not in ("days", "topics")}
+        self.entries = {entry["date"]: entry for entry in self.manifest.get("days", [])}
+        self.dates = list(self.entries)
+
+        self.offsets = {}
+        total = 0
+        for date in self.dates:
+            self.offsets[date] = total
+            total += self.entries[date]["sessions"]
+        self.size = total
+
+        category_keywords = [
+            kw for category in self.data.get("interest_categories", {}).values()
+            for kw in category.get("keywords", [])
+        ]
+        self.affinity = InterestAffinity(self.manifest.get("topics", []), list(interests) + category_keywords)
+
+        # The views share the store rather than the catalog, so a dropped catalog is freed at once
+        self._store = _ShardStore(directory, self.entries, self.offsets, self.affinity, max_resident_sessions)
+        self.days = _ShardDays(self._store)
+        self.sessions = _ShardSessions(self._store, total)
+
+        # Days already compiled for an earlier manifest carry over if nothing about them changed
+        if isinstance(previous, ShardedCatalog):
+            # Copied under the old store's lock: requests may still be loading or evicting days in it
+            with previous._store.lock:
+                resident = list(previous._store.resident.items())
+            for date, day in resident:
+                if self.day_token(date) == previous.day_token(date):
+                    self._store.resident[date] = day
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def loads(self):
+        """Shards compiled so far, reloads after eviction included"""
+        return self._store.loads
+
+    def day_token(self, date):
+        """(offset, content hash) of a day, or None; equal tokens mean identical compiled days"""
+        entry = self.entries.get(date)
+        if entry is None:
+            return None
+        return (self.offsets[date], entry["sha256"])
+
+    def resident(self):
+        """Dates currently compiled in memory, least recently used first"""
+        with self._store.lock:
+            return list(self._store.resident)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Split event_data.json into a manifest and per-day shards")
+    parser.add_argument("input", help="event_data.json to split")
+    parser.add_argument("output", help="directory to write manifest.json and days/ into")
+    args = parser.parse_args(argv)
+
+    with open(args.input, "r") as f:
+        manifest = split_event(json.load(f), args.output)
+    print(f"Wrote {len(manifest['days'])} day shards to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Community share queue
+Takes shares off the request path and group-commits them to the community store from one writer thread
+"""
+
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+
+from planner.metrics import REGISTRY
+
+# Tells the writer to stop once everything queued ahead of it is committed
+_STOP = object()
+
+# How long interpreter exit waits for queued shares to be written
+SHUTDOWN_TIMEOUT = 30.0
+
+
+class ShareQueue:
+    """
+    Bounded queue of community shares, drained by a background writer
+
+    submit() returns the share id as soon as the entry is queued. The writer takes the
+    first waiting entry, gathers whatever else arrives within flush_interval (at most
+    max_batch entries) and commits them in one transaction, so a burst of shares costs a
+    few commits instead of one each. A full queue blocks submitters for up to their
+    timeout and then raises queue.Full. Queued entries stay visible through pending()
+    until committed, a failed commit is retried, and close(), also run at interpreter
+    exit, returns only after everything queued has been written.
+    """
+
+    def __init__(self, store, max_batch=100, flush_interval=0.05, max_pending=1000, retry_interval=1.0):
+        self.store = store
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.batches = 0
+        self.errors = 0
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._pending = {}
+        self._submitted = 0
+        self._committed = 0
+        self._closed = False
+        self._done = threading.Condition()
+        self._writer = threading.Thread(target=self._run, name="share-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close, SHUTDOWN_TIMEOUT)
+
+    def submit(self, entry, timeout=5.0):
+        """Queue a share and return its id; raises queue.Full if it could not be queued within timeout"""
+        if self._closed:
+            raise RuntimeError("share queue is closed")
+        with self._done:
+            self._pending[entry["id"]] = entry
+        try:
+            self._queue.put((entry, time.perf_counter()), timeout=timeout)
+        except queue.Full:
+            with self._done:
+                self._pending.pop(entry["id"], None)
+            raise
+        with self._done:
+            self._submitted += 1
+        REGISTRY.set_gauge("share_queue_depth", self._queue.qsize())
+        return entry["id"]
+
+    def pending(self):
+        """Entries queued or being committed, oldest first"""
+        with self._done:
+            return sorted(self._pending.values(), key=lambda entry: entry.get("shared_at", ""))
+
+    def depth(self):
+        """Entries waiting for the writer"""
+        return self._queue.qsize()
+
+    def flush(self, timeout=None):
+        """Wait until every share submitted so far is committed; False if timeout ran out first"""
+        with self._done:
+            target = self._submitted
+            return self._done.wait_for(lambda: self._committed >= target, timeout)
+
+    def close(self, timeout=None):
+        """Commit everything queued, then stop the writer"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+            if stop:
+                return
+
+    def _commit(self, batch):
+        entries = [entry for entry, _ in batch]
+        while True:
+            started = time.perf_counter()
+            try:
+                self.store.add(entries)
+                break
+            except sqlite3.Error:
+                # Keep the batch and retry; a share that was accepted is never dropped
+                self.errors += 1
+                time.sleep(self.retry_interval)
+        finished = time.perf_counter()
+
+        with self._done:
+            for entry in entries:
+                self._pending.pop(entry["id"], None)
+            self._committed += len(entries)
+            self.batches += 1
+            self._done.notify_all()
+
+        if REGISTRY.enabled:
+            REGISTRY.observe("share_commit", finished - started)
+            for _, queued in batch:
+                REGISTRY.observe("share_queued_to_committed", finished - queued)
+            REGISTRY.set_gauge("share_queue_depth", self._queue.qsize())
+            REGISTRY.set_gauge("share_batch_size", len(entries))
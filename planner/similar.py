@@ -0,0 +1,135 @@
+"""
+Similar attendees
+MinHash signatures of shared schedules in a banded LSH index, queried for the shares closest to an attendee
+"""
+
+import threading
+import zlib
+from itertools import chain
+
+import numpy as np
+
+from planner.community_store import CommunityReader
+
+# Signature length and its split into LSH bands: with 32 bands of 2 rows, pairs at a
+# Jaccard similarity of 0.3 share a band about 95% of the time, 0.2 about 73%, 0.05 about 8%
+NUM_PERM = 64
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+# Mersenne prime for the universal hashes (a*x + b) mod p; every term stays below 2^31, so products fit in uint64
+HASH_PRIME = (1 << 31) - 1
+
+# Candidates ranked exactly per requested result, by how many bands they collided in
+CANDIDATES_PER_RESULT = 20
+
+# Postings read from any one bucket per query, newest first, so a query reads at most
+# BANDS * MAX_BUCKET_POSTINGS however large the store grows. Sized for a recall@5 of at
+# least 0.8 against the exact top 5 in `python -m bench` (0.87 at 10k shares, 0.83 at 50k)
+MAX_BUCKET_POSTINGS = 1000
+
+
+def schedule_features(itinerary, interests):
+    """Set of features of a shared-schedule dict ({day: [{"title": ...}]}) and interests"""
+    features = {f"s:{s['title'].strip().lower()}" for sessions in itinerary.values() for s in sessions}
+    features.update(f"i:{interest.strip().lower()}" for interest in interests)
+    return frozenset(features)
+
+
+def entry_features(entry):
+    """Features of a stored community share"""
+    return schedule_features(entry.get("itinerary", {}), entry.get("interests", []))
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """Fixed-seed MinHash over string features, NUM_PERM hash functions evaluated at once"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, HASH_PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, HASH_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, features):
+        """Minimum of every hash function over the features, as a uint32 array"""
+        if not features:
+            return np.full(len(self.a), HASH_PRIME, dtype=np.uint32)
+        # crc32 rather than hash(): stable across processes, so replicas agree
+        values = np.fromiter((zlib.crc32(f.encode()) for f in features), dtype=np.uint64, count=len(features))
+        hashed = (values[:, None] % HASH_PRIME * self.a + self.b) % HASH_PRIME
+        return hashed.min(axis=0).astype(np.uint32)
+
+
+class SimilarityIndex(CommunityReader):
+    """
+    Banded LSH over MinHash signatures of community shares
+
+    Each signature is cut into BANDS bands of ROWS values and every band keyed into a
+    bucket, so a query only looks at shares sharing at least one bucket with it, and at
+    most MAX_BUCKET_POSTINGS of them per bucket. Those candidates are ordered by how
+    many bands they share (an estimate of similarity), and only the best few are scored
+    by exact Jaccard. Shares are added one at a time as they come in; ids already
+    indexed are skipped.
+    """
+
+    def __init__(self, hasher=None):
+        self.hasher = hasher or MinHasher()
+        self.ids = []
+        self.entries = []
+        self.features = []
+        self._positions = {}
+        self._buckets = [{} for _ in range(BANDS)]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, share_id):
+        return share_id in self._positions
+
+    def _bands(self, signature):
+        return [signature[i * ROWS:(i + 1) * ROWS].tobytes() for i in range(BANDS)]
+
+    def add(self, entry):
+        """Index one share; returns False if its id was already indexed"""
+        if entry["id"] in self._positions:
+            return False
+        features = entry_features(entry)
+        bands = self._bands(self.hasher.signature(features))
+        with self._lock:
+            if entry["id"] in self._positions:
+                return False
+            position = self._positions[entry["id"]] = len(self.ids)
+            self.ids.append(entry["id"])
+            self.entries.append(entry)
+            self.features.append(features)
+            for buckets, key in zip(self._buckets, bands):
+                buckets.setdefault(key, []).append(position)
+        return True
+
+    def query(self, features, k=5, exclude=()):
+        """Up to k (similarity, entry) pairs most similar to features, best first"""
+        bands = self._bands(self.hasher.signature(features))
+        with self._lock:
+            hits = [buckets[key][-MAX_BUCKET_POSTINGS:] for buckets, key in zip(self._buckets, bands) if key in buckets]
+            if not hits:
+                return []
+            postings = np.fromiter(chain.from_iterable(hits), dtype=np.int64, count=sum(map(len, hits)))
+            candidates, collisions = np.unique(postings, return_counts=True)
+            excluded = [self._positions[share_id] for share_id in exclude if share_id in self._positions]
+            if excluded:
+                keep = ~np.isin(candidates, excluded)
+                candidates, collisions = candidates[keep], collisions[keep]
+
+            limit = k * CANDIDATES_PER_RESULT
+            if len(candidates) > limit:
+                candidates = candidates[np.argpartition(-collisions, limit - 1)[:limit]]
+            scored = [(jaccard(features, self.features[i]), self.ids[i], i) for i in candidates]
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(score, self.entries[i]) for score, _, i in scored[:k] if score > 0]
@@ -0,0 +1,161 @@
+"""
+Binary event snapshot
+The parsed, compiled and indexed event data in one memory-mappable file, so new processes skip JSON and compilation
+
+    python -m planner.snapshot event_data.json
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import time
+
+from planner.model import compile_event
+from planner.profiles import interest_keywords
+from planner.search import SessionSearch
+
+# Bump whenever a pickled class changes shape, so older files read as stale
+SNAPSHOT_FORMAT = 1
+MAGIC = b"PLNRSNAP"
+# magic, format, key, body length, buffer count
+HEADER = struct.Struct("<8sI32sQQ")
+# offset, length of one out-of-band buffer
+BUFFER_ENTRY = struct.Struct("<QQ")
+# Buffers start on cache-line boundaries so the arrays mapped over them are aligned
+ALIGNMENT = 64
+
+# What a snapshot from an older build or a different layout can fail with while loading
+STALE_ERRORS = (OSError, ValueError, EOFError, struct.error, pickle.UnpicklingError, AttributeError, ImportError)
+
+
+def fingerprint(value):
+    """Short content hash of a JSON value"""
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def snapshot_path(data_path):
+    """Where the snapshot of an event data file lives"""
+    return os.path.splitext(data_path)[0] + ".snapshot"
+
+
+def snapshot_key(version, interests=()):
+    """Key of a snapshot: the source file's sha256 plus the interests its affinity table was built with"""
+    payload = "\n".join([str(SNAPSHOT_FORMAT), version, *interests])
+    return hashlib.sha256(payload.encode()).digest()
+
+
+def build_payload(data, interests=(), catalog=None, sections=None):
+    """Everything a snapshot stores for a parsed event data document, reusing what is already compiled"""
+    if catalog is None:
+        catalog = compile_event(data, interests=interests)
+    if sections is None:
+        sections = {key: fingerprint(value) for key, value in data.items()}
+    return {"data": data, "catalog": catalog, "sections": sections, "search": SessionSearch(catalog)}
+
+
+def write_snapshot(path, key, payload):
+    """
+    Write payload under key, atomically
+
+    The pickle body keeps NumPy arrays out of band (protocol 5); they follow it as raw,
+    aligned buffers that read_snapshot maps straight back into arrays without copying.
+    """
+    buffers = []
+    body = pickle.dumps(payload, protocol=5, buffer_callback=buffers.append)
+    views = [buffer.raw() for buffer in buffers]
+
+    position = HEADER.size + BUFFER_ENTRY.size * len(views) + len(body)
+    table = []
+    for view in views:
+        position += -position % ALIGNMENT
+        table.append((position, view.nbytes))
+        position += view.nbytes
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, SNAPSHOT_FORMAT, key, len(body), len(views)))
+        for offset, length in table:
+            f.write(BUFFER_ENTRY.pack(offset, length))
+        f.write(body)
+        for (offset, _), view in zip(table, views):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(view)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path, key):
+    """
+    The payload stored under key at path, or None if the file is missing, stale or unreadable
+
+    The key only tells a current snapshot from a stale one; it is not a signature. The body
+    is unpickled, so whoever can write the file can run code in the app: keep it in a
+    directory only the deploy can write, like event_data.json and the code itself.
+    """
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, stored_key, body_length, count = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != SNAPSHOT_FORMAT or stored_key != key:
+            return None
+        table = [BUFFER_ENTRY.unpack_from(mapped, HEADER.size + BUFFER_ENTRY.size * i) for i in range(count)]
+        start = HEADER.size + BUFFER_ENTRY.size * count
+        view = memoryview(mapped)
+        buffers = [view[offset:offset + length] for offset, length in table]
+
+        # Unpickling creates every record at once; collecting mid-way only re-scans them
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            return pickle.loads(view[start:start + body_length], buffers=buffers)
+        finally:
+            if collecting:
+                gc.enable()
+    except STALE_ERRORS:
+        return None
+
+
+def save_snapshot(path, key, payload):
+    """write_snapshot, except that a read-only deployment keeps serving and just compiles on every start"""
+    try:
+        write_snapshot(path, key, payload)
+    except OSError:
+        pass
+
+
+def load_or_build(raw, version, interests, path):
+    """Payload for raw event data: from the snapshot at path if fresh, else compiled and written there"""
+    key = snapshot_key(version, interests)
+    payload = read_snapshot(path, key)
+    if payload is None:
+        payload = build_payload(json.loads(raw), interests)
+        save_snapshot(path, key, payload)
+    return payload
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the binary snapshot of an event data file")
+    parser.add_argument("input", help="event_data.json to snapshot")
+    parser.add_argument("-o", "--output", help="snapshot file (default: next to the input)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    with open(args.input, "rb") as f:
+        raw = f.read()
+    interests = interest_keywords()
+    output = args.output or snapshot_path(args.input)
+    key = snapshot_key(hashlib.sha256(raw).hexdigest(), interests)
+    write_snapshot(output, key, build_payload(json.loads(raw), interests))
+    print(f"Wrote {output} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
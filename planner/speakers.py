@@ -0,0 +1,68 @@
+"""
+Speaker directory
+Prefix search over speaker names and companies, a topic facet, and paging, built once at load
+"""
+
+from bisect import bisect_left
+
+from planner.search import tokenize
+
+
+class SpeakerDirectory:
+    """
+    Searchable, pageable speaker list
+
+    Every (token, speaker id) pair from names and companies sits in one sorted list, so
+    the speakers with a token starting with a prefix are a contiguous slice found by
+    bisection. Query words must all match (as prefixes); topic facets match any.
+    """
+
+    def __init__(self, speakers):
+        self.speakers = list(speakers)
+
+        entries = set()
+        facets = {}
+        for i, speaker in enumerate(self.speakers):
+            for token in tokenize(f"{speaker.get('name', '')} {speaker.get('company', '')}"):
+                entries.add((token, i))
+            for topic in speaker.get("topics", []):
+                facets.setdefault(topic, []).append(i)
+
+        entries = sorted(entries)
+        self._tokens = [token for token, _ in entries]
+        self._ids = [i for _, i in entries]
+        self.facets = {topic: frozenset(ids) for topic, ids in facets.items()}
+
+    def __len__(self):
+        return len(self.speakers)
+
+    def topics(self):
+        """Facet topics, most speakers first"""
+        return sorted(self.facets, key=lambda topic: (-len(self.facets[topic]), topic))
+
+    def _prefixed(self, prefix):
+        lo = bisect_left(self._tokens, prefix)
+        hi = bisect_left(self._tokens, prefix + "\U0010ffff", lo)
+        return set(self._ids[lo:hi])
+
+    def search(self, query="", topics=()):
+        """Ids of speakers matching every query word and any of the topics, in directory order"""
+        ids = None
+        for word in tokenize(query):
+            matched = self._prefixed(word)
+            ids = matched if ids is None else ids & matched
+            if not ids:
+                return []
+
+        if topics:
+            faceted = set().union(*(self.facets.get(topic, ()) for topic in topics))
+            ids = faceted if ids is None else ids & faceted
+
+        if ids is None:
+            return list(range(len(self.speakers)))
+        return sorted(ids)
+
+    def page(self, ids, number, size):
+        """Speaker records on 1-based page `number` of ids"""
+        start = (number - 1) * size
+        return [self.speakers[i] for i in ids[start:start + size]]
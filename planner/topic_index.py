@@ -0,0 +1,51 @@
+"""
+Topic retrieval structures
+An inverted index from topic to sessions and a precomputed interest -> topic affinity table
+"""
+
+import numpy as np
+
+
+class InterestAffinity:
+    """
+    Which topics an interest matches under the `interest in topic or topic in interest` rule
+
+    Known interests are resolved when the table is built; anything else is resolved on
+    first use and remembered.
+    """
+
+    def __init__(self, topics, interests=()):
+        self.topics = sorted(set(topics))
+        self._table = {}
+        for interest in set(interests) | set(self.topics):
+            self.topics_for(interest)
+
+    def topics_for(self, interest):
+        """Topics related to an interest"""
+        related = self._table.get(interest)
+        if related is None:
+            related = tuple(t for t in self.topics if interest in t or t in interest)
+            self._table[interest] = related
+        return related
+
+    def __getstate__(self):
+        # Copied up front: request threads may add entries while a snapshot is being written
+        return {"topics": self.topics, "_table": dict(self._table)}
+
+
+class TopicIndex:
+    """Inverted index from topic to the local ids of the sessions tagged with it"""
+
+    def __init__(self, sessions):
+        postings = {}
+        for i, session in enumerate(sessions):
+            for topic in session.topics:
+                postings.setdefault(topic, []).append(i)
+        self.postings = {topic: np.array(ids, dtype=np.int64) for topic, ids in postings.items()}
+
+    def matching(self, topics):
+        """Sorted ids of sessions tagged with any of the given topics"""
+        lists = [self.postings[t] for t in topics if t in self.postings]
+        if not lists:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(lists))
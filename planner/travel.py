@@ -0,0 +1,80 @@
+"""
+Venue travel times
+All-pairs shortest travel minutes over the event's venue graph, computed once per data load
+"""
+
+import weakref
+
+import numpy as np
+
+# Minutes from a building's entrance to one of its halls when the venue does not say
+DEFAULT_WALK_MINUTES = 5
+
+
+class TravelTimes:
+    """
+    Shortest travel minutes between every pair of venues
+
+    The graph has a node per hall and per building. A hall is joined to its building by
+    its walk_minutes, and buildings to each other by the event's venue_links; one
+    Floyd-Warshall pass over the whole graph fills the matrix. The extra last node
+    stands for an unknown venue and is zero minutes from everywhere, so sessions that
+    name no venue, or one missing from the graph, are never held apart by travel.
+    Venues the links leave unconnected are an infinite trip apart.
+    """
+
+    def __init__(self, venues=None, links=()):
+        self.index = {}
+        edges = []
+        for name, venue in (venues or {}).items():
+            self._node(name)
+            building = venue.get("building", name)
+            if building != name:
+                edges.append((name, building, venue.get("walk_minutes", DEFAULT_WALK_MINUTES)))
+        for link in links:
+            edges.append((link["from"], link["to"], link["minutes"]))
+        for a, b, _ in edges:
+            self._node(a)
+            self._node(b)
+
+        size = len(self.index)
+        minutes = np.full((size + 1, size + 1), np.inf)
+        np.fill_diagonal(minutes, 0.0)
+        for a, b, trip in edges:
+            i, j = self.index[a], self.index[b]
+            minutes[i, j] = minutes[j, i] = min(minutes[i, j], float(trip))
+        for k in range(size):
+            np.minimum(minutes, minutes[:, k, None] + minutes[None, k, :], out=minutes)
+
+        self.unknown = size
+        minutes[size, :] = 0.0
+        minutes[:, size] = 0.0
+        self.minutes = minutes
+        # Held weakly, so evicted shard days are not kept alive by their nodes
+        self._day_nodes = weakref.WeakKeyDictionary()
+
+    def _node(self, name):
+        return self.index.setdefault(name, len(self.index))
+
+    def __len__(self):
+        return len(self.index)
+
+    def between(self, a, b):
+        """Minutes from venue a to venue b; 0 if either is unknown"""
+        return float(self.minutes[self.index.get(a, self.unknown), self.index.get(b, self.unknown)])
+
+    def nodes(self, sessions):
+        """Node of each session's venue, the unknown node where it has none"""
+        return np.array([self.index.get(s.venue, self.unknown) for s in sessions], dtype=np.int64)
+
+    def day_nodes(self, day):
+        """Nodes of a compiled day's sessions, looked up once per day object"""
+        nodes = self._day_nodes.get(day)
+        if nodes is None:
+            nodes = self._day_nodes[day] = self.nodes(day.sessions)
+        return nodes
+
+
+def travel_times(event_data):
+    """TravelTimes from the venues and venue_links sections of event data"""
+    return TravelTimes(event_data.get("venues", {}), event_data.get("venue_links", []))
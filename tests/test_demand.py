@@ -0,0 +1,23 @@
+"""
+Session demand
+Visitor numbers from the whole document and from its shard split
+"""
+
+import json
+
+from planner.batch import DEFAULT_DATA_PATH
+from planner.demand import venue_capacities, visitors_per_day
+from planner.model import compile_event
+from planner.shards import ShardedCatalog, split_event
+
+
+def test_visitors_per_day_from_shards_matches_document(tmp_path):
+    with open(DEFAULT_DATA_PATH, "r") as f:
+        data = json.load(f)
+    split_event(data, str(tmp_path))
+    sharded = ShardedCatalog(str(tmp_path))
+
+    expected = visitors_per_day(data, len(compile_event(data).days))
+    assert expected > 0
+    assert visitors_per_day(sharded.data, len(sharded.days)) == expected
+    assert venue_capacities(sharded.data) == venue_capacities(data)
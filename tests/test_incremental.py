@@ -0,0 +1,47 @@
+"""
+Incremental re-scoring
+IncrementalScorer picks against generate_itinerary after a run of profile edits
+"""
+
+import random
+
+import pytest
+
+import planner.incremental
+import planner.itinerary
+from bench.synth import edit_profile, generate_event_data, generate_profiles, topic_vocabulary
+from planner.incremental import IncrementalScorer
+from planner.itinerary import generate_itinerary
+from planner.model import compile_event
+from planner.travel import travel_times
+
+
+@pytest.fixture(scope="module")
+def event():
+    data = generate_event_data(sessions=600, speakers=200, exhibitors=5, seed=6)
+    return compile_event(data), travel_times(data)
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+@pytest.mark.parametrize("routed", [False, True])
+def test_edits_pick_like_generate_itinerary(event, monkeypatch, pooled, routed):
+    catalog, travel = event
+    travel = travel if routed else None
+    if pooled:
+        # Every day of 120 sessions goes through the retrieval pool
+        monkeypatch.setattr(planner.itinerary, "RETRIEVAL_MIN_SESSIONS", 50)
+        monkeypatch.setattr(planner.incremental, "RETRIEVAL_MIN_SESSIONS", 50)
+        monkeypatch.setattr(planner.itinerary, "RETRIEVAL_POOL", 20)
+        monkeypatch.setattr(planner.incremental, "RETRIEVAL_POOL", 20)
+
+    rng = random.Random(8)
+    vocabulary = topic_vocabulary()
+    for profile in generate_profiles(6, topics=vocabulary, seed=9):
+        scorer = IncrementalScorer(catalog, max_per_day=4, min_break=10, travel=travel)
+        for _ in range(25):
+            profile = edit_profile(profile, rng, vocabulary)
+            if rng.random() < 0.2:
+                profile["days"] = sorted(rng.sample(list(catalog.days), rng.randint(1, 3)))
+            got = scorer.update(profile)
+            expected = generate_itinerary(catalog, profile, max_per_day=4, min_break=10, travel=travel)
+            assert got.days == expected.days
@@ -0,0 +1,55 @@
+"""
+Stage timing instrumentation
+Fragments open their own rerun only when they run outside a full script run
+"""
+
+import pytest
+
+from planner.metrics import MetricsRegistry
+
+
+def test_fragment_rerun_is_recorded_under_its_own_stage():
+    metrics = MetricsRegistry(enabled=True)
+    view = metrics.fragment("render_view")(lambda: "done")
+
+    assert view() == "done"
+    stats = metrics.snapshot()
+    assert "rerun" not in stats
+    assert stats["fragment_rerun/render_view"]["count"] == 1
+    assert stats["render_view"]["count"] == 1
+    assert metrics.current_rerun() == {}
+
+
+def test_fragment_inside_full_rerun_joins_it():
+    metrics = MetricsRegistry(enabled=True)
+    view = metrics.fragment("render_view")(lambda: None)
+
+    metrics.start_rerun()
+    view()
+    assert metrics.current_rerun()["render_view"][0] == 1
+    assert "rerun" not in metrics.snapshot()
+    assert metrics.finish_rerun()["render_view"][0] == 1
+    assert metrics.snapshot()["rerun"]["count"] == 1
+    assert "fragment_rerun/render_view" not in metrics.snapshot()
+
+
+def test_fragment_rerun_closes_when_it_raises():
+    metrics = MetricsRegistry(enabled=True)
+
+    @metrics.fragment("watch")
+    def watch():
+        raise RuntimeError("rerun requested")
+
+    with pytest.raises(RuntimeError):
+        watch()
+    assert metrics.snapshot()["fragment_rerun/watch"]["count"] == 1
+    assert metrics.snapshot()["watch"]["count"] == 1
+    metrics.fragment("render_view")(lambda: None)()
+    assert metrics.snapshot()["fragment_rerun/render_view"]["count"] == 1
+    assert "rerun" not in metrics.snapshot()
+
+
+def test_fragment_disabled_calls_through():
+    metrics = MetricsRegistry()
+    assert metrics.fragment("render_view")(lambda: 3)() == 3
+    assert metrics.snapshot() == {}
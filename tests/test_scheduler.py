@@ -0,0 +1,112 @@
+"""
+Conflict-aware session selection
+select_sessions against an exhaustive search over every subset of a small day
+"""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from planner.scheduler import select_sessions
+
+INF = float("inf")
+
+
+def _trip(travel, nodes, a, b):
+    return travel[nodes[a], nodes[b]] if travel is not None else 0.0
+
+
+def _value(picked, intervals, scores, min_break, nodes, travel, penalty):
+    """Total score of picks taken in start order, or None if one cannot follow the previous"""
+    total = sum(scores[i] for i in picked)
+    for a, b in zip(picked, picked[1:]):
+        trip = _trip(travel, nodes, a, b)
+        if intervals[a][1] + min_break + trip > intervals[b][0]:
+            return None
+        if penalty:
+            total -= penalty * trip
+    return total
+
+
+def _brute_force(intervals, scores, max_sessions, min_break, nodes=None, travel=None, penalty=0.0):
+    candidates = [i for i, interval in enumerate(intervals) if interval is not None and scores[i] > 0]
+    best = 0.0
+    for size in range(1, min(max_sessions or len(candidates), len(candidates)) + 1):
+        for subset in itertools.combinations(candidates, size):
+            picked = sorted(subset, key=lambda i: intervals[i][0])
+            value = _value(picked, intervals, scores, min_break, nodes, travel, penalty)
+            if value is not None and value > best:
+                best = value
+    return best
+
+
+def _random_day(rng):
+    intervals = []
+    for _ in range(rng.randint(1, 9)):
+        start = rng.randrange(540, 1000, 15)
+        intervals.append((start, start + rng.choice([30, 45, 60, 90])) if rng.random() > 0.1 else None)
+    scores = [rng.choice([0.0, -1.0, rng.uniform(0.5, 10)]) for _ in intervals]
+    return intervals, scores
+
+
+def _random_travel(rng, venues):
+    """Symmetric trip minutes with zero diagonal; some venue pairs are unreachable"""
+    minutes = np.array([[rng.choice([5, 10, 20, 30, INF]) for _ in range(venues)] for _ in range(venues)])
+    minutes = np.minimum(minutes, minutes.T)
+    np.fill_diagonal(minutes, 0.0)
+    return minutes
+
+
+def _check(picked, intervals, scores, max_sessions, min_break, nodes=None, travel=None, penalty=0.0):
+    assert picked == sorted(picked, key=lambda i: intervals[i][0])
+    assert len(set(picked)) == len(picked)
+    assert max_sessions is None or len(picked) <= max_sessions
+    assert all(intervals[i] is not None and scores[i] > 0 for i in picked)
+    value = _value(picked, intervals, scores, min_break, nodes, travel, penalty)
+    assert value is not None
+    assert value == pytest.approx(_brute_force(intervals, scores, max_sessions, min_break, nodes, travel, penalty))
+
+
+@pytest.mark.parametrize("max_sessions", [None, 1, 2, 3, 20])
+def test_plain_matches_brute_force(max_sessions):
+    # None and 20 go through _best_unbounded, the small caps through _best_bounded
+    rng = random.Random(max_sessions or 0)
+    for _ in range(300):
+        intervals, scores = _random_day(rng)
+        min_break = rng.choice([0, 10, 15])
+        picked = select_sessions(intervals, scores, max_sessions, min_break)
+        _check(picked, intervals, scores, max_sessions, min_break)
+
+
+@pytest.mark.parametrize("max_sessions", [None, 1, 2, 3])
+@pytest.mark.parametrize("penalty", [0.0, 0.05, 0.5])
+def test_routed_matches_brute_force(max_sessions, penalty):
+    rng = random.Random(f"{max_sessions}-{penalty}")
+    for _ in range(200):
+        intervals, scores = _random_day(rng)
+        travel = _random_travel(rng, rng.randint(1, 4))
+        nodes = [rng.randrange(len(travel)) for _ in intervals]
+        min_break = rng.choice([0, 10])
+        picked = select_sessions(intervals, scores, max_sessions, min_break, nodes, travel, penalty)
+        _check(picked, intervals, scores, max_sessions, min_break, nodes, travel, penalty)
+
+
+def test_routed_without_travel_matches_plain():
+    rng = random.Random(7)
+    for _ in range(200):
+        intervals, scores = _random_day(rng)
+        nodes = [rng.randrange(3) for _ in intervals]
+        max_sessions = rng.choice([None, 1, 2, 3])
+        min_break = rng.choice([0, 10])
+        routed = select_sessions(intervals, scores, max_sessions, min_break, nodes, np.zeros((3, 3)), 0.05)
+        plain = select_sessions(intervals, scores, max_sessions, min_break)
+        assert sum(scores[i] for i in routed) == pytest.approx(sum(scores[i] for i in plain))
+
+
+def test_unreachable_venues_are_never_chained():
+    intervals = [(540, 600), (600, 660), (660, 720)]
+    travel = np.array([[0.0, INF], [INF, 0.0]])
+    assert select_sessions(intervals, [5, 4, 5], None, 0, [0, 1, 0], travel) == [0, 2]
+    assert select_sessions(intervals, [1, 9, 1], None, 0, [0, 1, 0], travel) == [1]
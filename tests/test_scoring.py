@@ -0,0 +1,110 @@
+"""
+Session scoring
+ScoringEngine and IncrementalScorer against calculate_session_score on a synthetic catalog
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from bench.synth import generate_event_data, generate_profiles, topic_vocabulary
+from planner.incremental import IncrementalScorer
+from planner.model import compile_event
+from planner.scoring import calculate_session_score
+
+GOALS = ["networking", "learning", "investment", "partnerships"]
+PROFICIENCIES = ["beginner", "intermediate", "advanced", "expert"]
+
+
+@pytest.fixture(scope="module")
+def event():
+    data = generate_event_data(sessions=400, speakers=200, exhibitors=5, seed=4)
+    # Repeated topics count once per occurrence in the reference
+    for day in data["daily_schedule"].values():
+        for raw in day["sessions"][::7]:
+            raw["topics"].append(raw["topics"][0])
+    return data, compile_event(data)
+
+
+def _reference(raw_sessions, profile):
+    """(scores, networking_roi, learning_value) from the per-session reference implementation"""
+    scores, networking, learning = [], [], []
+    for raw in raw_sessions:
+        session = dict(raw)
+        scores.append(calculate_session_score(session, profile))
+        networking.append(session["networking_roi"])
+        learning.append(session["learning_value"])
+    return np.array(scores), np.array(networking), np.array(learning)
+
+
+def _profiles(count, seed):
+    rng = random.Random(seed)
+    vocabulary = topic_vocabulary()
+    profiles = generate_profiles(count, topics=vocabulary, seed=seed)
+    for profile in profiles:
+        # Substrings of topics, unknown terms and repeats all take the partial-match path
+        profile["interests"] += rng.sample(["ai", "energy", "health", "quantum-foo", "x"], 2)
+        profile["interests"] += rng.sample(profile["interests"], 1)
+        profile["proficiency"] = rng.choice(PROFICIENCIES)
+        profile["goals"] = rng.sample(GOALS, rng.randint(0, len(GOALS)))
+    return profiles
+
+
+def test_engine_matches_reference(event):
+    data, catalog = event
+    for profile in _profiles(40, seed=1):
+        for date, day in catalog.days.items():
+            expected = _reference(data["daily_schedule"][date]["sessions"], profile)
+            for got, want in zip(day.engine.score(profile), expected):
+                np.testing.assert_allclose(got, want)
+
+            k = 10
+            ids, scores, networking, learning = day.engine.top_k(profile, k)
+            order = np.lexsort((np.arange(len(expected[0])), -expected[0]))[:k]
+            np.testing.assert_array_equal(ids, order)
+            np.testing.assert_allclose(scores, expected[0][order])
+            np.testing.assert_allclose(networking, expected[1][order])
+            np.testing.assert_allclose(learning, expected[2][order])
+
+
+def _edit(rng, profile, dates, vocabulary):
+    profile = dict(profile)
+    for key in ("interests", "goals", "days"):
+        profile[key] = list(profile[key])
+    change = rng.choice(["proficiency", "add_interest", "drop_interest", "goal", "day"])
+    if change == "proficiency":
+        profile["proficiency"] = rng.choice(PROFICIENCIES)
+    elif change == "add_interest":
+        profile["interests"].append(rng.choice(vocabulary + ["ai", "energy"]))
+    elif change == "drop_interest" and profile["interests"]:
+        profile["interests"].remove(rng.choice(profile["interests"]))
+    elif change == "goal":
+        goal = rng.choice(GOALS)
+        if goal in profile["goals"]:
+            profile["goals"].remove(goal)
+        else:
+            profile["goals"].append(goal)
+    elif change == "day":
+        date = rng.choice(dates)
+        profile["days"] = sorted(set(profile["days"]) ^ {date}) or [date]
+    return profile
+
+
+def test_incremental_matches_reference_after_edits(event):
+    data, catalog = event
+    rng = random.Random(2)
+    dates = list(catalog.days)
+    vocabulary = topic_vocabulary()
+    for profile in _profiles(5, seed=3):
+        scorer = IncrementalScorer(catalog)
+        for _ in range(30):
+            profile = _edit(rng, profile, dates, vocabulary)
+            itinerary = scorer.update(profile)
+            for date in profile["days"]:
+                day = catalog.days[date]
+                span = slice(day.offset, day.offset + len(day.sessions))
+                expected = _reference(data["daily_schedule"][date]["sessions"], profile)
+                np.testing.assert_allclose(itinerary.scores[span], expected[0])
+                np.testing.assert_allclose(itinerary.networking_roi[span], expected[1])
+                np.testing.assert_allclose(itinerary.learning_value[span], expected[2])
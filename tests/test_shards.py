@@ -0,0 +1,93 @@
+"""
+Sharded event data
+Re-splitting in place while catalogs loaded from the previous manifest are still in use
+"""
+
+import copy
+import os
+import random
+import sys
+import threading
+
+from bench.synth import generate_event_data
+from planner.itinerary import generate_itinerary
+from planner.model import compile_event
+from planner.shards import SHARD_DIR, ShardedCatalog, split_event
+
+
+def _retitle(data, date, title):
+    data = copy.deepcopy(data)
+    data["daily_schedule"][date]["sessions"][0]["title"] = title
+    return data
+
+
+def _shard_files(manifest):
+    return {os.path.basename(entry["file"]) for entry in manifest["days"]}
+
+
+def test_resplit_keeps_shards_of_loaded_catalog(tmp_path):
+    data = generate_event_data(sessions=120, speakers=50, exhibitors=5, seed=1)
+    dates = list(data["daily_schedule"])
+    split_event(data, str(tmp_path))
+    catalog = ShardedCatalog(str(tmp_path))
+
+    # The day was never compiled, so the old catalog has to read it from its old shard
+    changed = _retitle(data, dates[-1], "Retitled")
+    split_event(changed, str(tmp_path))
+    profile = {"days": [dates[-1]], "interests": ["ai", "energy"]}
+    itinerary = generate_itinerary(catalog, profile, 5)
+    expected = generate_itinerary(compile_event(data), profile, 5)
+    assert itinerary.days == expected.days
+    assert catalog.days[dates[-1]].sessions[0].title == data["daily_schedule"][dates[-1]]["sessions"][0]["title"]
+
+    reloaded = ShardedCatalog(str(tmp_path))
+    assert reloaded.days[dates[-1]].sessions[0].title == "Retitled"
+    assert generate_itinerary(reloaded, profile, 5).days == generate_itinerary(compile_event(changed), profile, 5).days
+
+
+def test_resplit_removes_shards_two_splits_old(tmp_path):
+    data = generate_event_data(sessions=60, speakers=50, exhibitors=5, seed=2)
+    date = list(data["daily_schedule"])[0]
+    first = split_event(data, str(tmp_path))
+    second = split_event(_retitle(data, date, "Second"), str(tmp_path))
+    third = split_event(_retitle(data, date, "Third"), str(tmp_path))
+
+    files = set(os.listdir(os.path.join(str(tmp_path), SHARD_DIR)))
+    assert files == _shard_files(second) | _shard_files(third)
+    assert _shard_files(first) - files
+
+
+def test_catalog_carries_over_days_while_previous_is_in_use(tmp_path):
+    data = generate_event_data(sessions=60, speakers=50, exhibitors=5, seed=3)
+    day = next(iter(data["daily_schedule"].values()))
+    data["daily_schedule"] = {f"2026-03-{i:02d}": copy.deepcopy(day) for i in range(1, 29)}
+    dates = list(data["daily_schedule"])
+    split_event(data, str(tmp_path))
+    # Room for most days, so browsing keeps loading, reordering and evicting them
+    previous = ShardedCatalog(str(tmp_path), max_resident_sessions=20 * len(day["sessions"]))
+    stop = threading.Event()
+    errors = []
+
+    def browse(seed):
+        rng = random.Random(seed)
+        try:
+            while not stop.is_set():
+                previous.days[rng.choice(dates)]
+        except Exception as error:
+            errors.append(error)
+
+    # Threads switch as often as possible, so the browsers run in the middle of the carry-over
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [threading.Thread(target=browse, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(300):
+            ShardedCatalog(str(tmp_path), manifest=previous.manifest, previous=previous)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(interval)
+    assert not errors